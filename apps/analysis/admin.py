@@ -1 +1,7 @@
+from django.contrib import admin
+
+from .models import ReportGenerationChunk, ReportGenerationRun
+
 # Register your models here.
+admin.site.register(ReportGenerationRun)
+admin.site.register(ReportGenerationChunk)
@@ -0,0 +1,132 @@
+"""
+감정 분석 모델의 CPU 추론 백엔드.
+
+- torch: transformers 파이프라인을 fp32로 실행합니다. (기본값)
+- torch-int8: Linear 레이어를 동적 int8 양자화하여 메모리와 지연 시간을 줄입니다. (재학습 불필요)
+- onnx: `export_sentiment_model`로 내보낸 ONNX 모델을 onnxruntime으로 실행합니다. (선택 의존성)
+
+모든 백엔드는 `classifier(texts, batch_size=..., truncation=True)` 형태로 호출되며
+파이프라인과 같은 `[{"label": ..., "score": ...}, ...]` 형식으로 결과를 반환합니다.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+from django.core.exceptions import ImproperlyConfigured
+
+BACKEND_TORCH = "torch"
+BACKEND_TORCH_INT8 = "torch-int8"
+BACKEND_ONNX = "onnx"
+BACKENDS = (BACKEND_TORCH, BACKEND_TORCH_INT8, BACKEND_ONNX)
+
+ONNX_MODEL_FILENAME = "model.onnx"
+
+
+class TorchSentimentClassifier:
+    """transformers 파이프라인을 `torch.inference_mode()` 안에서 실행하는 분류기입니다."""
+
+    def __init__(self, model_name: str, revision: str, quantize: bool = False):
+        import torch
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
+
+        tokenizer = AutoTokenizer.from_pretrained(model_name, revision=revision)
+        # safetensors 가중치가 있으면 mmap으로 읽어 프로세스 간 페이지 캐시를 공유합니다.
+        model = AutoModelForSequenceClassification.from_pretrained(model_name, revision=revision)
+        model.eval()
+        # 추론 전용이므로 gradient 버퍼가 생기지 않도록 가중치를 고정합니다.
+        for param in model.parameters():
+            param.requires_grad_(False)
+        if quantize:
+            model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        self._torch = torch
+        self.pipeline = pipeline("sentiment-analysis", model=model, tokenizer=tokenizer, device=torch.device("cpu"))
+
+    def __call__(self, texts: List[str], **kwargs) -> List[Dict[str, Any]]:
+        with self._torch.inference_mode():
+            return self.pipeline(texts, **kwargs)
+
+
+class OnnxSentimentClassifier:
+    """`export_onnx`로 내보낸 모델 디렉터리를 onnxruntime으로 실행하는 분류기입니다."""
+
+    def __init__(self, model_dir: str, num_threads: int | None = None):
+        try:
+            import onnxruntime
+        except ImportError as e:
+            raise ImproperlyConfigured("The 'onnx' inference backend requires the onnxruntime package.") from e
+
+        model_path = Path(model_dir) / ONNX_MODEL_FILENAME
+        if not model_path.exists():
+            raise ImproperlyConfigured(
+                f"ONNX model not found at {model_path}. Run 'manage.py export_sentiment_model' first."
+            )
+        from transformers import AutoConfig, AutoTokenizer
+
+        options = onnxruntime.SessionOptions()
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.session = onnxruntime.InferenceSession(
+            str(model_path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.id2label = AutoConfig.from_pretrained(model_dir).id2label
+
+    def __call__(self, texts: List[str], truncation: bool = True, **kwargs) -> List[Dict[str, Any]]:
+        import numpy as np
+
+        encoded = self.tokenizer(texts, padding=True, truncation=truncation, return_tensors="np")
+        inputs = {name: value.astype(np.int64) for name, value in encoded.items() if name in self.input_names}
+        logits = self.session.run(None, inputs)[0]
+        logits = logits - logits.max(axis=-1, keepdims=True)
+        probs = np.exp(logits) / np.exp(logits).sum(axis=-1, keepdims=True)
+        return [{"label": self.id2label[int(row.argmax())], "score": float(row.max())} for row in probs]
+
+
+def export_onnx(model_name: str, revision: str, output_dir: str, opset: int = 17) -> Path:
+    """모델을 동적 배치/시퀀스 길이를 지원하는 ONNX 형식으로 내보내고, 토크나이저와 설정도 함께 저장합니다."""
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(model_name, revision=revision)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name, revision=revision)
+    model.eval()
+
+    sample = tokenizer(["ONNX 내보내기 예시 문장"], return_tensors="pt")
+    input_names = list(sample.keys())
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+    with torch.inference_mode():
+        torch.onnx.export(
+            model,
+            (),
+            str(output_path / ONNX_MODEL_FILENAME),
+            kwargs=dict(sample),
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            dynamo=False,
+        )
+    tokenizer.save_pretrained(output_path)
+    model.config.save_pretrained(output_path)
+    return output_path / ONNX_MODEL_FILENAME
+
+
+def load_classifier(
+    backend: str, model_name: str, revision: str, onnx_model_dir: str | None = None, num_threads: int | None = None
+):
+    """설정된 백엔드에 맞는 분류기를 생성합니다."""
+    if num_threads:
+        import torch
+
+        torch.set_num_threads(num_threads)
+    if backend == BACKEND_TORCH:
+        return TorchSentimentClassifier(model_name, revision)
+    if backend == BACKEND_TORCH_INT8:
+        return TorchSentimentClassifier(model_name, revision, quantize=True)
+    if backend == BACKEND_ONNX:
+        return OnnxSentimentClassifier(onnx_model_dir, num_threads=num_threads)
+    raise ImproperlyConfigured(f"Unknown sentiment inference backend: {backend!r}. Choose one of {BACKENDS}.")
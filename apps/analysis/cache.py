@@ -0,0 +1,142 @@
+import hashlib
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .registry import sentiment_model
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키 생성을 위해 텍스트를 정규화합니다. (유니코드 NFKC 정규화, 앞뒤 공백 제거, 연속 공백 축약)"""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+class LocalLRUCache:
+    """TTL과 최대 크기를 가진 스레드 안전한 프로세스 내부 LRU 캐시입니다."""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SentimentResultCache:
+    """
+    (모델 버전, 정규화된 텍스트) -> (라벨, 점수)를 저장하는 2단계 캐시입니다.
+
+    1단계는 프로세스 내부 LRU, 2단계는 Django 캐시(운영 환경에서는 Redis)이며,
+    모델 버전이 키에 포함되므로 모델이 바뀌면 이전 결과는 자연스럽게 무효화됩니다.
+    """
+
+    def __init__(self, options: Dict[str, Any]):
+        self.enabled = options.get("ENABLED", True)
+        self.shared_alias = options.get("SHARED_ALIAS", "default")
+        self.shared_ttl = options.get("SHARED_TTL", 24 * 60 * 60)
+        self.local = LocalLRUCache(options.get("LOCAL_MAX_SIZE", 10000), options.get("LOCAL_TTL", 10 * 60))
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def shared(self):
+        return caches[self.shared_alias]
+
+    def make_key(self, text: str) -> str:
+        digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+        return f"sentiment:{sentiment_model.version}:{digest}"
+
+    def get(self, text: str) -> Optional[Dict[str, Any]]:
+        """캐시된 결과를 반환합니다. 없으면 None을 반환합니다."""
+        return self.get_many([text]).get(text)
+
+    def get_many(self, texts: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 텍스트의 캐시된 결과를 {텍스트: 결과} 형태로 반환합니다. (공유 캐시는 한 번에 조회)"""
+        if not self.enabled:
+            return {}
+        found: Dict[str, Dict[str, Any]] = {}
+        missing: Dict[str, list[str]] = {}
+        local_hits = 0
+        for text in set(texts):
+            key = self.make_key(text)
+            value = self.local.get(key)
+            if value is not None:
+                found[text] = value
+                local_hits += 1
+            else:
+                missing.setdefault(key, []).append(text)
+
+        shared_hits = 0
+        if missing:
+            for key, value in self.shared.get_many(list(missing)).items():
+                self.local.set(key, value)
+                for text in missing.pop(key):
+                    found[text] = value
+                    shared_hits += 1
+
+        with self._stats_lock:
+            self.stats["local_hits"] += local_hits
+            self.stats["shared_hits"] += shared_hits
+            self.stats["misses"] += sum(len(texts) for texts in missing.values())
+        return found
+
+    def set(self, text: str, result: Dict[str, Any]) -> None:
+        self.set_many({text: result})
+
+    def set_many(self, results: Dict[str, Dict[str, Any]]) -> None:
+        if not self.enabled or not results:
+            return
+        values = {}
+        for text, result in results.items():
+            key = self.make_key(text)
+            value = {"label": result["label"], "score": result["score"]}
+            self.local.set(key, value)
+            values[key] = value
+        self.shared.set_many(values, timeout=self.shared_ttl)
+
+    def clear_local(self) -> None:
+        self.local.clear()
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self.stats = {"local_hits": 0, "shared_hits": 0, "misses": 0}
+
+    def hit_rate(self) -> float:
+        hits = self.stats["local_hits"] + self.stats["shared_hits"]
+        total = hits + self.stats["misses"]
+        return hits / total if total else 0.0
+
+
+sentiment_cache = SentimentResultCache(settings.SENTIMENT_CACHE)
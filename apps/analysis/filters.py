@@ -1,6 +1,8 @@
 import django_filters
 from django import forms
 
+from apps.transaction_history.search import SearchFilter
+
 from .models import SentimentAnalysis  # 주석 해제
 
 SENTIMENT_CHOICES = (
@@ -10,8 +12,7 @@ SENTIMENT_CHOICES = (
 
 
 class AnalysisFilter(django_filters.FilterSet):  # 주석 해제
-    text_content = django_filters.CharFilter(
-        lookup_expr="icontains",
+    text_content = SearchFilter(
         label="리뷰 내용",
         widget=forms.TextInput(attrs={"class": "form-control", "placeholder": "내용, 메모 등"}),
     )
@@ -0,0 +1,119 @@
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+from django.conf import settings
+
+from .registry import sentiment_model
+
+logger = logging.getLogger(__name__)
+
+# 모델 라벨('LABEL_1' 또는 'LABEL_0')을 한국어 감정 라벨로 변환하기 위한 매핑
+SENTIMENT_LABELS = {
+    "LABEL_1": "긍정",
+    "LABEL_0": "부정",
+}
+FALLBACK_SENTIMENT = "중립"
+
+PredictBatch = Callable[[List[str]], List[Dict[str, Any]]]
+
+
+def translate_label(model_label: str) -> str:
+    """모델이 반환한 라벨을 한국어 감정 라벨로 변환합니다. 예상치 못한 라벨은 '중립'으로 처리합니다."""
+    return SENTIMENT_LABELS.get(model_label, FALLBACK_SENTIMENT)
+
+
+class BatchedInferenceEngine:
+    """
+    프로세스 내부에서 동작하는 마이크로 배치 추론 엔진입니다.
+
+    여러 스레드에서 들어온 요청을 큐에 모은 뒤, 워커 스레드가 `max_batch_size`개가 모이거나
+    첫 요청 이후 `max_wait_ms`가 지나면 한 번의 배치 forward pass로 처리하고
+    각 호출자에게 결과를 돌려줍니다.
+    """
+
+    def __init__(self, predict_batch: PredictBatch, max_batch_size: int = 32, max_wait_ms: float = 10.0):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: "queue.Queue[tuple[str, Future]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    def submit(self, text: str) -> Future:
+        """텍스트를 큐에 넣고, 배치 처리 후 결과가 채워질 Future를 반환합니다."""
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def predict(self, text: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """텍스트 하나를 배치 큐를 통해 분류하고 결과가 나올 때까지 기다립니다."""
+        return self.submit(text).result(timeout=timeout)
+
+    def _ensure_worker(self) -> None:
+        # gunicorn 등에서 fork된 자식 프로세스에는 부모의 스레드가 복제되지 않으므로 PID 기준으로 다시 시작합니다.
+        if self._worker is not None and self._worker.is_alive() and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive() and self._pid == os.getpid():
+                return
+            if self._pid != os.getpid():
+                self._queue = queue.Queue()
+            self._pid = os.getpid()
+            self._worker = threading.Thread(target=self._run, name="sentiment-batch-worker", daemon=True)
+            self._worker.start()
+
+    def _collect_batch(self) -> List[tuple[str, Future]]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect_batch()
+            # 호출자가 이미 취소한 요청은 모델에 넣지 않습니다.
+            batch = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            texts = [text for text, _future in batch]
+            try:
+                results = self.predict_batch(texts)
+                if len(results) != len(texts):
+                    raise RuntimeError(f"Model returned {len(results)} results for a batch of {len(texts)} texts.")
+            except Exception as e:
+                logger.error("Batched sentiment inference failed (batch size: %s): %s", len(texts), e)
+                for _text, future in batch:
+                    future.set_exception(e)
+                continue
+            for (_text, future), result in zip(batch, results):
+                future.set_result(result)
+
+
+def classify_batch(texts: List[str]) -> List[Dict[str, Any]]:
+    """레지스트리의 파이프라인으로 텍스트 목록을 한 번의 배치 forward pass로 분류합니다."""
+    # 파이프라인에 리스트를 넘기면 배치 단위로 패딩하여 처리합니다.
+    return sentiment_model.get_classifier()(texts, batch_size=len(texts), truncation=True)
+
+
+# 동시에 들어온 요청들을 모아 배치로 추론하는 엔진 (워커 스레드와 모델은 첫 요청 시 준비됩니다)
+inference_engine = BatchedInferenceEngine(
+    classify_batch,
+    max_batch_size=settings.SENTIMENT_INFERENCE_BATCH_SIZE,
+    max_wait_ms=settings.SENTIMENT_INFERENCE_MAX_WAIT_MS,
+)
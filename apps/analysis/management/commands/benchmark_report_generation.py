@@ -0,0 +1,111 @@
+import random
+import time
+import uuid
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from apps.accounts.models import Account
+from apps.analysis.tasks import generate_spending_report, generate_spending_reports_bulk
+from apps.transaction_history.choices import TransactionCategory
+from apps.transaction_history.models import TransactionHistory
+from apps.transaction_history.rollups import rebuild_rollups
+from apps.users.models import CustomUser
+
+WITHDRAW_CATEGORIES = [choice for choice in TransactionCategory.values if choice != TransactionCategory.INCOME]
+
+
+class _QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds synthetic users and transactions, then compares per-user and set-based report generation. "
+        "All seeded data is rolled back when the benchmark finishes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000, help="Number of users to seed.")
+        parser.add_argument("--transactions-per-user", type=int, default=50, help="Transactions per seeded user.")
+        parser.add_argument("--chunk-size", type=int, default=1000, help="Users per set-based aggregation pass.")
+        parser.add_argument("--period", choices=["weekly", "monthly"], default="monthly", help="Report period type.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            user_ids = self._seed(options["users"], options["transactions_per_user"])
+            period = options["period"]
+            chunk_size = options["chunk_size"]
+
+            per_user_seconds, per_user_queries = self._measure(
+                lambda: [generate_spending_report(user_id, period) for user_id in user_ids]
+            )
+            bulk_seconds, bulk_queries = self._measure(
+                lambda: [
+                    generate_spending_reports_bulk(user_ids[i : i + chunk_size], period)
+                    for i in range(0, len(user_ids), chunk_size)
+                ]
+            )
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"Per-user:   {per_user_seconds:.2f}s, {per_user_queries:,} queries")
+        self.stdout.write(f"Set-based:  {bulk_seconds:.2f}s, {bulk_queries:,} queries")
+        self.stdout.write(self.style.SUCCESS(f"Speedup:    {per_user_seconds / bulk_seconds:.2f}x"))
+
+    def _measure(self, run):
+        counter = _QueryCounter()
+        with connection.execute_wrapper(counter):
+            started = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - started
+        return elapsed, counter.count
+
+    def _seed(self, user_count: int, transactions_per_user: int) -> list[int]:
+        rng = random.Random(0)
+        prefix = uuid.uuid4().hex[:8]
+        password = make_password(None)
+        users = CustomUser.objects.bulk_create(
+            [
+                CustomUser(
+                    email=f"bench-{prefix}-{i}@example.com",
+                    password=password,
+                    name=f"Bench {i}",
+                    nickname=f"bench-{prefix}-{i}",
+                    is_active=True,
+                )
+                for i in range(user_count)
+            ],
+            batch_size=1000,
+        )
+        accounts = Account.objects.bulk_create(
+            [
+                Account(user=user, account_number=f"{prefix}{i:010d}", bank_code="088", account_type="checking")
+                for i, user in enumerate(users)
+            ],
+            batch_size=1000,
+        )
+        transactions = []
+        for account in accounts:
+            for _ in range(transactions_per_user):
+                is_deposit = rng.random() < 0.1
+                transactions.append(
+                    TransactionHistory(
+                        account=account,
+                        transaction_type="DEPOSIT" if is_deposit else "WITHDRAW",
+                        category=TransactionCategory.OTHER if is_deposit else rng.choice(WITHDRAW_CATEGORIES),
+                        amount=Decimal(rng.randrange(1000, 100000)),
+                        balance_after=Decimal("0.00"),
+                        transaction_method="CARD",
+                    )
+                )
+        TransactionHistory.objects.bulk_create(transactions, batch_size=5000)
+        rebuild_rollups([user.pk for user in users])
+        self.stdout.write(f"Seeded {len(users):,} users and {len(transactions):,} transactions.")
+        return [user.pk for user in users]
@@ -0,0 +1,108 @@
+import random
+import threading
+import time
+
+import torch
+from django.core.management.base import BaseCommand
+from torch import nn
+
+from apps.analysis.inference import BatchedInferenceEngine
+
+SAMPLE_TEXTS = [
+    "커피",
+    "점심",
+    "택시",
+    "월급 입금",
+    "친구랑 저녁 회식",
+    "주말 영화 관람",
+    "병원 진료비",
+    "온라인 쇼핑 환불",
+]
+
+
+class StandInSentimentClassifier:
+    """
+    벤치마크용 소형 로컬 분류기입니다.
+
+    BERT와 같은 구조(임베딩 + 트랜스포머 인코더 + 분류 헤드)를 작은 크기로 구성하여,
+    모델 다운로드 없이 배치 처리에 따른 처리량 차이를 측정할 수 있게 합니다.
+    """
+
+    def __init__(self, d_model: int = 128, num_layers: int = 2, vocab_size: int = 8192, max_length: int = 64):
+        torch.manual_seed(0)
+        self.vocab_size = vocab_size
+        self.max_length = max_length
+        self.embedding = nn.Embedding(vocab_size, d_model, padding_idx=0)
+        layer = nn.TransformerEncoderLayer(d_model=d_model, nhead=4, dim_feedforward=d_model * 4, batch_first=True)
+        self.encoder = nn.TransformerEncoder(layer, num_layers=num_layers, enable_nested_tensor=False)
+        self.head = nn.Linear(d_model, 2)
+        for module in (self.embedding, self.encoder, self.head):
+            module.eval()
+
+    def _tokenize(self, text: str) -> list[int]:
+        # 글자 단위 해시 토큰화 (0번은 패딩용으로 비워둡니다)
+        return [hash(ch) % (self.vocab_size - 1) + 1 for ch in text][: self.max_length] or [1]
+
+    def __call__(self, texts: list[str]) -> list[dict]:
+        token_ids = [self._tokenize(text) for text in texts]
+        longest = max(len(ids) for ids in token_ids)
+        input_ids = torch.tensor([ids + [0] * (longest - len(ids)) for ids in token_ids])
+        padding_mask = input_ids == 0
+        with torch.inference_mode():
+            hidden = self.encoder(self.embedding(input_ids), src_key_padding_mask=padding_mask)
+            hidden = hidden.masked_fill(padding_mask.unsqueeze(-1), 0).sum(dim=1)
+            hidden = hidden / (~padding_mask).sum(dim=1, keepdim=True)
+            probs = torch.softmax(self.head(hidden), dim=-1)
+        scores, labels = probs.max(dim=-1)
+        return [{"label": f"LABEL_{label}", "score": float(score)} for label, score in zip(labels, scores)]
+
+
+class Command(BaseCommand):
+    help = "Compares batched and unbatched sentiment inference throughput using a small local stand-in model."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=2000, help="Total number of texts to classify.")
+        parser.add_argument("--concurrency", type=int, default=32, help="Number of concurrent client threads.")
+        parser.add_argument("--batch-size", type=int, default=32, help="Maximum batch size for the batched engine.")
+        parser.add_argument("--max-wait-ms", type=float, default=10.0, help="Batch collection deadline in ms.")
+        parser.add_argument("--threads", type=int, default=1, help="torch intra-op threads (CPU budget).")
+
+    def handle(self, *args, **options):
+        torch.set_num_threads(options["threads"])
+        classifier = StandInSentimentClassifier()
+        rng = random.Random(0)
+        texts = [rng.choice(SAMPLE_TEXTS) for _ in range(options["requests"])]
+
+        # 배치 없이 한 번에 하나씩 처리 (기존 뷰처럼 요청마다 forward pass 1회, 모델은 한 번에 한 요청만 처리)
+        model_lock = threading.Lock()
+
+        def unbatched(text):
+            with model_lock:
+                return classifier([text])[0]
+
+        engine = BatchedInferenceEngine(
+            classifier, max_batch_size=options["batch_size"], max_wait_ms=options["max_wait_ms"]
+        )
+        classifier(SAMPLE_TEXTS)  # 워밍업
+
+        unbatched_rate = self._run(unbatched, texts, options["concurrency"])
+        batched_rate = self._run(engine.predict, texts, options["concurrency"])
+
+        self.stdout.write(f"Unbatched: {unbatched_rate:,.1f} texts/sec")
+        self.stdout.write(f"Batched:   {batched_rate:,.1f} texts/sec")
+        self.stdout.write(self.style.SUCCESS(f"Speedup:   {batched_rate / unbatched_rate:.2f}x"))
+
+    def _run(self, classify, texts, concurrency):
+        chunks = [texts[i::concurrency] for i in range(concurrency)]
+
+        def client(chunk):
+            for text in chunk:
+                classify(text)
+
+        threads = [threading.Thread(target=client, args=(chunk,)) for chunk in chunks]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return len(texts) / (time.perf_counter() - started)
@@ -0,0 +1,115 @@
+import gc
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.analysis.backends import BACKEND_TORCH, BACKENDS
+from apps.analysis.registry import SentimentModelRegistry
+
+SAMPLE_TEXTS = [
+    "커피",
+    "점심",
+    "택시",
+    "월급 입금",
+    "친구랑 저녁 회식, 너무 즐거웠다",
+    "주말 영화 관람",
+    "병원 진료비가 생각보다 많이 나왔다",
+    "온라인 쇼핑 환불 처리가 안 돼서 짜증난다",
+    "부모님 생신 선물",
+    "야근 후 택시비",
+]
+
+
+def _percentile(values, percent):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares accuracy (agreement with fp32) and latency of the sentiment inference backends. "
+        "'model RSS' is how much this process's resident memory grew while loading that backend; "
+        "the previous backend is released (and garbage collected) before the next one is loaded."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--backends",
+            default=",".join(BACKENDS),
+            help=f"Comma separated backends to compare ({', '.join(BACKENDS)}).",
+        )
+        parser.add_argument("--texts-file", help="UTF-8 file with one text per line (defaults to built-in samples).")
+        parser.add_argument("--model", default=settings.SENTIMENT_MODEL_NAME, help="Model name or local path.")
+        parser.add_argument("--onnx-dir", default=settings.SENTIMENT_ONNX_MODEL_DIR, help="ONNX model directory.")
+        parser.add_argument("--threads", type=int, default=settings.SENTIMENT_INFERENCE_NUM_THREADS)
+        parser.add_argument("--batch-size", type=int, default=settings.SENTIMENT_INFERENCE_BATCH_SIZE)
+        parser.add_argument("--repeat", type=int, default=5, help="How many times to run the text set per backend.")
+
+    def handle(self, *args, **options):
+        backends = [backend.strip() for backend in options["backends"].split(",") if backend.strip()]
+        unknown = set(backends) - set(BACKENDS)
+        if unknown:
+            raise CommandError(f"Unknown backends: {', '.join(sorted(unknown))}")
+        if options["texts_file"]:
+            with open(options["texts_file"], encoding="utf-8") as texts_file:
+                texts = [line.strip() for line in texts_file if line.strip()]
+        else:
+            texts = SAMPLE_TEXTS
+        if BACKEND_TORCH in backends:
+            # fp32 결과를 기준으로 정확도(라벨 일치율)를 비교합니다.
+            backends = [BACKEND_TORCH] + [backend for backend in backends if backend != BACKEND_TORCH]
+
+        reference = None
+        for backend in backends:
+            registry = SentimentModelRegistry(
+                options["model"],
+                settings.SENTIMENT_MODEL_REVISION,
+                backend=backend,
+                onnx_model_dir=options["onnx_dir"],
+                num_threads=options["threads"],
+            )
+            registry.warm_up()
+            classifier = registry.get_classifier()
+
+            latencies = []
+            for _ in range(options["repeat"]):
+                for text in texts:
+                    started = time.perf_counter()
+                    classifier([text], batch_size=1, truncation=True)
+                    latencies.append((time.perf_counter() - started) * 1000)
+
+            batch_size = options["batch_size"]
+            started = time.perf_counter()
+            predictions = []
+            for _ in range(options["repeat"]):
+                predictions = []
+                for i in range(0, len(texts), batch_size):
+                    batch = texts[i : i + batch_size]
+                    predictions.extend(classifier(batch, batch_size=len(batch), truncation=True))
+            throughput = len(texts) * options["repeat"] / (time.perf_counter() - started)
+
+            stats = registry.stats()
+            self.stdout.write(self.style.MIGRATE_HEADING(f"[{backend}]"))
+            self.stdout.write(f"  load time:   {stats['load_seconds']:.2f}s")
+            self.stdout.write(
+                f"  model RSS:   {(stats['rss_after_load_bytes'] - stats['rss_before_load_bytes']) / 2**20:.1f} MiB"
+            )
+            self.stdout.write(
+                f"  latency:     p50 {statistics.median(latencies):.1f} ms, p99 {_percentile(latencies, 99):.1f} ms"
+            )
+            self.stdout.write(f"  throughput:  {throughput:,.1f} texts/sec (batch size {batch_size})")
+
+            # 다음 백엔드의 RSS 측정에 이 모델의 메모리가 섞이지 않도록 먼저 해제합니다.
+            del registry, classifier
+            gc.collect()
+
+            if reference is None:
+                reference = predictions
+                continue
+            agreement = sum(a["label"] == b["label"] for a, b in zip(reference, predictions)) / len(texts)
+            score_diff = max(abs(a["score"] - b["score"]) for a, b in zip(reference, predictions))
+            self.stdout.write(f"  agreement:   {agreement:.1%} of labels match {backends[0]}")
+            self.stdout.write(f"  score diff:  max {score_diff:.4f}")
@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.analysis.backends import export_onnx
+
+
+class Command(BaseCommand):
+    help = "Exports the sentiment analysis model to ONNX for the 'onnx' inference backend."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--model", default=settings.SENTIMENT_MODEL_NAME, help="Model name or local path.")
+        parser.add_argument("--revision", default=settings.SENTIMENT_MODEL_REVISION, help="Model revision.")
+        parser.add_argument("--output", default=settings.SENTIMENT_ONNX_MODEL_DIR, help="Output directory.")
+        parser.add_argument("--opset", type=int, default=17, help="ONNX opset version.")
+
+    def handle(self, *args, **options):
+        model_path = export_onnx(options["model"], options["revision"], options["output"], opset=options["opset"])
+        self.stdout.write(self.style.SUCCESS(f"Exported ONNX model to {model_path}"))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from apps.analysis.registry import sentiment_model
+
+
+class Command(BaseCommand):
+    help = "Loads the sentiment analysis model and reports its load time and resident memory."
+
+    def handle(self, *args, **options):
+        sentiment_model.warm_up()
+        stats = sentiment_model.stats()
+        self.stdout.write(f"Model: {stats['model_name']}")
+        self.stdout.write(f"Load time: {stats['load_seconds']:.2f}s")
+        self.stdout.write(f"RSS before load: {stats['rss_before_load_bytes'] / 2**20:.1f} MiB")
+        self.stdout.write(f"RSS after load: {stats['rss_after_load_bytes'] / 2**20:.1f} MiB")
+        self.stdout.write(self.style.SUCCESS("Sentiment model loaded successfully."))
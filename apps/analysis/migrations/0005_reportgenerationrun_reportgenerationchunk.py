@@ -0,0 +1,94 @@
+# Generated by Django 5.2.5 on 2026-10-18 17:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analysis", "0004_alter_spendingreport_options_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReportGenerationRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "report_type",
+                    models.CharField(
+                        choices=[("weekly", "주간 리포트"), ("monthly", "월간 리포트")],
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("running", "실행 중"), ("completed", "완료")],
+                        default="running",
+                        max_length=10,
+                    ),
+                ),
+                ("total_chunks", models.PositiveIntegerField(default=0)),
+                ("total_users", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ReportGenerationChunk",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("start_user_id", models.BigIntegerField()),
+                ("end_user_id", models.BigIntegerField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "대기"),
+                            ("succeeded", "성공"),
+                            ("failed", "실패"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("succeeded_users", models.PositiveIntegerField(default=0)),
+                ("failed_user_ids", models.JSONField(blank=True, default=list)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "run",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="chunks",
+                        to="analysis.reportgenerationrun",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["run", "start_user_id"],
+                "indexes": [models.Index(fields=["run", "status"], name="analysis_re_run_id_bc3fab_idx")],
+            },
+        ),
+    ]
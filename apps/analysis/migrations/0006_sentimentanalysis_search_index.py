@@ -0,0 +1,24 @@
+from django.db import migrations
+
+from apps.transaction_history.search import create_search_index, drop_search_index
+
+
+def create_text_content_index(apps, schema_editor):
+    create_search_index(schema_editor, "analysis_sentimentanalysis", "text_content")
+
+
+def drop_text_content_index(apps, schema_editor):
+    drop_search_index(schema_editor, "analysis_sentimentanalysis", "text_content")
+
+
+class Migration(migrations.Migration):
+    # PostgreSQL의 CREATE INDEX CONCURRENTLY는 트랜잭션 안에서 실행할 수 없습니다.
+    atomic = False
+
+    dependencies = [
+        ("analysis", "0005_reportgenerationrun_reportgenerationchunk"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_text_content_index, drop_text_content_index),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.5 on 2026-10-18 18:34
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def copy_created_at(apps, schema_editor):
+    SpendingReport = apps.get_model("analysis", "SpendingReport")
+    SpendingReport.objects.update(updated_at=F("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analysis", "0006_sentimentanalysis_search_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="spendingreport",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(copy_created_at, migrations.RunPython.noop),
+    ]
@@ -19,6 +19,8 @@ class SpendingReport(models.Model):
     generated_date = models.DateField()
     json_data = models.JSONField(default=dict, help_text="Report data in JSON format.")
     created_at = models.DateTimeField(auto_now_add=True)
+    # 같은 날 다시 생성하면 json_data만 갱신되므로, 리포트 목록 ETag는 created_at이 아니라 이 값으로 계산합니다.
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-user", "-generated_date", "-created_at"]
@@ -41,3 +43,54 @@ class SentimentAnalysis(models.Model):
 
     def __str__(self):
         return f"Analysis for {self.transaction.transaction_detail}: {self.sentiment} ({self.score})"
+
+
+class ReportGenerationRun(models.Model):
+    """전체 사용자 대상 리포트 일괄 생성 실행 기록. 사용자 ID 범위 단위의 청크로 나누어 처리합니다."""
+
+    STATUS_RUNNING = "running"
+    STATUS_COMPLETED = "completed"
+    STATUS_CHOICES = [
+        (STATUS_RUNNING, "실행 중"),
+        (STATUS_COMPLETED, "완료"),
+    ]
+    report_type = models.CharField(max_length=10, choices=SpendingReport.REPORT_TYPE_CHOICES)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_RUNNING)
+    total_chunks = models.PositiveIntegerField(default=0)
+    total_users = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.get_report_type_display()} run #{self.pk} ({self.get_status_display()})"
+
+
+class ReportGenerationChunk(models.Model):
+    """리포트 생성 청크. [start_user_id, end_user_id] 범위의 활성 사용자를 하나의 태스크로 처리합니다."""
+
+    STATUS_PENDING = "pending"
+    STATUS_SUCCEEDED = "succeeded"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "대기"),
+        (STATUS_SUCCEEDED, "성공"),
+        (STATUS_FAILED, "실패"),
+    ]
+    run = models.ForeignKey(ReportGenerationRun, on_delete=models.CASCADE, related_name="chunks")
+    start_user_id = models.BigIntegerField()
+    end_user_id = models.BigIntegerField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    succeeded_users = models.PositiveIntegerField(default=0)
+    failed_user_ids = models.JSONField(default=list, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["run", "start_user_id"]
+        indexes = [models.Index(fields=["run", "status"])]
+
+    def __str__(self):
+        return f"Chunk {self.start_user_id}-{self.end_user_id} of run #{self.run_id} ({self.get_status_display()})"
@@ -0,0 +1,39 @@
+from django.core.paginator import InvalidPage, Paginator
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+
+
+class ReportPagination(PageNumberPagination):
+    """
+    리포트 목록용 페이지 번호 페이지네이션. 응답의 목록 키는 기존 응답과 같은 "reports"입니다.
+
+    목록 뷰는 ETag를 만들 때 이미 리포트 수를 세므로, 그 값을 받아 COUNT 쿼리를 다시 실행하지 않습니다.
+    반환하는 페이지의 object_list는 아직 실행하지 않은 QuerySet이라 동기/비동기 뷰 모두 그대로 조회할 수 있습니다.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def paginate_counted_queryset(self, queryset, count: int, request):
+        self.request = request
+        paginator = Paginator(queryset, self.get_page_size(request))
+        paginator.count = count
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+        return self.page.object_list
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_data(self, data):
+        return {
+            "count": self.page.paginator.count,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "reports": data,
+        }
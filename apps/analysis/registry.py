@@ -0,0 +1,119 @@
+import logging
+import resource
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
+from .backends import load_classifier
+
+logger = logging.getLogger(__name__)
+
+
+def _current_rss_bytes() -> int:
+    """현재 프로세스의 상주 메모리(RSS)를 바이트 단위로 반환합니다."""
+    try:
+        with open("/proc/self/status") as status_file:
+            for line in status_file:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    # /proc이 없는 환경(macOS 등)에서는 최대 RSS로 대신합니다.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class SentimentModelRegistry:
+    """
+    감정 분석 모델을 처음 사용할 때 한 번만 로드하는 레지스트리입니다.
+
+    모듈 import 시점에는 transformers/torch도 import하지 않으므로, `manage.py migrate`나
+    Celery 워커가 모델을 쓰지 않는 한 BERT 가중치를 메모리에 올리지 않습니다.
+    gunicorn `preload_app` 환경에서 마스터 프로세스가 모델을 미리 로드해 두면
+    fork된 워커들이 가중치 페이지를 copy-on-write로 공유합니다.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        revision: str = "main",
+        backend: str = "torch",
+        onnx_model_dir: Optional[str] = None,
+        num_threads: Optional[int] = None,
+    ):
+        self.model_name = model_name
+        self.revision = revision
+        self.backend = backend
+        self.onnx_model_dir = onnx_model_dir
+        self.num_threads = num_threads
+        self._classifier = None
+        self._lock = threading.Lock()
+        self.load_seconds: Optional[float] = None
+        self.rss_before_load: Optional[int] = None
+        self.rss_after_load: Optional[int] = None
+
+    @property
+    def version(self) -> str:
+        """캐시 키 등에 사용하는 모델 버전 식별자입니다. 모델, 리비전, 추론 백엔드가 바뀌면 값이 달라집니다."""
+        return f"{self.model_name}@{self.revision}/{self.backend}"
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._classifier is not None
+
+    def get_classifier(self):
+        """로드된 파이프라인을 반환하며, 아직 로드되지 않았다면 이 시점에 로드합니다."""
+        if self._classifier is None:
+            with self._lock:
+                if self._classifier is None:
+                    self._classifier = self._load()
+        return self._classifier
+
+    def warm_up(self) -> None:
+        """모델을 미리 로드하고 더미 입력으로 한 번 추론하여 첫 요청의 지연을 없앱니다."""
+        self.get_classifier()(["워밍업"], batch_size=1, truncation=True)
+
+    def _load(self):
+        self.rss_before_load = _current_rss_bytes()
+        started = time.perf_counter()
+        classifier = load_classifier(
+            self.backend,
+            self.model_name,
+            self.revision,
+            onnx_model_dir=self.onnx_model_dir,
+            num_threads=self.num_threads,
+        )
+        self.load_seconds = time.perf_counter() - started
+        self.rss_after_load = _current_rss_bytes()
+        logger.info(
+            "Loaded sentiment model %s (%s backend) in %.2fs (RSS %.1f MiB -> %.1f MiB).",
+            self.model_name,
+            self.backend,
+            self.load_seconds,
+            self.rss_before_load / 2**20,
+            self.rss_after_load / 2**20,
+        )
+        return classifier
+
+    def stats(self) -> Dict[str, Any]:
+        """모델 로드 여부, 로드 시간, 메모리 사용량을 반환합니다."""
+        return {
+            "model_name": self.model_name,
+            "version": self.version,
+            "backend": self.backend,
+            "loaded": self.is_loaded,
+            "load_seconds": self.load_seconds,
+            "rss_before_load_bytes": self.rss_before_load,
+            "rss_after_load_bytes": self.rss_after_load,
+            "rss_bytes": _current_rss_bytes(),
+        }
+
+
+sentiment_model = SentimentModelRegistry(
+    settings.SENTIMENT_MODEL_NAME,
+    settings.SENTIMENT_MODEL_REVISION,
+    backend=settings.SENTIMENT_INFERENCE_BACKEND,
+    onnx_model_dir=settings.SENTIMENT_ONNX_MODEL_DIR,
+    num_threads=settings.SENTIMENT_INFERENCE_NUM_THREADS,
+)
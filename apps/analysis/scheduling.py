@@ -0,0 +1,96 @@
+"""
+리포트 생성 요청의 중복 제거.
+
+- 같은 (사용자, 기간 유형, 날짜)의 리포트는 한 번에 하나만 생성합니다. 생성 중에 들어온 요청은 새 작업을 만들지 않고
+  실행 중인 작업의 ID를 돌려받습니다. (캐시 add로 잡는 잠금, 작업이 끝나면 해제)
+- 리포트를 만들 때 읽은 거래 집계 워터마크(`rollups.rollup_watermark`)를 기록해 두고,
+  그 뒤 거래가 바뀌지 않았으면 요청을 건너뜁니다.
+"""
+
+import datetime
+import uuid
+from typing import Dict, NamedTuple, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.transaction_history.rollups import rollup_watermark
+
+from .models import SpendingReport
+
+LOCK_KEY = "analysis:report-lock:{user_id}:{period_type}:{day}"
+SOURCE_KEY = "analysis:report-source:{user_id}:{period_type}:{day}"
+# 기록한 워터마크는 리포트 날짜가 지나면 쓰이지 않습니다.
+SOURCE_TTL = 2 * 24 * 60 * 60
+
+QUEUED = "queued"
+IN_PROGRESS = "in_progress"
+UP_TO_DATE = "up_to_date"
+
+
+class ReportRequest(NamedTuple):
+    status: str
+    task_id: Optional[str] = None
+
+
+def _key(template: str, user_id: int, period_type: str, day: datetime.date) -> str:
+    return template.format(user_id=user_id, period_type=period_type, day=day.isoformat())
+
+
+def remember_report_source(user_id: int, period_type: str, day: datetime.date, watermark: str) -> None:
+    """리포트를 만들 때 읽은 집계의 워터마크를 기록합니다."""
+    remember_report_sources(period_type, day, {user_id: watermark})
+
+
+def remember_report_sources(period_type: str, day: datetime.date, watermarks: Dict[int, str]) -> None:
+    cache.set_many(
+        {_key(SOURCE_KEY, user_id, period_type, day): watermark for user_id, watermark in watermarks.items()},
+        SOURCE_TTL,
+    )
+
+
+def release_report_lock(user_id: int, period_type: str, day: datetime.date, task_id: Optional[str]) -> None:
+    """작업이 잡은 잠금이면 해제합니다. (잠금이 만료되어 다른 작업이 잡은 경우는 그대로 둡니다.)"""
+    key = _key(LOCK_KEY, user_id, period_type, day)
+    if task_id and cache.get(key) == task_id:
+        cache.delete(key)
+
+
+def request_spending_report(user_id: int, period_type: str) -> ReportRequest:
+    """
+    리포트 생성 작업을 예약하거나, 예약하지 않아도 되는 이유를 반환합니다.
+
+    - UP_TO_DATE: 오늘 리포트가 있고 그 뒤 거래가 바뀌지 않았습니다.
+    - IN_PROGRESS: 같은 리포트를 생성 중인 작업이 있습니다. (task_id는 그 작업의 ID)
+    - QUEUED: 새 작업을 예약했습니다.
+    작업 전달에 실패하면 잠금을 풀고 예외를 다시 발생시킵니다.
+    """
+    from .tasks import generate_spending_report
+
+    day = timezone.localdate()
+    source = cache.get(_key(SOURCE_KEY, user_id, period_type, day))
+    if (
+        source is not None
+        and source == rollup_watermark(user_id)
+        and SpendingReport.objects.filter(user_id=user_id, report_type=period_type, generated_date=day).exists()
+    ):
+        return ReportRequest(UP_TO_DATE)
+
+    lock_key = _key(LOCK_KEY, user_id, period_type, day)
+    task_id = uuid.uuid4().hex
+    if not cache.add(lock_key, task_id, settings.REPORT_REQUEST_LOCK_TIMEOUT):
+        running_task_id = cache.get(lock_key)
+        if running_task_id is not None:
+            return ReportRequest(IN_PROGRESS, running_task_id)
+        # 그 사이 작업이 끝나 잠금이 풀렸으면 새로 잡습니다.
+        cache.set(lock_key, task_id, settings.REPORT_REQUEST_LOCK_TIMEOUT)
+
+    try:
+        generate_spending_report.apply_async(
+            (user_id, period_type), kwargs={"lock_day": day.isoformat()}, task_id=task_id
+        )
+    except Exception:
+        cache.delete(lock_key)
+        raise
+    return ReportRequest(QUEUED, task_id)
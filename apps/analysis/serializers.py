@@ -1,6 +1,6 @@
 from rest_framework import serializers
 
-from .models import SpendingReport
+from .models import SentimentAnalysis, SpendingReport
 
 
 class SpendingReportSerializer(serializers.ModelSerializer):
@@ -15,8 +15,52 @@ class SpendingReportSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = SpendingReport
-        fields = ["id", "report_type", "report_type_display", "generated_date", "name", "json_data", "created_at"]
+        fields = [
+            "id",
+            "report_type",
+            "report_type_display",
+            "generated_date",
+            "name",
+            "json_data",
+            "created_at",
+            "updated_at",
+        ]
 
     def get_name(self, obj):
         """프론트엔드에서 필요한 'name' 필드를 동적으로 생성합니다."""
         return f"{obj.get_report_type_display()} - {obj.generated_date.strftime('%Y-%m-%d')}"
+
+
+class SpendingReportSummarySerializer(SpendingReportSerializer):
+    """리포트 목록의 slim 모드 응답. json_data는 리포트 상세 API로 조회합니다."""
+
+    class Meta(SpendingReportSerializer.Meta):
+        fields = [field for field in SpendingReportSerializer.Meta.fields if field != "json_data"]
+
+
+class SentimentAnalysisSerializer(serializers.ModelSerializer):
+    """감정 분석 결과 목록/검색 API 응답 형식."""
+
+    class Meta:
+        model = SentimentAnalysis
+        fields = ["id", "transaction", "text_content", "sentiment", "score", "created_at"]
+
+
+class BulkSentimentAnalysisSerializer(serializers.Serializer):
+    """
+    여러 거래 내역의 일괄 감정 분석 요청을 검증합니다.
+    거래 ID 목록 또는 기간(start_date/end_date) 중 하나 이상을 지정해야 합니다.
+    """
+
+    transaction_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False, allow_empty=False, max_length=10000
+    )
+    start_date = serializers.DateField(required=False)
+    end_date = serializers.DateField(required=False)
+
+    def validate(self, attrs):
+        if not attrs.get("transaction_ids") and not attrs.get("start_date") and not attrs.get("end_date"):
+            raise serializers.ValidationError("transaction_ids 또는 start_date/end_date 중 하나는 필요합니다.")
+        if attrs.get("start_date") and attrs.get("end_date") and attrs["start_date"] > attrs["end_date"]:
+            raise serializers.ValidationError("start_date는 end_date보다 늦을 수 없습니다.")
+        return attrs
@@ -1,16 +1,23 @@
 import logging
 from datetime import date, datetime, timedelta
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from celery import shared_task
-from django.db.models import Case, CharField, F, Sum, Value, When
+from celery import chain, shared_task
+from django.conf import settings
+from django.db.models import Case, CharField, Count, F, Q, Sum, Value, When
 from django.utils import timezone
 
+from apps.notifications.tasks import notify_report_ready
 from apps.transaction_history.choices import TransactionCategory  # New import
-from apps.transaction_history.models import TransactionHistory
+from apps.transaction_history.models import DailyTransactionRollup, TransactionHistory
+from apps.transaction_history.rollups import existing_rollup_watermarks, rollup_watermark
 from apps.users.models import CustomUser
+from core import events
 
-from .models import SpendingReport
+from .cache import sentiment_cache
+from .inference import classify_batch, inference_engine, translate_label
+from .models import ReportGenerationChunk, ReportGenerationRun, SentimentAnalysis, SpendingReport
+from .scheduling import release_report_lock, remember_report_source, remember_report_sources
 
 logger = logging.getLogger(__name__)
 
@@ -34,25 +41,227 @@ def _get_date_range_for_period(period_type: str, now: datetime) -> tuple[datetim
         raise ValueError(f"Invalid period_type: {period_type}")
 
 
+def _annotate_report_category(queryset):
+    # 입금 내역은 '수입' 카테고리로 분류하고, 출금 내역은 기존 카테고리를 사용합니다.
+    return queryset.annotate(
+        report_category=Case(
+            When(transaction_type="DEPOSIT", then=Value(TransactionCategory.INCOME)),
+            default=F("category"),
+            output_field=CharField(),
+        )
+    )
+
+
+def generate_spending_reports_bulk(user_ids: list[int], period_type: str, now: datetime | None = None) -> int:
+    """
+    여러 사용자의 리포트를 한 번의 집계 쿼리와 한 번의 UPSERT로 생성합니다.
+
+    일별 집계 테이블(DailyTransactionRollup)을 `user_id, report_category` 기준으로 GROUP BY한 결과를
+    메모리에서 사용자별 JSON으로 조립한 뒤,
+    `bulk_create(update_conflicts=True)`로 (user, report_type, generated_date) 충돌 시 json_data와 updated_at만 갱신합니다.
+    거래가 없는 사용자에게도 빈 리포트를 저장하여 사용자별 생성 결과(`generate_spending_report`)와 동일하게 맞춥니다.
+    저장한 리포트 수를 반환합니다.
+    """
+    now = timezone.localtime(now)
+    start_date, end_date = _get_date_range_for_period(period_type, now)
+    if not user_ids:
+        return 0
+
+    watermarks = existing_rollup_watermarks(user_ids)
+    report_data: Dict[int, Dict[str, Any]] = {user_id: {"categories": [], "spending": []} for user_id in user_ids}
+    rows = (
+        _annotate_report_category(
+            DailyTransactionRollup.objects.filter(user_id__in=user_ids, day__range=(start_date.date(), end_date.date()))
+        )
+        .values("user_id", "report_category")
+        .annotate(total_spending=Sum("total_amount"))
+        .order_by("user_id", "report_category")
+    )
+    for row in rows:
+        data = report_data[row["user_id"]]
+        data["categories"].append(TransactionCategory(row["report_category"]).label)
+        data["spending"].append(float(row["total_spending"]))
+
+    today = now.date()
+    SpendingReport.objects.bulk_create(
+        [
+            SpendingReport(user_id=user_id, report_type=period_type, generated_date=today, json_data=data)
+            for user_id, data in report_data.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["user", "report_type", "generated_date"],
+        update_fields=["json_data", "updated_at"],
+    )
+    remember_report_sources(period_type, today, watermarks)
+    events.publish_many(
+        (user_id, "report.ready", {"report_type": period_type, "generated_date": today.isoformat()})
+        for user_id in report_data
+    )
+    return len(report_data)
+
+
+def _plan_user_id_chunks(chunk_size: int) -> list[tuple[int, int, int]]:
+    """
+    활성 사용자 ID를 정렬하여 chunk_size명씩 [시작 ID, 끝 ID] 범위로 나눕니다.
+    (시작 ID, 끝 ID, 사용자 수) 목록을 반환합니다.
+    """
+    user_ids = list(CustomUser.objects.filter(is_active=True).order_by("id").values_list("id", flat=True))
+    return [
+        (user_ids[i], user_ids[min(i + chunk_size, len(user_ids)) - 1], len(user_ids[i : i + chunk_size]))
+        for i in range(0, len(user_ids), chunk_size)
+    ]
+
+
+def _dispatch_report_chunks(chunks, period_type: str, concurrency: int) -> None:
+    """청크들을 최대 concurrency개의 체인으로 나누어, 동시에 실행되는 청크 수를 제한하며 등록합니다."""
+    for lane in range(min(concurrency, len(chunks))):
+        signatures = [generate_spending_reports_chunk.si(chunk.pk, period_type) for chunk in chunks[lane::concurrency]]
+        chain(*signatures).apply_async()
+
+
 @shared_task
 def schedule_all_user_reports(period_type: str):
     """
     모든 활성 사용자를 대상으로 리포트 생성을 스케줄링하는 마스터 태스크입니다.
+
+    사용자마다 태스크를 보내지 않고, 사용자 ID 범위 단위의 청크 태스크로 나누어 보냅니다.
+    각 청크의 진행 상황은 ReportGenerationChunk에 기록되어 실패한 청크만 다시 실행할 수 있습니다.
+    """
+    if period_type not in dict(SpendingReport.REPORT_TYPE_CHOICES):
+        logger.warning("리포트 스케줄링 실패: 유효하지 않은 기간 유형 '%s'.", period_type)
+        return None
+
+    planned = _plan_user_id_chunks(settings.REPORT_SCHEDULE_CHUNK_SIZE)
+    run = ReportGenerationRun.objects.create(
+        report_type=period_type,
+        total_chunks=len(planned),
+        total_users=sum(user_count for _start, _end, user_count in planned),
+    )
+    chunks = ReportGenerationChunk.objects.bulk_create(
+        [ReportGenerationChunk(run=run, start_user_id=start, end_user_id=end) for start, end, _count in planned]
+    )
+    logger.info(
+        "Starting %s report generation run #%s for %s users in %s chunks.",
+        period_type,
+        run.pk,
+        run.total_users,
+        len(chunks),
+    )
+    if not chunks:
+        _finish_report_run(run.pk)
+        return run.pk
+    _dispatch_report_chunks(chunks, period_type, settings.REPORT_SCHEDULE_CONCURRENCY)
+    return run.pk
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def generate_spending_reports_chunk(self, chunk_id: int, period_type: str, user_ids: list[int] | None = None):
+    """
+    하나의 청크(사용자 ID 범위)에 속한 활성 사용자들의 리포트를 생성합니다.
+
+    일부 사용자에서 오류가 발생하면 실패한 사용자만 대상으로 이 청크를 재시도하며,
+    재시도 횟수를 모두 쓰면 실패한 사용자 ID를 기록하고 청크를 실패로 표시합니다.
     """
-    user_ids = CustomUser.objects.filter(is_active=True).values_list("id", flat=True)
-    logger.info(f"Starting {period_type} report generation for {len(user_ids)} users.")
-    for user_id in user_ids:
-        generate_spending_report.delay(user_id, period_type)
+    chunk = ReportGenerationChunk.objects.get(pk=chunk_id)
+    if user_ids is None:
+        user_ids = list(
+            CustomUser.objects.filter(is_active=True, id__range=(chunk.start_user_id, chunk.end_user_id)).values_list(
+                "id", flat=True
+            )
+        )
+
+    failed_user_ids = []
+    try:
+        generate_spending_reports_bulk(user_ids, period_type)
+    except Exception as e:
+        # 일괄 생성이 실패하면 사용자별로 다시 생성하여 실패한 사용자만 골라냅니다.
+        logger.warning("청크 #%s 일괄 리포트 생성 실패, 사용자별 생성으로 전환합니다: %s", chunk_id, e)
+        for user_id in user_ids:
+            try:
+                generate_spending_report(user_id, period_type)
+            except Exception as e:
+                logger.error("청크 #%s 리포트 생성 실패 (user: %s): %s", chunk_id, user_id, e)
+                failed_user_ids.append(user_id)
+
+    ReportGenerationChunk.objects.filter(pk=chunk_id).update(
+        attempts=F("attempts") + 1,
+        succeeded_users=F("succeeded_users") + len(user_ids) - len(failed_user_ids),
+        failed_user_ids=failed_user_ids,
+        updated_at=timezone.now(),
+    )
+    if failed_user_ids and self.request.retries < self.max_retries:
+        raise self.retry(args=(chunk_id, period_type), kwargs={"user_ids": failed_user_ids})
+
+    status = ReportGenerationChunk.STATUS_FAILED if failed_user_ids else ReportGenerationChunk.STATUS_SUCCEEDED
+    ReportGenerationChunk.objects.filter(pk=chunk_id).update(status=status)
+    if not ReportGenerationChunk.objects.filter(
+        run_id=chunk.run_id, status=ReportGenerationChunk.STATUS_PENDING
+    ).exists():
+        _finish_report_run(chunk.run_id)
+    return {"chunk_id": chunk_id, "succeeded": len(user_ids) - len(failed_user_ids), "failed": failed_user_ids}
+
+
+def _finish_report_run(run_id: int) -> None:
+    # 마지막 청크가 여러 워커에서 동시에 끝나더라도 완료 처리는 한 번만 수행되도록 조건부 UPDATE를 사용합니다.
+    finished = ReportGenerationRun.objects.filter(pk=run_id, status=ReportGenerationRun.STATUS_RUNNING).update(
+        status=ReportGenerationRun.STATUS_COMPLETED, finished_at=timezone.now()
+    )
+    if not finished:
+        return
+    summary = ReportGenerationChunk.objects.filter(run_id=run_id).aggregate(
+        succeeded=Sum("succeeded_users"),
+        failed_chunks=Count("pk", filter=Q(status=ReportGenerationChunk.STATUS_FAILED)),
+    )
+    logger.info(
+        "Report generation run #%s completed: %s users succeeded, %s chunks failed.",
+        run_id,
+        summary["succeeded"] or 0,
+        summary["failed_chunks"],
+    )
+    run = ReportGenerationRun.objects.get(pk=run_id)
+    try:
+        notify_report_ready.delay(run.report_type, timezone.localdate(run.created_at).isoformat())
+    except Exception as e:
+        logger.error("Report-ready notification dispatch failed for run #%s: %s", run_id, e)
 
 
 @shared_task
-def generate_spending_report(user_id: int, period_type: str) -> str:
+def retry_failed_report_chunks(run_id: int) -> int:
+    """실행 기록에서 실패한 청크만 골라, 실패했던 사용자들만 대상으로 다시 실행합니다."""
+    run = ReportGenerationRun.objects.get(pk=run_id)
+    failed_chunks = list(run.chunks.filter(status=ReportGenerationChunk.STATUS_FAILED))
+    if not failed_chunks:
+        return 0
+    ReportGenerationChunk.objects.filter(pk__in=[chunk.pk for chunk in failed_chunks]).update(
+        status=ReportGenerationChunk.STATUS_PENDING
+    )
+    ReportGenerationRun.objects.filter(pk=run_id).update(status=ReportGenerationRun.STATUS_RUNNING, finished_at=None)
+    for chunk in failed_chunks:
+        generate_spending_reports_chunk.apply_async(
+            args=(chunk.pk, run.report_type), kwargs={"user_ids": chunk.failed_user_ids}
+        )
+    return len(failed_chunks)
+
+
+@shared_task
+def generate_spending_report(user_id: int, period_type: str, lock_day: Optional[str] = None) -> str:
     """
     지정된 사용자와 기간(주간/월간)에 대한 소비 리포트를 생성합니다.
 
-    이 태스크는 데이터베이스에서 직접 집계를 수행하여 효율적으로 처리합니다.
+    원본 거래 대신 일별 집계 테이블(DailyTransactionRollup)을 읽어 기간 내 카테고리별 합계를 계산합니다.
+    기간과 생성일은 설정된 TIME_ZONE 기준의 현지 날짜로 계산합니다.
+    API 요청으로 예약된 작업(`scheduling.request_spending_report`)은 잠금을 잡은 날짜(lock_day, ISO 형식)를 받아,
+    끝난 뒤 그 날짜의 생성 요청 잠금을 해제합니다. (작업이 자정을 넘겨 실행되어도 같은 잠금을 풉니다.)
     """
-    now: datetime = timezone.now()
+    now: datetime = timezone.localtime()
+    try:
+        return _generate_spending_report(user_id, period_type, now)
+    finally:
+        if lock_day is not None:
+            release_report_lock(user_id, period_type, date.fromisoformat(lock_day), generate_spending_report.request.id)
+
+
+def _generate_spending_report(user_id: int, period_type: str, now: datetime) -> str:
     today: date = now.date()
 
     try:
@@ -62,29 +271,19 @@ def generate_spending_report(user_id: int, period_type: str) -> str:
         logger.warning("리포트 생성 실패 (user: %s): %s", user_id, e)
         return f"리포트 생성 실패: 유효하지 않은 기간 유형 '{period_type}'."
 
-    # TransactionHistory는 account를 통해 User에 연결되므로, account__user_id로 필터링합니다.
-    transactions = TransactionHistory.objects.filter(
-        account__user_id=user_id,
-        created_at__range=(start_date, end_date),
-    ).order_by("created_at")
-
-    if transactions.exists():
-        # 입금 내역은 '수입' 카테고리로 분류하고, 출금 내역은 기존 카테고리를 사용합니다.
-        # Django ORM의 조건부 표현식을 사용하여 report_category를 정의합니다.
-        categorized_transactions = transactions.annotate(
-            report_category=Case(
-                When(transaction_type="DEPOSIT", then=Value(TransactionCategory.INCOME)),
-                default=F("category"),
-                output_field=CharField(),
-            )
-        )
+    # 집계를 읽기 전의 워터마크를 기록해야, 읽는 도중 바뀐 거래가 있으면 다음 요청에서 다시 생성됩니다.
+    watermark = rollup_watermark(user_id)
+    rollups = DailyTransactionRollup.objects.filter(user_id=user_id, day__range=(start_date.date(), end_date.date()))
 
-        # 카테고리별 지출 합계를 계산합니다.
-        category_spending = (
-            categorized_transactions.values("report_category")  # 새로운 report_category로 그룹화
-            .annotate(total_spending=Sum("amount"))  # 각 카테고리의 지출 합계 계산
-            .order_by("report_category")
-        )
+    # Django ORM의 조건부 표현식으로 report_category를 정의하고, 카테고리별 합계를 계산합니다.
+    category_spending = list(
+        _annotate_report_category(rollups)
+        .values("report_category")  # 새로운 report_category로 그룹화
+        .annotate(total_spending=Sum("total_amount"))  # 각 카테고리의 지출 합계 계산
+        .order_by("report_category")
+    )
+
+    if category_spending:
         # 데이터를 JSON 직렬화 가능한 형식으로 변환
         report_data: Dict[str, Any] = {
             "categories": [TransactionCategory(item["report_category"]).label for item in category_spending],
@@ -108,4 +307,104 @@ def generate_spending_report(user_id: int, period_type: str) -> str:
         logger.error("SpendingReport 저장 중 오류 발생 (user: %s, type: %s): %s", user_id, period_type, e)
         raise  # 오류를 다시 발생시켜 Celery가 실패를 기록하도록 함
 
+    remember_report_source(user_id, period_type, today, watermark)
+    # 리포트 화면이 목록을 다시 불러오도록 사용자에게 완료 이벤트를 보냅니다.
+    events.publish(user_id, "report.ready", {"report_type": period_type, "generated_date": today.isoformat()})
     return final_message
+
+
+def _report_progress(task, processed: int, total: int) -> None:
+    # 즉시 실행(eager) 모드에서는 결과 백엔드가 없으므로 진행 상황을 기록하지 않습니다.
+    if task.request.id and not task.request.is_eager:
+        task.update_state(state="PROGRESS", meta={"processed": processed, "total": total})
+
+
+def _classify_texts(texts: list[str]) -> Dict[str, Dict[str, Any]]:
+    """캐시에 없는 고유 텍스트만 모델 배치 크기 단위로 추론하고, {텍스트: 결과}를 반환합니다."""
+    results = sentiment_cache.get_many(texts)
+    uncached = list(dict.fromkeys(text for text in texts if text not in results))
+    batch_size = settings.SENTIMENT_INFERENCE_BATCH_SIZE
+    for i in range(0, len(uncached), batch_size):
+        batch = uncached[i : i + batch_size]
+        batch_results = dict(zip(batch, classify_batch(batch)))
+        sentiment_cache.set_many(batch_results)
+        results.update(batch_results)
+    return results
+
+
+@shared_task(bind=True)
+def analyze_transactions_sentiment(
+    self,
+    user_id: int,
+    transaction_ids: list[int] | None = None,
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> Dict[str, int]:
+    """
+    사용자의 여러 거래 내역을 한 번에 감정 분석합니다.
+
+    거래 내용(transaction_detail)을 배치 단위로 추론하고, 결과는 bulk_create로 한 번에 저장합니다.
+    이미 분석 결과가 있는 거래와 거래 내용이 비어 있는 거래는 건너뜁니다.
+    """
+    transactions = (
+        TransactionHistory.objects.filter(account__user_id=user_id, sentimentanalysis__isnull=True)
+        .exclude(transaction_detail__isnull=True)
+        .exclude(transaction_detail="")
+    )
+    if transaction_ids is not None:
+        transactions = transactions.filter(pk__in=transaction_ids)
+    if start_date:
+        transactions = transactions.filter(created_at__date__gte=start_date)
+    if end_date:
+        transactions = transactions.filter(created_at__date__lte=end_date)
+
+    rows = list(transactions.order_by("pk").values_list("pk", "transaction_detail"))
+    total = len(rows)
+    created = 0
+    chunk_size = settings.SENTIMENT_BULK_CHUNK_SIZE
+    _report_progress(self, 0, total)
+
+    for i in range(0, total, chunk_size):
+        chunk = rows[i : i + chunk_size]
+        results = _classify_texts([text for _pk, text in chunk])
+        analyses = [
+            SentimentAnalysis(
+                transaction_id=pk,
+                text_content=text,
+                sentiment=translate_label(results[text]["label"]),
+                score=results[text]["score"],
+            )
+            for pk, text in chunk
+        ]
+        created += len(SentimentAnalysis.objects.bulk_create(analyses))
+        _report_progress(self, min(i + chunk_size, total), total)
+
+    logger.info("Bulk sentiment analysis finished (user: %s, created: %s).", user_id, created)
+    events.publish(user_id, "sentiment.bulk_done", {"processed": total, "created": created})
+    return {"processed": total, "total": total, "created": created}
+
+
+@shared_task
+def analyze_sentiment(transaction_id: int, text_content: str) -> Dict[str, Any]:
+    """
+    거래 내역 하나의 메모를 감정 분석하고 결과를 저장합니다.
+
+    `inference` 큐를 소비하는 모델 전용 워커에서 실행되며, 스레드 풀 워커에서는
+    동시에 실행 중인 태스크들이 마이크로 배치 엔진을 통해 하나의 배치로 묶입니다.
+    """
+    result = sentiment_cache.get(text_content)
+    if result is None:
+        result = inference_engine.predict(text_content, timeout=settings.SENTIMENT_INFERENCE_TIMEOUT)
+        sentiment_cache.set(text_content, result)
+
+    analysis = SentimentAnalysis.objects.create(
+        transaction_id=transaction_id,
+        text_content=text_content,
+        sentiment=translate_label(result["label"]),
+        score=result["score"],
+    )
+    data = {"analysis_id": analysis.pk, "sentiment": analysis.sentiment, "score": analysis.score}
+    user_id = TransactionHistory.objects.filter(pk=transaction_id).values_list("account__user_id", flat=True).first()
+    if user_id is not None:
+        events.publish(user_id, "sentiment.done", {"transaction_id": transaction_id, **data})
+    return data
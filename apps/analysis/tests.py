@@ -1 +1,625 @@
-# Create your tests here.
+import io
+import sys
+import tempfile
+import threading
+import weakref
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+import numpy as np
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.accounts.models import Account
+from apps.analysis.backends import BACKEND_ONNX, BACKENDS, OnnxSentimentClassifier, load_classifier
+from apps.analysis.cache import LocalLRUCache, SentimentResultCache, sentiment_cache
+from apps.analysis.inference import BatchedInferenceEngine, translate_label
+from apps.analysis.models import (
+    ReportGenerationChunk,
+    ReportGenerationRun,
+    SentimentAnalysis,
+    SpendingReport,
+)
+from apps.analysis.registry import SentimentModelRegistry, sentiment_model
+from apps.analysis.tasks import (
+    analyze_sentiment,
+    analyze_transactions_sentiment,
+    generate_spending_report,
+    generate_spending_reports_bulk,
+    retry_failed_report_chunks,
+    schedule_all_user_reports,
+)
+from apps.notifications.models import Notification
+from apps.transaction_history.ledger import record_transaction
+from apps.transaction_history.models import TransactionHistory
+from apps.transaction_history.rollups import rebuild_rollups
+from apps.users.models import CustomUser
+from config.celery import app as celery_app
+
+
+class BatchedInferenceEngineTestCase(SimpleTestCase):
+    def test_concurrent_requests_are_batched(self):
+        """동시에 들어온 요청이 하나의 배치로 묶여 처리되고, 각 호출자에게 자신의 결과가 돌아오는지 테스트"""
+        batch_sizes = []
+
+        def predict_batch(texts):
+            batch_sizes.append(len(texts))
+            return [{"label": "LABEL_1", "score": len(text)} for text in texts]
+
+        engine = BatchedInferenceEngine(predict_batch, max_batch_size=8, max_wait_ms=200)
+        texts = ["a" * i for i in range(1, 9)]
+        results = {}
+        barrier = threading.Barrier(len(texts))
+
+        def client(text):
+            barrier.wait()
+            results[text] = engine.predict(text, timeout=5)
+
+        threads = [threading.Thread(target=client, args=(text,)) for text in texts]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sum(batch_sizes), len(texts))
+        self.assertLess(len(batch_sizes), len(texts))
+        for text in texts:
+            self.assertEqual(results[text]["score"], len(text))
+
+    def test_model_error_is_propagated_to_callers(self):
+        """모델 실행 중 발생한 예외가 호출자에게 전달되는지 테스트"""
+
+        def predict_batch(texts):
+            raise RuntimeError("model failure")
+
+        engine = BatchedInferenceEngine(predict_batch, max_batch_size=4, max_wait_ms=1)
+        with self.assertRaises(RuntimeError):
+            engine.predict("커피", timeout=5)
+
+    def test_translate_label(self):
+        """모델 라벨이 한국어 감정 라벨로 변환되는지 테스트"""
+        self.assertEqual(translate_label("LABEL_1"), "긍정")
+        self.assertEqual(translate_label("LABEL_0"), "부정")
+        self.assertEqual(translate_label("UNKNOWN"), "중립")
+
+
+class SentimentAnalysisAPITestCase(APITestCase):
+    def setUp(self):
+        """테스트 케이스를 위한 초기 설정"""
+        self.user = CustomUser.objects.create_user(
+            email="testuser@example.com",
+            password="password123",
+            name="Test User",
+            nickname="testuser",
+            phone_number="01012345678",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="110-220-330440",
+            bank_code="088",
+            account_type="checking",
+            balance=Decimal("100000.00"),
+        )
+        self.transaction = TransactionHistory.objects.create(
+            account=self.account,
+            transaction_type="WITHDRAW",
+            amount=Decimal("4500.00"),
+            balance_after=Decimal("95500.00"),
+            transaction_detail="커피",
+            transaction_method="CARD",
+        )
+        self.url = reverse("sentiment_analysis_api", kwargs={"transaction_id": self.transaction.pk})
+        sentiment_cache.clear_local()
+        cache.clear()
+
+    def test_list_searches_text_content(self):
+        """분석 목록 API가 현재 사용자의 분석 결과를 메모 내용으로 검색하는지 테스트"""
+        matching = SentimentAnalysis.objects.create(
+            transaction=self.transaction, text_content="오늘 마신 커피가 정말 맛있었다", sentiment="긍정", score=0.9
+        )
+        SentimentAnalysis.objects.create(
+            transaction=self.transaction, text_content="너무 비쌌다", sentiment="부정", score=0.8
+        )
+
+        response = self.client.get(reverse("sentiment_analysis_list_api"), {"text_content": "커피가 정말"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["id"], matching.id)
+
+    def test_model_is_not_loaded_at_import(self):
+        """URL 설정(및 views 모듈)을 import해도 모델이 로드되지 않는지 테스트"""
+        self.assertFalse(sentiment_model.is_loaded)
+
+    def test_sentiment_analysis_saves_result(self):
+        """감정 분석 결과가 저장되고 한국어 라벨로 반환되는지 테스트"""
+        classifier = mock.Mock(side_effect=lambda texts, **kwargs: [{"label": "LABEL_1", "score": 0.9} for _ in texts])
+        with mock.patch.object(sentiment_model, "get_classifier", return_value=classifier):
+            response = self.client.post(self.url, {"text_content": "맛있는 커피"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["sentiment"], "긍정")
+        analysis = SentimentAnalysis.objects.get(transaction=self.transaction)
+        self.assertEqual(analysis.text_content, "맛있는 커피")
+        self.assertEqual(analysis.score, 0.9)
+
+    def test_repeated_text_does_not_touch_model(self):
+        """같은 메모 텍스트를 다시 분석하면 모델을 호출하지 않고 캐시된 결과를 사용하는지 테스트"""
+        classifier = mock.Mock(side_effect=lambda texts, **kwargs: [{"label": "LABEL_0", "score": 0.7} for _ in texts])
+        with mock.patch.object(sentiment_model, "get_classifier", return_value=classifier):
+            self.client.post(self.url, {"text_content": "택시"}, format="json")
+            response = self.client.post(self.url, {"text_content": "  택시 "}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["sentiment"], "부정")
+        self.assertEqual(classifier.call_count, 1)
+        self.assertEqual(SentimentAnalysis.objects.filter(transaction=self.transaction).count(), 2)
+
+    def test_async_mode_enqueues_inference_task(self):
+        """비동기 모드에서는 모델을 실행하지 않고 작업을 등록한 뒤 202와 상태 조회 URL을 반환하는지 테스트"""
+        with (
+            mock.patch.object(analyze_sentiment, "delay", return_value=mock.Mock(id="task-1")) as delay,
+            mock.patch.object(sentiment_model, "get_classifier") as get_classifier,
+        ):
+            response = self.client.post(self.url, {"text_content": "커피", "async": True}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["status_url"], reverse("task_status_api", kwargs={"task_id": "task-1"}))
+        delay.assert_called_once_with(self.transaction.pk, "커피")
+        get_classifier.assert_not_called()
+
+    def test_task_status_does_not_wait_for_result(self):
+        """작업 상태 조회 API가 작업이 끝나기를 기다리지 않고 현재 상태를 바로 반환하는지 테스트"""
+        with mock.patch.object(analyze_sentiment, "delay", return_value=mock.Mock(id="task-1")):
+            status_url = self.client.post(self.url, {"text_content": "커피", "async": True}, format="json").data[
+                "status_url"
+            ]
+
+        pending = mock.Mock(status="PENDING")
+        pending.ready.return_value = pending.successful.return_value = pending.failed.return_value = False
+        with mock.patch("apps.analysis.views.AsyncResult", return_value=pending):
+            response = self.client.get(status_url + "?wait=10")
+
+        self.assertEqual(response.data, {"task_id": "task-1", "status": "PENDING"})
+        pending.get.assert_not_called()
+
+    def test_analyze_sentiment_task_saves_result(self):
+        """inference 큐의 감정 분석 태스크가 결과를 저장하고 반환하는지 테스트"""
+        classifier = mock.Mock(side_effect=lambda texts, **kwargs: [{"label": "LABEL_0", "score": 0.55} for _ in texts])
+        with mock.patch.object(sentiment_model, "get_classifier", return_value=classifier):
+            result = analyze_sentiment.apply(args=(self.transaction.pk, "야근 후 택시")).get()
+
+        analysis = SentimentAnalysis.objects.get(transaction=self.transaction)
+        self.assertEqual(result, {"analysis_id": analysis.pk, "sentiment": "부정", "score": 0.55})
+
+
+class BulkSentimentAnalysisTestCase(APITestCase):
+    def setUp(self):
+        """테스트 케이스를 위한 초기 설정"""
+        self.user = CustomUser.objects.create_user(
+            email="testuser@example.com",
+            password="password123",
+            name="Test User",
+            nickname="testuser",
+            phone_number="01012345678",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="110-220-330440",
+            bank_code="088",
+            account_type="checking",
+            balance=Decimal("100000.00"),
+        )
+        self.transactions = [
+            TransactionHistory.objects.create(
+                account=self.account,
+                transaction_type="WITHDRAW",
+                amount=Decimal("1000.00"),
+                balance_after=Decimal("99000.00"),
+                transaction_detail=detail,
+                transaction_method="CARD",
+            )
+            for detail in ["커피", "점심", "커피", ""]
+        ]
+        sentiment_cache.clear_local()
+        cache.clear()
+
+    def test_task_classifies_unique_texts_in_batches(self):
+        """일괄 분석 태스크가 고유 텍스트만 추론하고 결과를 한 번에 저장하는지 테스트"""
+        classifier = mock.Mock(side_effect=lambda texts, **kwargs: [{"label": "LABEL_1", "score": 0.6} for _ in texts])
+        with mock.patch.object(sentiment_model, "get_classifier", return_value=classifier):
+            result = analyze_transactions_sentiment.apply(
+                args=(self.user.id,), kwargs={"transaction_ids": [t.pk for t in self.transactions]}
+            ).get()
+
+        self.assertEqual(result, {"processed": 3, "total": 3, "created": 3})
+        self.assertEqual(classifier.call_count, 1)
+        self.assertCountEqual(classifier.call_args.args[0], ["커피", "점심"])
+        self.assertEqual(SentimentAnalysis.objects.filter(sentiment="긍정").count(), 3)
+
+    def test_bulk_endpoint_dispatches_task(self):
+        """일괄 분석 API가 Celery 태스크를 등록하고, 요청한 사용자만 작업 상태를 조회할 수 있는지 테스트"""
+        with mock.patch.object(analyze_transactions_sentiment, "delay", return_value=mock.Mock(id="task-1")) as delay:
+            response = self.client.post(
+                reverse("bulk_sentiment_analysis_api"), {"start_date": "2025-01-01"}, format="json"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["task_id"], "task-1")
+        delay.assert_called_once_with(self.user.id, transaction_ids=None, start_date="2025-01-01", end_date=None)
+
+        other_user = CustomUser.objects.create_user(
+            email="other@example.com", password="password123", name="Other", nickname="other"
+        )
+        self.client.force_authenticate(user=other_user)
+        response = self.client.get(reverse("task_status_api", kwargs={"task_id": "task-1"}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_bulk_endpoint_requires_ids_or_date_range(self):
+        """거래 ID 목록이나 기간 없이 요청하면 400을 반환하는지 테스트"""
+        response = self.client.post(reverse("bulk_sentiment_analysis_api"), {}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@override_settings(REPORT_SCHEDULE_CHUNK_SIZE=2, REPORT_SCHEDULE_CONCURRENCY=2)
+class ScheduleAllUserReportsTestCase(TestCase):
+    def setUp(self):
+        """테스트 케이스를 위한 초기 설정"""
+        self.users = [
+            CustomUser.objects.create_user(
+                email=f"user{i}@example.com", password="password123", name=f"User {i}", nickname=f"user{i}"
+            )
+            for i in range(5)
+        ]
+        CustomUser.objects.create_user(
+            email="inactive@example.com", password="password123", name="Inactive", nickname="inactive", is_active=False
+        )
+        # 태스크를 브로커 없이 즉시 실행합니다.
+        celery_app.conf.task_always_eager = True
+        self.addCleanup(setattr, celery_app.conf, "task_always_eager", False)
+
+    def test_reports_are_generated_in_chunks(self):
+        """활성 사용자를 청크 단위로 나누어 리포트를 생성하고 실행 완료를 기록하는지 테스트"""
+        run_id = schedule_all_user_reports("weekly")
+
+        run = ReportGenerationRun.objects.get(pk=run_id)
+        self.assertEqual(run.status, ReportGenerationRun.STATUS_COMPLETED)
+        self.assertEqual((run.total_users, run.total_chunks), (5, 3))
+        self.assertEqual(
+            list(run.chunks.values_list("status", flat=True)), [ReportGenerationChunk.STATUS_SUCCEEDED] * 3
+        )
+        self.assertEqual(SpendingReport.objects.filter(report_type="weekly").count(), 5)
+        # 실행이 끝나면 리포트를 받은 사용자들에게 알림을 보냅니다.
+        self.assertEqual(Notification.objects.filter(user__in=self.users).count(), 5)
+
+    def test_only_failed_chunks_are_retried(self):
+        """일부 사용자가 실패하면 해당 청크만 실패로 기록되고, 재실행 시 실패한 사용자만 처리하는지 테스트"""
+        from apps.analysis import tasks
+
+        failing_user = self.users[3]
+        original_bulk = tasks.generate_spending_reports_bulk
+        original = tasks.generate_spending_report
+
+        def flaky_bulk(user_ids, period_type):
+            if failing_user.id in user_ids:
+                raise RuntimeError("temporary failure")
+            return original_bulk(user_ids, period_type)
+
+        def flaky(user_id, period_type):
+            if user_id == failing_user.id:
+                raise RuntimeError("temporary failure")
+            return original(user_id, period_type)
+
+        with (
+            mock.patch.object(tasks, "generate_spending_reports_bulk", side_effect=flaky_bulk),
+            mock.patch.object(tasks, "generate_spending_report", side_effect=flaky),
+        ):
+            run_id = schedule_all_user_reports("monthly")
+
+        failed_chunks = ReportGenerationChunk.objects.filter(run_id=run_id, status=ReportGenerationChunk.STATUS_FAILED)
+        self.assertEqual([chunk.failed_user_ids for chunk in failed_chunks], [[failing_user.id]])
+        self.assertFalse(SpendingReport.objects.filter(user=failing_user).exists())
+        # 같은 청크의 다른 사용자는 사용자별 생성으로 처리됩니다.
+        self.assertEqual(SpendingReport.objects.filter(report_type="monthly").count(), 4)
+
+        with mock.patch.object(tasks, "generate_spending_reports_bulk", wraps=original_bulk) as generate:
+            self.assertEqual(retry_failed_report_chunks(run_id), 1)
+
+        generate.assert_called_once_with([failing_user.id], "monthly")
+        self.assertEqual(ReportGenerationRun.objects.get(pk=run_id).status, ReportGenerationRun.STATUS_COMPLETED)
+        self.assertEqual(SpendingReport.objects.filter(report_type="monthly").count(), 5)
+
+
+class GenerateSpendingReportsBulkTestCase(TestCase):
+    def setUp(self):
+        """테스트 케이스를 위한 초기 설정"""
+        self.users = [
+            CustomUser.objects.create_user(
+                email=f"bulk{i}@example.com", password="password123", name=f"Bulk {i}", nickname=f"bulk{i}"
+            )
+            for i in range(3)
+        ]
+        for i, user in enumerate(self.users[:2]):
+            account = Account.objects.create(
+                user=user, account_number=f"110-220-33044{i}", bank_code="088", account_type="checking"
+            )
+            for transaction_type, category, amount in [
+                ("WITHDRAW", "FOOD", "4500.00"),
+                ("WITHDRAW", "FOOD", "1500.50"),
+                ("WITHDRAW", "SHOPPING", "30000.00"),
+                ("DEPOSIT", "OTHER", "100000.00"),
+            ]:
+                TransactionHistory.objects.create(
+                    account=account,
+                    transaction_type=transaction_type,
+                    category=category,
+                    amount=Decimal(amount) * (i + 1),
+                    balance_after=Decimal("0.00"),
+                    transaction_method="CARD",
+                )
+        rebuild_rollups()
+
+    def test_bulk_reports_match_per_user_reports(self):
+        """일괄 생성 결과가 사용자별 생성 결과와 같고, 한 번의 집계와 한 번의 UPSERT로 처리되는지 테스트"""
+        user_ids = [user.id for user in self.users]
+        for user_id in user_ids:
+            generate_spending_report(user_id, "monthly")
+        expected = dict(SpendingReport.objects.values_list("user_id", "json_data"))
+        SpendingReport.objects.update(json_data={})
+
+        with self.assertNumQueries(2):
+            self.assertEqual(generate_spending_reports_bulk(user_ids, "monthly"), 3)
+
+        self.assertEqual(dict(SpendingReport.objects.values_list("user_id", "json_data")), expected)
+        self.assertEqual(expected[self.users[2].id], {"categories": [], "spending": []})
+        self.assertEqual(SpendingReport.objects.count(), 3)
+
+
+class ReportListAPITestCase(APITestCase):
+    def setUp(self):
+        """테스트 케이스를 위한 초기 설정"""
+        self.user = CustomUser.objects.create_user(
+            email="reports@example.com", password="password123", nickname="reports"
+        )
+        self.client.force_authenticate(user=self.user)
+        for day in range(1, 4):
+            SpendingReport.objects.create(
+                user=self.user,
+                report_type="weekly",
+                generated_date=f"2025-01-0{day}",
+                json_data={"categories": ["식비"], "spending": [day * 1000.0]},
+            )
+        self.url = reverse("report_list_api")
+
+    def test_paginated_slim_list_and_detail(self):
+        """목록은 페이지 단위로, slim 모드는 json_data 없이 반환하고 리포트 데이터는 상세 API로 조회하는지 테스트"""
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {"page_size": 2, "slim": "true"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 3)
+        self.assertIsNotNone(response.data["next"])
+        self.assertEqual(
+            [report["generated_date"] for report in response.data["reports"]], ["2025-01-03", "2025-01-02"]
+        )
+        self.assertNotIn("json_data", response.data["reports"][0])
+
+        detail = self.client.get(reverse("report_detail_api", kwargs={"report_id": response.data["reports"][0]["id"]}))
+        self.assertEqual(detail.data["json_data"], {"categories": ["식비"], "spending": [3000.0]})
+
+        other = CustomUser.objects.create_user(
+            email="other-reports@example.com", password="password123", nickname="other-reports"
+        )
+        report = SpendingReport.objects.create(user=other, report_type="weekly", generated_date="2025-01-01")
+        detail = self.client.get(reverse("report_detail_api", kwargs={"report_id": report.pk}))
+        self.assertEqual(detail.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_unchanged_list_returns_not_modified(self):
+        """리포트가 바뀌지 않으면 304를, 같은 날 리포트가 다시 생성되면 새 ETag로 200을 반환하는지 테스트"""
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+        # 다른 페이지나 slim 모드는 다른 표현이므로 ETag도 다릅니다.
+        self.assertNotEqual(self.client.get(self.url, {"slim": "1"})["ETag"], etag)
+
+        report = SpendingReport.objects.get(generated_date="2025-01-03")
+        report.json_data = {"categories": [], "spending": []}
+        report.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+
+class GenerateReportDeduplicationTestCase(APITestCase):
+    def setUp(self):
+        """테스트 케이스를 위한 초기 설정"""
+        cache.clear()
+        self.user = CustomUser.objects.create_user(email="dedup@example.com", password="password123", nickname="dedup")
+        self.account = Account.objects.create(
+            user=self.user, account_number="110-220-330450", bank_code="088", balance=Decimal("100000.00")
+        )
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("generate_report_api", kwargs={"period_type": "weekly"})
+
+    def _withdraw(self, amount):
+        with self.captureOnCommitCallbacks(execute=True):
+            record_transaction(
+                TransactionHistory(
+                    account=self.account,
+                    transaction_type="WITHDRAW",
+                    category="FOOD",
+                    amount=Decimal(amount),
+                    transaction_method="CARD",
+                )
+            )
+
+    def test_duplicate_request_returns_running_task(self):
+        """생성 중인 리포트를 다시 요청하면 새 작업을 만들지 않고 실행 중인 작업의 ID를 반환하는지 테스트"""
+        with mock.patch.object(generate_spending_report, "apply_async") as apply_async:
+            first = self.client.post(self.url)
+            second = self.client.post(self.url)
+
+        self.assertEqual(apply_async.call_count, 1)
+        self.assertEqual((first.status_code, first.data["status"]), (status.HTTP_202_ACCEPTED, "queued"))
+        self.assertEqual((second.status_code, second.data["status"]), (status.HTTP_202_ACCEPTED, "in_progress"))
+        self.assertEqual(second.data["task_id"], first.data["task_id"])
+
+    def test_unchanged_transactions_skip_regeneration(self):
+        """리포트를 만든 뒤 거래가 바뀌지 않았으면 건너뛰고, 거래가 추가되면 다시 생성하는지 테스트"""
+        self._withdraw("4500.00")
+
+        def run_task(args, kwargs, task_id):
+            with self.captureOnCommitCallbacks(execute=True):
+                return generate_spending_report.apply(args, kwargs, task_id=task_id)
+
+        with mock.patch.object(generate_spending_report, "apply_async", side_effect=run_task) as apply_async:
+            self.assertEqual(self.client.post(self.url).data["status"], "queued")
+            response = self.client.post(self.url)
+            self.assertEqual((response.status_code, response.data["status"]), (status.HTTP_200_OK, "up_to_date"))
+            self.assertEqual(apply_async.call_count, 1)
+
+            self._withdraw("1500.00")
+            self.assertEqual(self.client.post(self.url).data["status"], "queued")
+            self.assertEqual(apply_async.call_count, 2)
+
+        report = SpendingReport.objects.get(user=self.user, report_type="weekly")
+        self.assertEqual(report.json_data["spending"], [6000.0])
+
+    def test_task_past_midnight_releases_requested_day_lock(self):
+        """작업이 자정을 넘겨 실행되어도 요청 시점 날짜의 잠금을 해제하는지 테스트"""
+        with mock.patch.object(generate_spending_report, "apply_async") as apply_async:
+            self.assertEqual(self.client.post(self.url).data["status"], "queued")
+        args, kwargs = apply_async.call_args.args[0], apply_async.call_args.kwargs
+        self.assertEqual(kwargs["kwargs"], {"lock_day": timezone.localdate().isoformat()})
+
+        tomorrow = timezone.localtime() + timedelta(days=1)
+        with mock.patch("apps.analysis.tasks.timezone.localtime", return_value=tomorrow):
+            with self.captureOnCommitCallbacks(execute=True):
+                generate_spending_report.apply(args, kwargs["kwargs"], task_id=kwargs["task_id"])
+
+        with mock.patch.object(generate_spending_report, "apply_async"):
+            self.assertEqual(self.client.post(self.url).data["status"], "queued")
+
+    def test_dispatch_failure_releases_lock(self):
+        """작업 전달에 실패하면 잠금을 풀어 다음 요청이 새 작업을 만들 수 있는지 테스트"""
+        with mock.patch.object(generate_spending_report, "apply_async", side_effect=ConnectionError):
+            response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        with mock.patch.object(generate_spending_report, "apply_async") as apply_async:
+            self.assertEqual(self.client.post(self.url).data["status"], "queued")
+        apply_async.assert_called_once()
+
+
+class SentimentResultCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.cache = SentimentResultCache({"LOCAL_MAX_SIZE": 10, "LOCAL_TTL": 60, "SHARED_TTL": 60})
+
+    def test_shared_cache_fills_local_cache(self):
+        """로컬 캐시에 없으면 공유 캐시에서 찾아 로컬 캐시를 채우고, 적중/실패 횟수를 기록하는지 테스트"""
+        self.cache.set("점심", {"label": "LABEL_1", "score": 0.8})
+        self.cache.clear_local()
+
+        self.assertEqual(self.cache.get("점심"), {"label": "LABEL_1", "score": 0.8})
+        self.assertEqual(self.cache.get("점심"), {"label": "LABEL_1", "score": 0.8})
+        self.assertIsNone(self.cache.get("저녁"))
+        self.assertEqual(self.cache.stats, {"local_hits": 1, "shared_hits": 1, "misses": 1})
+
+    def test_model_version_change_invalidates_results(self):
+        """모델 버전이 바뀌면 이전 버전의 결과를 사용하지 않는지 테스트"""
+        self.cache.set("커피", {"label": "LABEL_1", "score": 0.8})
+        with mock.patch.object(sentiment_model, "revision", "new-revision"):
+            self.assertIsNone(self.cache.get("커피"))
+
+    def test_local_cache_evicts_least_recently_used(self):
+        """로컬 LRU 캐시가 최대 크기를 넘으면 가장 오래 사용하지 않은 항목을 제거하는지 테스트"""
+        local = LocalLRUCache(max_size=2, ttl=60)
+        local.set("a", 1)
+        local.set("b", 2)
+        local.get("a")
+        local.set("c", 3)
+        self.assertIsNone(local.get("b"))
+        self.assertEqual(local.get("a"), 1)
+        self.assertEqual(len(local), 2)
+
+
+class SentimentBackendTestCase(SimpleTestCase):
+    def test_unknown_backend_is_rejected(self):
+        """알 수 없는 추론 백엔드를 설정하면 ImproperlyConfigured를 발생시키는지 테스트"""
+        with self.assertRaisesMessage(ImproperlyConfigured, "Unknown sentiment inference backend: 'tensorflow'"):
+            load_classifier("tensorflow", "model", "main")
+
+    def test_onnx_backend_requires_exported_model(self):
+        """onnx 백엔드의 모델 디렉터리에 model.onnx가 없으면 ImproperlyConfigured를 발생시키는지 테스트"""
+        with tempfile.TemporaryDirectory() as model_dir, mock.patch.dict(sys.modules, {"onnxruntime": mock.Mock()}):
+            with self.assertRaisesMessage(ImproperlyConfigured, "Run 'manage.py export_sentiment_model' first."):
+                load_classifier(BACKEND_ONNX, "model", "main", onnx_model_dir=model_dir)
+
+    def test_backend_is_part_of_model_version(self):
+        """추론 백엔드가 바뀌면 모델 버전이 달라져 백엔드별로 캐시된 결과가 분리되는지 테스트"""
+        versions = {SentimentModelRegistry("model", "main", backend=backend).version for backend in BACKENDS}
+        self.assertEqual(len(versions), len(BACKENDS))
+
+        cache.clear()
+        result_cache = SentimentResultCache({"LOCAL_MAX_SIZE": 10, "LOCAL_TTL": 60, "SHARED_TTL": 60})
+        result_cache.set("커피", {"label": "LABEL_1", "score": 0.8})
+        with mock.patch.object(sentiment_model, "backend", BACKEND_ONNX):
+            self.assertIsNone(result_cache.get("커피"))
+
+    def test_onnx_classifier_formats_softmax_as_pipeline_output(self):
+        """ONNX 분류기가 logits에 softmax를 적용해 파이프라인과 같은 형식으로 반환하는지 테스트"""
+        classifier = OnnxSentimentClassifier.__new__(OnnxSentimentClassifier)
+        classifier.tokenizer = mock.Mock(
+            return_value={"input_ids": np.array([[1, 2], [3, 4]]), "token_type_ids": np.zeros((2, 2))}
+        )
+        classifier.input_names = {"input_ids"}
+        classifier.session = mock.Mock()
+        classifier.session.run.return_value = [np.array([[0.0, np.log(3.0)], [np.log(4.0), 0.0]])]
+        classifier.id2label = {0: "LABEL_0", 1: "LABEL_1"}
+
+        results = classifier(["커피", "택시"], batch_size=2)
+
+        self.assertEqual([result["label"] for result in results], ["LABEL_1", "LABEL_0"])
+        self.assertAlmostEqual(results[0]["score"], 0.75)
+        self.assertAlmostEqual(results[1]["score"], 0.8)
+        classifier.tokenizer.assert_called_once_with(
+            ["커피", "택시"], padding=True, truncation=True, return_tensors="np"
+        )
+        inputs = classifier.session.run.call_args.args[1]
+        self.assertEqual(list(inputs), ["input_ids"])
+        self.assertEqual(inputs["input_ids"].dtype, np.int64)
+
+    def test_evaluate_command_releases_each_backend_before_loading_the_next(self):
+        """백엔드 비교 명령이 다음 백엔드를 로드하기 전에 이전 모델을 해제하는지 테스트"""
+        alive = weakref.WeakSet()
+        alive_at_load = []
+
+        def load(*args, **kwargs):
+            def classifier(texts, **kwargs):
+                return [{"label": "LABEL_1", "score": 0.9} for _ in texts]
+
+            alive_at_load.append(len(alive))
+            alive.add(classifier)
+            return classifier
+
+        out = io.StringIO()
+        with mock.patch("apps.analysis.registry.load_classifier", side_effect=load):
+            call_command("evaluate_sentiment_backends", backends="torch-int8,torch", repeat=1, stdout=out)
+
+        self.assertEqual(alive_at_load, [0, 0])
+        self.assertIn("agreement:   100.0% of labels match torch", out.getvalue())
+
+    def test_evaluate_command_rejects_unknown_backend(self):
+        with self.assertRaisesMessage(CommandError, "Unknown backends: tensorflow"):
+            call_command("evaluate_sentiment_backends", backends="torch,tensorflow")
@@ -7,5 +7,9 @@ urlpatterns = [
     path(
         "transactions/<int:transaction_id>/sentiment/", views.sentiment_analysis_api_view, name="sentiment_analysis_api"
     ),
+    path("sentiment/", views.sentiment_analysis_list_api_view, name="sentiment_analysis_list_api"),
     path("reports/", views.report_list_api_view, name="report_list_api"),
+    path("reports/<int:report_id>/", views.report_detail_api_view, name="report_detail_api"),
+    path("sentiment/bulk/", views.bulk_sentiment_analysis_api_view, name="bulk_sentiment_analysis_api"),
+    path("tasks/<str:task_id>/", views.task_status_api_view, name="task_status_api"),
 ]
@@ -1,23 +1,53 @@
+import hashlib
 import logging
 
+from celery.result import AsyncResult
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
 from rest_framework.response import Response
-from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
 
 from apps.transaction_history.models import TransactionHistory
+from core.views import async_read_view, json_response
 
+from . import scheduling
+from .cache import sentiment_cache
+from .filters import AnalysisFilter
+from .inference import inference_engine, translate_label
 from .models import SentimentAnalysis, SpendingReport
-from .serializers import SpendingReportSerializer
-from .tasks import generate_spending_report
+from .pagination import ReportPagination
+from .scheduling import request_spending_report
+from .serializers import (
+    BulkSentimentAnalysisSerializer,
+    SentimentAnalysisSerializer,
+    SpendingReportSerializer,
+    SpendingReportSummarySerializer,
+)
+from .tasks import analyze_sentiment, analyze_transactions_sentiment
 
-# Load the sentiment analysis model and tokenizer once when the module is loaded.
-# This is more efficient than loading it on every request.
-MODEL_NAME = "kykim/bert-kor-base"
-tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
-model = AutoModelForSequenceClassification.from_pretrained(MODEL_NAME)
-sentiment_classifier = pipeline("sentiment-analysis", model=model, tokenizer=tokenizer)
+TASK_OWNER_CACHE_KEY = "analysis:task-owner:{task_id}"
+TASK_OWNER_TTL = 24 * 60 * 60  # 작업 상태 조회 권한을 하루 동안 유지합니다.
+ANALYSIS_LIST_PAGE_SIZE = 20
+REPORT_LIST_STATS = {"count": Count("pk"), "last_updated": Max("updated_at")}
+
+
+def _remember_task_owner(task_id, user_id):
+    # 작업 상태는 작업을 요청한 사용자만 조회할 수 있도록 소유자를 기록해 둡니다.
+    cache.set(TASK_OWNER_CACHE_KEY.format(task_id=task_id), user_id, TASK_OWNER_TTL)
+
+
+def _wants_async(request):
+    value = request.data.get("async", settings.SENTIMENT_ASYNC_INFERENCE)
+    return value is True or str(value).lower() in ("1", "true")
 
 
 @api_view(["POST"])
@@ -29,8 +59,8 @@ def generate_report_api_view(request, period_type):
         )
 
     try:
-        # Celery 태스크를 비동기적으로 실행하며, 현재 로그인한 사용자의 ID를 전달합니다.
-        generate_spending_report.delay(request.user.id, period_type)
+        # 같은 리포트를 생성 중이거나 거래가 바뀌지 않았으면 새 작업을 만들지 않습니다.
+        report_request = request_spending_report(request.user.id, period_type)
     except Exception as e:
         # Redis 연결 실패 등 Celery 작업 전달 중 발생할 수 있는 예외 처리
         logging.getLogger(__name__).error(f"Celery task dispatch failed for user {request.user.id}: {e}")
@@ -39,8 +69,29 @@ def generate_report_api_view(request, period_type):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR,
         )
 
+    if report_request.status == scheduling.UP_TO_DATE:
+        return Response(
+            {
+                "message": f"{period_type.capitalize()} spending report is already up to date.",
+                "status": report_request.status,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    task_id = report_request.task_id
+    _remember_task_owner(task_id, request.user.id)
+    message = (
+        f"{period_type.capitalize()} spending report generation initiated."
+        if report_request.status == scheduling.QUEUED
+        else f"{period_type.capitalize()} spending report is already being generated."
+    )
     return Response(
-        {"message": f"{period_type.capitalize()} spending report generation initiated."},
+        {
+            "message": message,
+            "status": report_request.status,
+            "task_id": task_id,
+            "status_url": reverse("task_status_api", kwargs={"task_id": task_id}),
+        },
         status=status.HTTP_202_ACCEPTED,
     )
 
@@ -57,20 +108,36 @@ def sentiment_analysis_api_view(request, transaction_id):
     if not text_content:
         return Response({"error": "Text content is required."}, status=status.HTTP_400_BAD_REQUEST)
 
-    # Perform sentiment analysis using the loaded pipeline
+    # 비동기 모드: 웹 워커에서 모델을 실행하지 않고 inference 큐에 작업을 넘깁니다.
+    if _wants_async(request):
+        try:
+            task = analyze_sentiment.delay(transaction.pk, text_content)
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Celery task dispatch failed for user {request.user.id}: {e}")
+            return Response(
+                {"error": "감정 분석 작업을 시작하지 못했습니다. 서버 관리자에게 문의하세요."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        _remember_task_owner(task.id, request.user.id)
+        return Response(
+            {
+                "message": "Sentiment analysis queued.",
+                "task_id": task.id,
+                "status_url": reverse("task_status_api", kwargs={"task_id": task.id}),
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+    # Perform sentiment analysis through the micro-batching engine, reusing cached results for repeated texts
     try:
-        analysis_results = sentiment_classifier(text_content)
-        result = analysis_results[0]
-        model_label = result["label"]
+        result = sentiment_cache.get(text_content)
+        if result is None:
+            result = inference_engine.predict(text_content, timeout=settings.SENTIMENT_INFERENCE_TIMEOUT)
+            sentiment_cache.set(text_content, result)
         score = result["score"]
 
         # Translate the model's label ('LABEL_1' or 'LABEL_0') to Korean
-        if model_label == "LABEL_1":
-            sentiment = "긍정"
-        elif model_label == "LABEL_0":
-            sentiment = "부정"
-        else:
-            sentiment = "중립"  # Fallback for any unexpected labels
+        sentiment = translate_label(result["label"])
 
     except Exception as e:
         logging.getLogger(__name__).error(f"Sentiment analysis model failed: {e}")
@@ -94,13 +161,147 @@ def sentiment_analysis_api_view(request, transaction_id):
     )
 
 
+def _wants_slim(request):
+    return request.GET.get("slim", "").lower() in ("1", "true")
+
+
+def _report_list_queryset(user, slim):
+    reports = SpendingReport.objects.filter(user=user).order_by("-generated_date", "-created_at")
+    # slim 모드에서는 json_data 컬럼을 읽지 않습니다.
+    return reports.defer("json_data") if slim else reports
+
+
+def _report_list_etag(request, user, stats):
+    """리포트 수와 마지막 생성/갱신 시각이 같고 요청 파라미터(페이지, slim)도 같으면 같은 ETag를 만듭니다."""
+    last_updated = stats["last_updated"].isoformat() if stats["last_updated"] else ""
+    key = f"{user.pk}:{stats['count']}:{last_updated}:{request.GET.urlencode()}"
+    return quote_etag(hashlib.sha256(key.encode()).hexdigest()[:32])
+
+
+def _with_validators(response, etag):
+    response["ETag"] = etag
+    # 브라우저가 저장한 응답을 쓰기 전에 항상 ETag로 재검증하게 합니다.
+    response["Cache-Control"] = "private, no-cache"
+    return response
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def report_list_api_view(request):
-    # 현재 로그인한 사용자의 리포트만 필터링하여 반환합니다.
-    reports = SpendingReport.objects.filter(user=request.user).order_by("-generated_date", "-created_at")
+    """
+    현재 사용자의 리포트 목록 (최신순, ReportPagination 페이지 단위).
+
+    `slim=true`이면 json_data를 빼고 반환하며, 리포트 데이터는 report_detail_api_view로 하나씩 조회합니다.
+    리포트가 바뀌지 않았으면 If-None-Match 요청에 본문 없이 304를 반환합니다. (집계 쿼리 한 번)
+    """
+    slim = _wants_slim(request)
+    reports = _report_list_queryset(request.user, slim)
+    stats = reports.aggregate(**REPORT_LIST_STATS)
+    etag = _report_list_etag(request, request.user, stats)
 
-    # [개선] Serializer를 사용하여 복잡한 데이터 변환 로직을 자동화합니다.
-    serializer = SpendingReportSerializer(reports, many=True)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        paginator = ReportPagination()
+        page = paginator.paginate_counted_queryset(reports, stats["count"], request)
+        serializer_class = SpendingReportSummarySerializer if slim else SpendingReportSerializer
+        response = paginator.get_paginated_response(serializer_class(page, many=True).data)
+    return _with_validators(response, etag)
+
+
+@async_read_view(report_list_api_view)
+async def report_list_async_view(request, user):
+    """report_list_api_view의 비동기 버전 (ASGI 서버에서 config.asgi_urls로 연결됩니다)."""
+    slim = _wants_slim(request)
+    reports = _report_list_queryset(user, slim)
+    stats = await reports.aaggregate(**REPORT_LIST_STATS)
+    etag = _report_list_etag(request, user, stats)
+
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        paginator = ReportPagination()
+        try:
+            page = paginator.paginate_counted_queryset(reports, stats["count"], Request(request))
+        except NotFound as e:
+            return json_response({"detail": e.detail}, status=status.HTTP_404_NOT_FOUND)
+        serializer_class = SpendingReportSummarySerializer if slim else SpendingReportSerializer
+        data = serializer_class([report async for report in page], many=True).data
+        response = json_response(paginator.get_paginated_data(data))
+    return _with_validators(response, etag)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def report_detail_api_view(request, report_id):
+    try:
+        report = SpendingReport.objects.get(pk=report_id, user=request.user)
+    except SpendingReport.DoesNotExist:
+        return Response({"error": "Report not found."}, status=status.HTTP_404_NOT_FOUND)
+
+    etag = quote_etag(f"{report.pk}-{report.updated_at.timestamp()}")
+    response = get_conditional_response(request, etag=etag) or Response(SpendingReportSerializer(report).data)
+    return _with_validators(response, etag)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def sentiment_analysis_list_api_view(request):
+    # 화면의 분석 기록 필터와 같은 조건(text_content 검색, 감정, 기간)으로 현재 사용자의 분석 결과를 조회합니다.
+    analysis_filter = AnalysisFilter(
+        request.query_params,
+        queryset=SentimentAnalysis.objects.filter(transaction__account__user=request.user).order_by(
+            "-created_at", "-id"
+        ),
+    )
+    if not analysis_filter.is_valid():
+        return Response(analysis_filter.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    paginator = PageNumberPagination()
+    paginator.page_size = ANALYSIS_LIST_PAGE_SIZE
+    page = paginator.paginate_queryset(analysis_filter.qs, request)
+    return paginator.get_paginated_response(SentimentAnalysisSerializer(page, many=True).data)
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def bulk_sentiment_analysis_api_view(request):
+    serializer = BulkSentimentAnalysisSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    data = serializer.validated_data
+
+    try:
+        task = analyze_transactions_sentiment.delay(
+            request.user.id,
+            transaction_ids=data.get("transaction_ids"),
+            start_date=data["start_date"].isoformat() if data.get("start_date") else None,
+            end_date=data["end_date"].isoformat() if data.get("end_date") else None,
+        )
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Celery task dispatch failed for user {request.user.id}: {e}")
+        return Response(
+            {"error": "감정 분석 작업을 시작하지 못했습니다. 서버 관리자에게 문의하세요."},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+    _remember_task_owner(task.id, request.user.id)
+    return Response(
+        {"message": "Bulk sentiment analysis initiated.", "task_id": task.id},
+        status=status.HTTP_202_ACCEPTED,
+    )
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def task_status_api_view(request, task_id):
+    if cache.get(TASK_OWNER_CACHE_KEY.format(task_id=task_id)) != request.user.id:
+        return Response({"error": "Task not found."}, status=status.HTTP_404_NOT_FOUND)
 
-    return Response({"reports": serializer.data}, status=status.HTTP_200_OK)
+    # 결과 백엔드를 한 번만 조회하고 바로 응답합니다. (작업을 기다리며 웹 워커를 붙잡지 않습니다.)
+    result = AsyncResult(task_id)
+    response_data = {"task_id": task_id, "status": result.status}
+    if result.status == "PROGRESS":
+        response_data["progress"] = result.info
+    elif result.successful():
+        response_data["result"] = result.result
+    elif result.failed():
+        response_data["error"] = "작업 처리 중 오류가 발생했습니다."
+    return Response(response_data, status=status.HTTP_200_OK)
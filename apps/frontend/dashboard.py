@@ -0,0 +1,63 @@
+"""
+대시보드 화면 데이터 조회와 사용자별 캐시.
+
+계좌나 거래가 저장/삭제되면 `FrontendConfig.ready()`에서 연결한 시그널이 해당 사용자의 캐시를 지웁니다.
+QuerySet.update()/bulk_create()처럼 모델 시그널을 보내지 않는 경로는 `transactions_bulk_changed` 시그널을 보냅니다.
+"""
+
+from typing import Any, Dict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from apps.accounts.models import Account
+from apps.transaction_history.models import MonthlyTransactionRollup, TransactionHistory
+
+DASHBOARD_CACHE_KEY = "dashboard:context:{user_id}"
+
+
+def build_dashboard_context(user) -> Dict[str, Any]:
+    total_balance = Account.objects.filter(user=user).aggregate(Sum("balance"))["balance__sum"] or 0
+    recent_transactions = list(TransactionHistory.objects.filter(account__user=user).order_by("-id")[:5])
+    current_year = timezone.localdate().year
+    # 미리 집계된 월별 합계에서 올해 최대 24행(12개월 x 입금/출금)만 읽습니다.
+    monthly_totals = MonthlyTransactionRollup.objects.filter(user=user, month__year=current_year).values_list(
+        "month", "transaction_type", "total_amount"
+    )
+    months = [str(i) for i in range(1, 13)]
+    income_data = [0] * 12
+    expense_data = [0] * 12
+    for month, transaction_type, total in monthly_totals:
+        if transaction_type == "DEPOSIT":
+            income_data[month.month - 1] = float(total)
+        elif transaction_type == "WITHDRAW":
+            expense_data[month.month - 1] = float(total)
+    return {
+        "total_balance": total_balance,
+        "recent_transactions": recent_transactions,
+        "months": months,
+        "income_data": income_data,
+        "expense_data": expense_data,
+    }
+
+
+def get_dashboard_context(user) -> Dict[str, Any]:
+    """캐시된 대시보드 데이터를 반환하며, 없으면 새로 조회하여 캐시합니다."""
+    timeout = settings.DASHBOARD_CACHE_TIMEOUT
+    if not timeout:
+        return build_dashboard_context(user)
+    key = DASHBOARD_CACHE_KEY.format(user_id=user.pk)
+    context = cache.get(key)
+    if context is None:
+        context = build_dashboard_context(user)
+        cache.set(key, context, timeout)
+    return context
+
+
+def invalidate_dashboard_context(user_id: int) -> None:
+    """사용자의 대시보드 캐시를 지웁니다. 트랜잭션 안에서 호출되면 커밋된 뒤에 지웁니다."""
+    # 커밋 전에 지우면 다른 요청이 커밋 전 데이터로 캐시를 다시 채울 수 있습니다.
+    transaction.on_commit(lambda: cache.delete(DASHBOARD_CACHE_KEY.format(user_id=user_id)))
@@ -0,0 +1,88 @@
+"""
+거래 목록 화면의 페이지 조회.
+
+전체 행에 상관 서브쿼리를 붙여 페이지를 자르는 대신, 현재 페이지의 거래 ID만 먼저 읽고
+그 ID들로 거래(계좌 포함)와 감정 분석 ID를 각각 한 번의 IN 쿼리로 가져옵니다.
+필터가 없는 경우 전체 건수는 COUNT(*) 대신 월별 집계의 거래 건수 합으로 추정합니다.
+"""
+
+from django.core.paginator import EmptyPage, Page, Paginator
+from django.db.models import Sum
+from django.utils.functional import cached_property
+
+from apps.analysis.models import SentimentAnalysis
+from apps.transaction_history.models import MonthlyTransactionRollup, TransactionHistory
+
+
+class TransactionPaginator(Paginator):
+    """
+    거래 ID 목록을 페이지로 나누고, 페이지에 해당하는 거래만 읽어오는 Paginator.
+
+    집계에서 읽은 건수는 추정치로만 사용합니다. 페이지 ID를 읽을 때 한 행을 더 읽어
+    추정한 건수와 맞지 않으면(집계가 실제 거래와 어긋난 경우) COUNT(*)로 다시 세어 페이지를 나눕니다.
+    따라서 마지막 페이지가 비거나 존재하는 페이지가 404가 되지 않습니다.
+    """
+
+    def __init__(self, id_queryset, per_page, user=None, **kwargs):
+        # user가 주어지면 필터가 없는 목록으로 보고 건수를 월별 집계에서 추정합니다.
+        super().__init__(id_queryset, per_page, **kwargs)
+        self.user = user
+
+    @cached_property
+    def count(self):
+        if self.user is None:
+            return super().count
+        total = MonthlyTransactionRollup.objects.filter(user=self.user).aggregate(Sum("transaction_count"))
+        return total["transaction_count__sum"] or 0
+
+    def _use_exact_count(self):
+        self.user = None
+        for name in ("count", "num_pages"):
+            self.__dict__.pop(name, None)
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if self.user is None:
+                raise
+            # 추정한 건수가 실제보다 작으면 존재하는 페이지도 범위를 벗어난 것으로 판단하므로 다시 셉니다.
+            self._use_exact_count()
+            return super().validate_number(number)
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        transaction_ids = list(self.object_list[bottom : top + 1])
+        expected = top - bottom + (1 if top < self.count else 0)
+        if self.user is not None and len(transaction_ids) != expected:
+            self._use_exact_count()
+            # 추정한 건수가 실제보다 컸다면 요청한 페이지가 없을 수 있으므로 get_page()처럼 마지막 페이지를 반환합니다.
+            return self.page(min(number, self.num_pages))
+        return Page(load_transactions(transaction_ids[: top - bottom]), number, self)
+
+
+def load_transactions(transaction_ids):
+    """주어진 순서대로 거래를 읽고, 각 거래에 최신 감정 분석 ID(analysis_id, 없으면 None)를 붙입니다."""
+    if not transaction_ids:
+        return []
+    transactions = TransactionHistory.objects.select_related("account").in_bulk(transaction_ids)
+    analysis_ids = {}
+    # 거래마다 가장 최근 분석을 보여주던 기존 동작과 같도록 최신 분석부터 읽어 첫 번째 값만 남깁니다.
+    for transaction_id, analysis_id in (
+        SentimentAnalysis.objects.filter(transaction_id__in=transaction_ids)
+        .order_by("-created_at", "-pk")
+        .values_list("transaction_id", "pk")
+    ):
+        analysis_ids.setdefault(transaction_id, analysis_id)
+
+    page_transactions = []
+    for transaction_id in transaction_ids:
+        transaction_history = transactions.get(transaction_id)
+        if transaction_history is not None:
+            transaction_history.analysis_id = analysis_ids.get(transaction_id)
+            page_transactions.append(transaction_history)
+    return page_transactions
@@ -0,0 +1,32 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.accounts.models import Account
+from apps.transaction_history.models import TransactionHistory
+from apps.transaction_history.signals import transactions_bulk_changed
+
+from .dashboard import invalidate_dashboard_context
+
+
+@receiver([post_save, post_delete], sender=Account)
+def invalidate_dashboard_on_account_change(sender, instance, **kwargs):
+    """계좌가 저장/삭제되면 소유자의 대시보드 캐시를 지웁니다."""
+    invalidate_dashboard_context(instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=TransactionHistory)
+def invalidate_dashboard_on_transaction_change(sender, instance, **kwargs):
+    """거래가 저장/삭제되면 소유자의 대시보드 캐시를 지웁니다."""
+    try:
+        user_id = instance.account.user_id
+    except Account.DoesNotExist:
+        # 계좌 삭제로 함께 지워지는 경우이며, 계좌 시그널에서 캐시를 지웁니다.
+        return
+    invalidate_dashboard_context(user_id)
+
+
+@receiver(transactions_bulk_changed)
+def invalidate_dashboard_on_bulk_change(sender, user_ids, **kwargs):
+    """거래가 일괄 저장되면 해당 사용자들의 대시보드 캐시를 지웁니다."""
+    for user_id in user_ids:
+        invalidate_dashboard_context(user_id)
@@ -0,0 +1,164 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.accounts.models import Account
+from apps.analysis.models import SentimentAnalysis
+from apps.frontend.dashboard import get_dashboard_context
+from apps.frontend.forms import TransactionForm
+from apps.frontend.pagination import TransactionPaginator
+from apps.transaction_history import ledger
+from apps.transaction_history.models import MonthlyTransactionRollup, TransactionHistory
+from apps.users.models import CustomUser
+
+
+@override_settings(DASHBOARD_CACHE_TIMEOUT=300)
+class DashboardViewTestCase(TestCase):
+    def setUp(self):
+        """테스트 케이스를 위한 초기 설정"""
+        cache.clear()
+        self.user = CustomUser.objects.create_user(
+            email="dashboard@example.com", password="password123", name="Dashboard", nickname="dashboard"
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="110-220-330442",
+            bank_code="088",
+            account_type="checking",
+            balance=Decimal("100000.00"),
+        )
+        self.client.force_login(self.user)
+
+    def test_dashboard_context_is_cached_and_invalidated_on_write(self):
+        """대시보드 데이터가 캐시되고, 거래가 추가되면 캐시가 무효화되어 월별 차트에 반영되는지 테스트"""
+        response = self.client.get(reverse("dashboard"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(sum(response.context["expense_data"]), 0)
+        with self.assertNumQueries(0):
+            get_dashboard_context(self.user)
+
+        data = {
+            "account": self.account.pk,
+            "transaction_type": "WITHDRAW",
+            "amount": "4500.00",
+            "transaction_method": "CARD",
+        }
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse("transactions_list"), data)
+        self.assertEqual(response.status_code, 302)
+
+        context = get_dashboard_context(self.user)
+        self.assertEqual(sum(context["expense_data"]), 4500.0)
+        self.assertEqual(context["total_balance"], Decimal("95500.00"))
+        self.assertEqual(len(context["recent_transactions"]), 1)
+
+
+class TransactionsListViewTestCase(TestCase):
+    def setUp(self):
+        """테스트 케이스를 위한 초기 설정"""
+        self.user = CustomUser.objects.create_user(
+            email="txlist@example.com", password="password123", name="List", nickname="txlist"
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="110-220-330443",
+            bank_code="088",
+            account_type="checking",
+            balance=Decimal("0.00"),
+        )
+        self.transactions = [
+            ledger.record_transaction(
+                TransactionHistory(
+                    account=self.account,
+                    transaction_type="DEPOSIT",
+                    amount=Decimal("1000.00"),
+                    transaction_detail=f"입금 {i}",
+                    transaction_method="ATM",
+                )
+            )
+            for i in range(25)
+        ]
+        self.analysis = SentimentAnalysis.objects.create(
+            transaction=self.transactions[-1], text_content="좋아요", sentiment="POSITIVE", score=0.9
+        )
+        self.client.force_login(self.user)
+
+    def test_page_resolves_analysis_ids_in_batch(self):
+        """페이지 건수와 감정 분석 ID가 행 수와 관계없이 일정한 쿼리로 조회되는지 테스트"""
+        response = self.client.get(reverse("transactions_list"))
+        self.assertEqual(response.status_code, 200)
+        page_obj = response.context["page_obj"]
+        self.assertEqual(page_obj.paginator.count, 25)
+        self.assertEqual(page_obj[0].pk, self.transactions[-1].pk)
+        self.assertEqual(page_obj[0].analysis_id, self.analysis.pk)
+        self.assertIsNone(page_obj[1].analysis_id)
+
+        # 건수(집계), 페이지 ID, 거래+계좌, 감정 분석 ID: 4개의 쿼리로 한 페이지를 만듭니다.
+        paginator = TransactionPaginator(
+            TransactionHistory.objects.filter(account__user=self.user)
+            .order_by("-created_at", "-id")
+            .values_list("pk", flat=True),
+            10,
+            user=self.user,
+        )
+        with self.assertNumQueries(4):
+            page = paginator.get_page(3)
+            self.assertEqual([t.account.account_number for t in page], [self.account.account_number] * 5)
+
+    def test_drifted_rollups_do_not_produce_empty_pages(self):
+        """월별 집계의 건수가 실제 거래 수와 어긋나도 페이지가 비거나 잘리지 않는지 테스트"""
+        ids = TransactionHistory.objects.filter(account__user=self.user).order_by("-created_at", "-id")
+        ids = ids.values_list("pk", flat=True)
+        rollup = MonthlyTransactionRollup.objects.get(user=self.user)
+
+        # 집계가 실제보다 많으면(5페이지로 추정) 마지막 페이지 요청은 실제 마지막 페이지(3)를 반환합니다.
+        rollup.transaction_count = 45
+        rollup.save()
+        page = TransactionPaginator(ids, 10, user=self.user).get_page(5)
+        self.assertEqual((page.number, len(page), page.paginator.count), (3, 5, 25))
+
+        # 집계가 실제보다 적으면(1페이지로 추정) 뒤의 페이지도 조회되고 첫 페이지도 10건을 보여줍니다.
+        rollup.transaction_count = 8
+        rollup.save()
+        paginator = TransactionPaginator(ids, 10, user=self.user)
+        self.assertEqual(len(paginator.get_page(1)), 10)
+        page = TransactionPaginator(ids, 10, user=self.user).get_page(3)
+        self.assertEqual((page.number, len(page), page.paginator.count), (3, 5, 25))
+
+    def test_form_rejects_overdraft(self):
+        """잔액보다 큰 출금은 폼 검증에서, 검증 뒤 잔액이 바뀐 경우에는 원장 서비스에서 거부되는지 테스트"""
+        data = {
+            "account": self.account.pk,
+            "transaction_type": "WITHDRAW",
+            "amount": "30000.00",
+            "transaction_detail": "초과 출금",
+            "transaction_method": "CARD",
+        }
+        response = self.client.post(reverse("transactions_list"), data)
+        self.assertEqual(response.context["form"].non_field_errors(), ["잔액이 부족합니다."])
+
+        # 폼 검증은 잠금 없이 읽은 잔액으로 하므로, 그 사이 다른 출금이 들어온 경우를 폼 검증을 건너뛰어 재현합니다.
+        with mock.patch.object(TransactionForm, "clean", lambda form: form.cleaned_data):
+            response = self.client.post(reverse("transactions_list"), data)
+        self.assertEqual(response.context["form"].non_field_errors(), ["잔액이 부족합니다."])
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("25000.00"))
+        self.assertFalse(TransactionHistory.objects.filter(transaction_detail="초과 출금").exists())
+
+    def test_filtered_list_counts_matching_rows(self):
+        """필터가 있으면 조건에 맞는 거래만 세는지 테스트"""
+        response = self.client.get(reverse("transactions_list"), {"transaction_detail": "입금 1"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["page_obj"].paginator.count, 11)
+
+    def test_analysis_form_subscribes_to_events_only_when_stream_enabled(self):
+        """SSE가 켜져 있을 때만 분석 화면이 sentiment.done 이벤트를 구독하는지 테스트"""
+        url = reverse("transaction_analysis_form", kwargs={"transaction_id": self.transactions[0].pk})
+        with override_settings(EVENTS={**settings.EVENTS, "STREAM_ENABLED": True}):
+            self.assertContains(self.client.get(url), "const eventSource = true && window.EventSource")
+        self.assertContains(self.client.get(url), "const eventSource = false && window.EventSource")
@@ -1,10 +1,7 @@
-from datetime import datetime, timezone
-
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import Paginator
-from django.db.models import OuterRef, Subquery, Sum
-from django.db.models.functions import ExtractMonth
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views.generic import TemplateView
 
@@ -12,10 +9,13 @@ from apps.accounts.models import Account
 from apps.analysis.filters import AnalysisFilter
 from apps.analysis.forms import SentimentAnalysisEditForm
 from apps.analysis.models import SentimentAnalysis, SpendingReport  # Added SpendingReport
+from apps.transaction_history import ledger
 from apps.transaction_history.filters import TransactionFilter
 from apps.transaction_history.models import TransactionHistory
 
+from .dashboard import get_dashboard_context
 from .forms import AccountForm, LoginForm, TransactionForm
+from .pagination import TransactionPaginator
 
 
 def login_page_view(request):
@@ -36,42 +36,8 @@ class MainPageView(TemplateView):
 
 @login_required
 def dashboard_view(request):
-    user_accounts = Account.objects.filter(user=request.user)
-    total_balance = user_accounts.aggregate(Sum("balance"))["balance__sum"] or 0
-    recent_transactions = TransactionHistory.objects.filter(account__user=request.user).order_by("-id")[:5]
-    current_year = datetime.now(timezone.utc).year
-    monthly_income = (
-        TransactionHistory.objects.filter(
-            account__user=request.user, transaction_type="DEPOSIT", created_at__year=current_year
-        )
-        .annotate(month=ExtractMonth("created_at"))
-        .values("month")
-        .annotate(total=Sum("amount"))
-        .order_by("month")
-    )
-    monthly_expenses = (
-        TransactionHistory.objects.filter(
-            account__user=request.user, transaction_type="WITHDRAW", created_at__year=current_year
-        )
-        .annotate(month=ExtractMonth("created_at"))
-        .values("month")
-        .annotate(total=Sum("amount"))
-        .order_by("month")
-    )
-    months = [str(i) for i in range(1, 13)]
-    income_data = [0] * 12
-    expense_data = [0] * 12
-    for item in monthly_income:
-        income_data[item["month"] - 1] = float(item["total"])
-    for item in monthly_expenses:
-        expense_data[item["month"] - 1] = float(item["total"])
-    context = {
-        "total_balance": total_balance,
-        "recent_transactions": recent_transactions,
-        "months": months,
-        "income_data": income_data,
-        "expense_data": expense_data,
-    }
+    # 잔액, 최근 거래, 월별 차트 데이터는 사용자별로 캐시되며 계좌/거래가 바뀌면 무효화됩니다.
+    context = get_dashboard_context(request.user)
     return render(request, "dashboard.html", context)
 
 
@@ -104,36 +70,27 @@ def transactions_list_view(request):
         form = TransactionForm(request.POST, user=request.user)  # Re-bind form with POST data
         if form.is_valid():
             transaction = form.save(commit=False)
-            account = transaction.account
-            print(
-                f"DEBUG: Before update - Account ID: {account.id}, Balance: {account.balance}, Transaction Type: {transaction.transaction_type}, Amount: {transaction.amount}"
-            )  # DEBUG
-
-            if transaction.transaction_type == "DEPOSIT":
-                account.balance += transaction.amount
-            elif transaction.transaction_type == "WITHDRAW":
-                account.balance -= transaction.amount
-
-            print(f"DEBUG: After update - Account ID: {account.id}, New Balance: {account.balance}")  # DEBUG
-            account.save()
-            transaction.balance_after = account.balance
-            transaction.save()
-            messages.success(request, "새 거래 내역이 성공적으로 추가되었습니다.")
-            return redirect("transactions_list")
+            try:
+                # 잔액 변경, 거래 저장, 집계 갱신을 원장 서비스가 하나의 DB 트랜잭션으로 처리합니다.
+                ledger.record_transaction(transaction)
+            except ledger.InsufficientFundsError:
+                form.add_error(None, "잔액이 부족합니다.")
+                messages.error(request, "거래 내역 추가에 실패했습니다. 양식을 확인해주세요.")
+            else:
+                messages.success(request, "새 거래 내역이 성공적으로 추가되었습니다.")
+                return redirect("transactions_list")
         else:
             # If form is invalid, it will fall through and be rendered with errors
             messages.error(request, "거래 내역 추가에 실패했습니다. 양식을 확인해주세요.")
 
     # --- This part runs for GET requests or after an invalid POST ---
-    sentiment_analysis_subquery = SentimentAnalysis.objects.filter(transaction=OuterRef("pk")).values("pk")[:1]
-    transaction_list = (
-        TransactionHistory.objects.filter(account__user=request.user)
-        .annotate(analysis_id=Subquery(sentiment_analysis_subquery))
-        .order_by("-created_at")
-    )
+    transaction_list = TransactionHistory.objects.filter(account__user=request.user).order_by("-created_at", "-id")
     transaction_filter = TransactionFilter(request.GET, queryset=transaction_list)
+    transaction_ids = transaction_filter.qs.values_list("pk", flat=True)
+    # 필터 조건이 없으면 전체 건수를 COUNT(*) 대신 월별 집계에서 읽습니다.
+    is_filtered = any(value not in (None, "") for value in transaction_filter.form.cleaned_data.values())
 
-    paginator = Paginator(transaction_filter.qs, 10)
+    paginator = TransactionPaginator(transaction_ids, 10, user=None if is_filtered else request.user)
     page_number = request.GET.get("page")
     page_obj = paginator.get_page(page_number)
 
@@ -162,7 +119,11 @@ def signup_complete_view(request):
 @login_required
 def transaction_analysis_form_view(request, transaction_id):
     transaction = get_object_or_404(TransactionHistory, pk=transaction_id, account__user=request.user)
-    context = {"transaction": transaction}
+    context = {
+        "transaction": transaction,
+        # 비동기 분석의 완료는 SSE(sentiment.done 이벤트)로 받고, SSE가 꺼져 있으면 작업 상태를 폴링합니다.
+        "events_stream_enabled": settings.EVENTS["STREAM_ENABLED"],
+    }
     return render(request, "frontend/transaction_analysis_form.html", context)
 
 
@@ -188,14 +149,8 @@ def analysis_history_view(request):
 def transaction_delete_view(request, transaction_id):
     transaction = get_object_or_404(TransactionHistory, pk=transaction_id, account__user=request.user)
     if request.method == "POST":
-        account = transaction.account
-        # Adjust account balance before deleting transaction
-        if transaction.transaction_type == "DEPOSIT":
-            account.balance -= transaction.amount
-        elif transaction.transaction_type == "WITHDRAW":
-            account.balance += transaction.amount
-        account.save()
-        transaction.delete()
+        # 계좌 잔액을 되돌리고 거래를 삭제합니다.
+        ledger.delete_transaction(transaction)
         messages.success(request, "거래 내역이 성공적으로 삭제되었습니다.")
         return redirect("transactions_list")
     # If not a POST request, just redirect to the list
@@ -246,5 +201,7 @@ def generate_reports_view(request):
     context = {
         "weekly_report_json_data": weekly_report_json_data,
         "monthly_report_json_data": monthly_report_json_data,
+        # SSE(/api/v1/events/)는 ASGI 서버에서만 제공되므로, 설정으로 켜진 경우에만 화면에서 연결합니다.
+        "events_stream_enabled": settings.EVENTS["STREAM_ENABLED"],
     }
     return render(request, "frontend/spending_reports.html", context)
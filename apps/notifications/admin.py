@@ -1 +1,7 @@
+from django.contrib import admin
+
+from .models import Notification, NotificationCounter
+
 # Register your models here.
+admin.site.register(Notification)
+admin.site.register(NotificationCounter)
@@ -0,0 +1,59 @@
+import time
+import uuid
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.notifications.services import notify, notify_users
+from apps.users.models import CustomUser
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds synthetic users and compares chunked notification fan-out with creating notifications one by one. "
+        "All seeded data is rolled back when the benchmark finishes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=100000, help="Number of users to notify.")
+        parser.add_argument("--sample", type=int, default=2000, help="Users notified one by one for comparison.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            users = self._seed(options["users"])
+            user_ids = [user.pk for user in users]
+
+            started = time.perf_counter()
+            notify_users(user_ids, "벤치마크 알림")
+            fan_out_seconds = time.perf_counter() - started
+
+            sample = users[: options["sample"]]
+            started = time.perf_counter()
+            for user in sample:
+                notify(user, "벤치마크 알림")
+            per_user_seconds = (time.perf_counter() - started) / max(len(sample), 1) * len(users)
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"Chunked fan-out:  {fan_out_seconds:.2f}s for {len(users):,} users")
+        self.stdout.write(f"One by one:       {per_user_seconds:.2f}s (extrapolated from {len(sample):,} users)")
+        self.stdout.write(self.style.SUCCESS(f"Speedup:          {per_user_seconds / fan_out_seconds:.1f}x"))
+
+    def _seed(self, user_count: int) -> list[CustomUser]:
+        prefix = uuid.uuid4().hex[:8]
+        password = make_password(None)
+        users = CustomUser.objects.bulk_create(
+            [
+                CustomUser(
+                    email=f"notify-{prefix}-{i}@example.com",
+                    password=password,
+                    name=f"Notify {i}",
+                    nickname=f"notify-{prefix}-{i}",
+                    is_active=True,
+                )
+                for i in range(user_count)
+            ],
+            batch_size=1000,
+        )
+        self.stdout.write(f"Seeded {len(users):,} users.")
+        return users
@@ -5,7 +5,27 @@ from apps.users.models import CustomUser
 
 # Create your models here.
 class Notification(models.Model):
-    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
+    # (user, is_read, created_at) 복합 인덱스가 user 단독 조회도 처리하므로 FK 단일 인덱스는 만들지 않습니다.
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, db_index=False)
     message = models.CharField(max_length=255)
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # 목록(최신순)과 읽지 않은 알림 목록/모두 읽음 처리에 사용합니다.
+            models.Index(fields=["user", "is_read", "created_at"], name="notif_user_read_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"Notification for {self.user_id}: {self.message}"
+
+
+class NotificationCounter(models.Model):
+    """사용자별 읽지 않은 알림 수. 배지를 보여줄 때 COUNT(*) 대신 이 값을 읽습니다. (apps.notifications.services가 갱신)"""
+
+    user = models.OneToOneField(CustomUser, on_delete=models.CASCADE, primary_key=True, related_name="+")
+    unread_count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user_id}: {self.unread_count} unread"
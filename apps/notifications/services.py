@@ -0,0 +1,77 @@
+"""
+알림 생성/읽음 처리 서비스.
+
+알림을 만들거나 읽음으로 바꾸는 코드는 이 모듈을 거쳐야 사용자별 읽지 않은 알림 수(NotificationCounter)가
+알림과 같은 DB 트랜잭션 안에서 함께 갱신됩니다.
+"""
+
+from typing import Iterable, List
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+from core import events
+
+from .models import Notification, NotificationCounter
+
+
+def _add_unread(user_ids: List[int], delta: int) -> None:
+    if delta > 0:
+        # 카운터가 없는 사용자는 0으로 만든 뒤 한 번의 UPDATE로 모두 더합니다.
+        NotificationCounter.objects.bulk_create(
+            [NotificationCounter(user_id=user_id) for user_id in user_ids], ignore_conflicts=True
+        )
+        NotificationCounter.objects.filter(user_id__in=user_ids).update(unread_count=F("unread_count") + delta)
+    elif delta < 0:
+        NotificationCounter.objects.filter(user_id__in=user_ids).update(
+            unread_count=Greatest(F("unread_count") + delta, 0)
+        )
+
+
+def notify_users(user_ids: Iterable[int], message: str, chunk_size: int | None = None) -> int:
+    """
+    사용자들에게 같은 알림을 보내고 생성한 알림 수를 반환합니다.
+    chunk_size명(기본 NOTIFICATION_FANOUT_CHUNK_SIZE)씩 bulk_create와 카운터 UPDATE 한 번으로 처리합니다.
+    """
+    chunk_size = chunk_size or settings.NOTIFICATION_FANOUT_CHUNK_SIZE
+    user_ids = list(dict.fromkeys(user_ids))
+    for i in range(0, len(user_ids), chunk_size):
+        chunk = user_ids[i : i + chunk_size]
+        with transaction.atomic():
+            Notification.objects.bulk_create([Notification(user_id=user_id, message=message) for user_id in chunk])
+            _add_unread(chunk, 1)
+            events.publish_many((user_id, "notification", {"message": message}) for user_id in chunk)
+    return len(user_ids)
+
+
+def notify(user, message: str) -> Notification:
+    with transaction.atomic():
+        notification = Notification.objects.create(user=user, message=message)
+        _add_unread([user.pk], 1)
+        events.publish(user.pk, "notification", {"id": notification.pk, "message": message})
+    return notification
+
+
+def mark_read(user, notification_ids: Iterable[int]) -> int:
+    """사용자의 알림 중 주어진 알림을 읽음으로 표시하고, 새로 읽음 처리한 수를 반환합니다."""
+    with transaction.atomic():
+        updated = Notification.objects.filter(user=user, pk__in=list(notification_ids), is_read=False).update(
+            is_read=True
+        )
+        _add_unread([user.pk], -updated)
+    return updated
+
+
+def mark_all_read(user) -> int:
+    """사용자의 읽지 않은 알림을 한 번의 UPDATE로 모두 읽음으로 표시합니다."""
+    with transaction.atomic():
+        updated = Notification.objects.filter(user=user, is_read=False).update(is_read=True)
+        # 0으로 덮어쓰지 않고 읽음 처리한 수만큼 빼야 그 사이에 도착한 알림 수가 보존됩니다.
+        _add_unread([user.pk], -updated)
+    return updated
+
+
+def unread_count(user) -> int:
+    return NotificationCounter.objects.filter(user=user).values_list("unread_count", flat=True).first() or 0
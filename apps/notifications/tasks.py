@@ -0,0 +1,49 @@
+import logging
+
+from celery import shared_task
+from django.conf import settings
+
+from apps.users.models import CustomUser
+
+from .services import notify_users
+
+logger = logging.getLogger(__name__)
+
+REPORT_READY_MESSAGES = {
+    "weekly": "이번 주 소비 리포트가 준비되었습니다.",
+    "monthly": "이번 달 소비 리포트가 준비되었습니다.",
+}
+
+
+@shared_task
+def deliver_notification_chunk(message: str, user_ids: list[int]) -> int:
+    return notify_users(user_ids, message)
+
+
+@shared_task
+def send_notification_to_users(message: str, user_ids: list[int] | None = None) -> int:
+    """
+    알림을 여러 사용자에게 보냅니다. user_ids가 없으면 모든 활성 사용자에게 보냅니다.
+    NOTIFICATION_FANOUT_CHUNK_SIZE명씩 나눈 청크 태스크로 보내 여러 워커가 동시에 처리합니다.
+    """
+    if user_ids is None:
+        user_ids = list(CustomUser.objects.filter(is_active=True).order_by("id").values_list("id", flat=True))
+    chunk_size = settings.NOTIFICATION_FANOUT_CHUNK_SIZE
+    for i in range(0, len(user_ids), chunk_size):
+        deliver_notification_chunk.delay(message, user_ids[i : i + chunk_size])
+    logger.info("Queued notification for %s users in %s chunks.", len(user_ids), -(-len(user_ids) // chunk_size))
+    return len(user_ids)
+
+
+@shared_task
+def notify_report_ready(report_type: str, since_date: str) -> int:
+    """since_date(YYYY-MM-DD) 이후 report_type 리포트가 생성된 사용자들에게 리포트 준비 알림을 보냅니다."""
+    from apps.analysis.models import SpendingReport
+
+    user_ids = list(
+        SpendingReport.objects.filter(report_type=report_type, generated_date__gte=since_date)
+        .order_by("user_id")
+        .values_list("user_id", flat=True)
+        .distinct()
+    )
+    return send_notification_to_users(REPORT_READY_MESSAGES[report_type], user_ids)
@@ -1 +1,75 @@
-# Create your tests here.
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.notifications import services
+from apps.notifications.models import Notification, NotificationCounter
+from apps.users.models import CustomUser
+
+
+@override_settings(NOTIFICATION_FANOUT_CHUNK_SIZE=2)
+class NotificationFanOutTestCase(TestCase):
+    def setUp(self):
+        """테스트 케이스를 위한 초기 설정"""
+        self.users = [
+            CustomUser.objects.create_user(email=f"n{i}@example.com", password="pw", name="N", nickname=f"n{i}")
+            for i in range(5)
+        ]
+
+    def test_fan_out_creates_notifications_and_counters_per_chunk(self):
+        """청크마다 일정한 쿼리로 알림과 읽지 않은 알림 수가 함께 만들어지는지 테스트"""
+        user_ids = [user.pk for user in self.users]
+        # 청크(2명)마다 SAVEPOINT/RELEASE, 알림 bulk_create, 카운터 생성, 카운터 UPDATE: 3개 청크 x 5개 쿼리
+        with self.assertNumQueries(3 * 5):
+            self.assertEqual(services.notify_users(user_ids, "리포트가 준비되었습니다."), 5)
+        services.notify_users(user_ids[:1], "두 번째 알림")
+
+        self.assertEqual(Notification.objects.count(), 6)
+        self.assertEqual(services.unread_count(self.users[0]), 2)
+        self.assertEqual(services.unread_count(self.users[4]), 1)
+
+    def test_mark_all_read_is_one_update_and_keeps_counter_in_sync(self):
+        """모두 읽음 처리가 읽지 않은 알림만 바꾸고 카운터에서 그만큼 빼는지 테스트"""
+        user = self.users[0]
+        services.notify_users([user.pk], "하나")
+        services.notify_users([user.pk], "둘")
+        first = Notification.objects.filter(user=user).order_by("id").first()
+        self.assertEqual(services.mark_read(user, [first.pk]), 1)
+        self.assertEqual(services.unread_count(user), 1)
+
+        self.assertEqual(services.mark_all_read(user), 1)
+        self.assertEqual(services.unread_count(user), 0)
+        self.assertEqual(services.mark_all_read(user), 0)
+        self.assertEqual(NotificationCounter.objects.get(user=user).unread_count, 0)
+
+
+class NotificationAPITestCase(APITestCase):
+    def setUp(self):
+        """테스트 케이스를 위한 초기 설정"""
+        self.user = CustomUser.objects.create_user(
+            email="notify@example.com", password="password123", name="Notify", nickname="notify"
+        )
+        self.other = CustomUser.objects.create_user(
+            email="other@example.com", password="password123", name="Other", nickname="other"
+        )
+        self.client.force_authenticate(user=self.user)
+        services.notify_users([self.user.pk, self.other.pk], "첫 번째")
+        services.notify_users([self.user.pk], "두 번째")
+
+    def test_list_unread_count_and_read_all(self):
+        """목록, 읽지 않은 알림 수, 모두 읽음 API 테스트"""
+        response = self.client.get(reverse("notification-list"), {"is_read": "false"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item["message"] for item in response.data["results"]], ["두 번째", "첫 번째"])
+
+        response = self.client.get(reverse("notification-unread-count"))
+        self.assertEqual(response.data, {"unread_count": 2})
+
+        notification_id = self.client.get(reverse("notification-list")).data["results"][0]["id"]
+        response = self.client.post(reverse("notification-read", kwargs={"pk": notification_id}))
+        self.assertEqual(response.data, {"unread_count": 1})
+
+        response = self.client.post(reverse("notification-read-all"))
+        self.assertEqual(response.data, {"updated": 1, "unread_count": 0})
+        self.assertEqual(services.unread_count(self.other), 1)
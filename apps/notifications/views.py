@@ -1 +1,60 @@
-# Create your views here.
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import permissions, serializers, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from . import services
+from .models import Notification
+from .pagination import NotificationCursorPagination
+from .serializers import NotificationSerializer
+
+
+@extend_schema(
+    description="API for the authenticated user's notifications, newest first.",
+    parameters=[
+        OpenApiParameter(
+            name="is_read",
+            type=bool,
+            location=OpenApiParameter.QUERY,
+            description="Only return read (true) or unread (false) notifications.",
+            required=False,
+        ),
+    ],
+)
+class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    API endpoint that lists notifications and marks them as read.
+    """
+
+    serializer_class = NotificationSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = NotificationCursorPagination
+
+    def get_queryset(self):
+        queryset = Notification.objects.filter(user=self.request.user)
+        is_read = self.request.query_params.get("is_read")
+        if is_read is not None and self.action == "list":
+            if is_read.lower() not in ("true", "false"):
+                raise serializers.ValidationError({"is_read": "Must be true or false."})
+            queryset = queryset.filter(is_read=is_read.lower() == "true")
+        return queryset
+
+    @extend_schema(description="Number of unread notifications, read from the per-user counter.")
+    @action(detail=False, methods=["get"], url_path="unread-count")
+    def unread_count(self, request):
+        return Response({"unread_count": services.unread_count(request.user)})
+
+    @extend_schema(request=None, description="Mark a single notification as read.")
+    @action(detail=True, methods=["post"])
+    def read(self, request, pk=None):
+        notification = self.get_object()
+        services.mark_read(request.user, [notification.pk])
+        return Response({"unread_count": services.unread_count(request.user)})
+
+    @extend_schema(request=None, description="Mark all of the user's notifications as read in one update.")
+    @action(detail=False, methods=["post"], url_path="read-all")
+    def read_all(self, request):
+        updated = services.mark_all_read(request.user)
+        return Response(
+            {"updated": updated, "unread_count": services.unread_count(request.user)}, status=status.HTTP_200_OK
+        )
@@ -1,6 +1,8 @@
 from django.contrib import admin
 
-from .models import TransactionHistory
+from .models import DailyTransactionRollup, MonthlyTransactionRollup, TransactionHistory
 
 # Register your models here.
 admin.site.register(TransactionHistory)
+admin.site.register(DailyTransactionRollup)
+admin.site.register(MonthlyTransactionRollup)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TransactionHistoryConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.transaction_history"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,87 @@
+"""
+거래 내역 내보내기(CSV/NDJSON) 스트리밍 생성기.
+
+행을 서버 측 커서(`QuerySet.iterator(chunk_size=...)`)로 조금씩 읽어 일정 크기마다 내보내므로
+내보내는 행 수와 관계없이 메모리 사용량이 일정합니다.
+"""
+
+import csv
+import io
+import json
+import zlib
+from typing import Iterable, Iterator, Sequence
+
+EXPORT_FORMATS = ("csv", "ndjson")
+EXPORT_CONTENT_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+EXPORT_FIELDS = (
+    "id",
+    "account",
+    "transaction_type",
+    "category",
+    "amount",
+    "balance_after",
+    "transaction_detail",
+    "transaction_method",
+    "created_at",
+)
+# 스프레드시트에서 수식으로 해석될 수 있는 문자로 시작하는 값은 앞에 작은따옴표를 붙입니다.
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+FLUSH_BYTES = 64 * 1024
+
+
+def _to_text(value) -> str:
+    if value is None:
+        return ""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _csv_cell(value) -> str:
+    text = _to_text(value)
+    if isinstance(value, str) and text.startswith(FORMULA_PREFIXES):
+        return f"'{text}"
+    return text
+
+
+def iter_csv(rows: Iterable[Sequence], fields: Sequence[str]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # Excel이 한글을 올바르게 읽도록 UTF-8 BOM을 붙입니다.
+    buffer.write("\ufeff")
+    writer.writerow(fields)
+    for row in rows:
+        writer.writerow([_csv_cell(value) for value in row])
+        if buffer.tell() >= FLUSH_BYTES:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
+
+
+def iter_ndjson(rows: Iterable[Sequence], fields: Sequence[str]) -> Iterator[bytes]:
+    lines = []
+    size = 0
+    for row in rows:
+        line = json.dumps(dict(zip(fields, map(_to_text, row))), ensure_ascii=False) + "\n"
+        lines.append(line)
+        size += len(line)
+        if size >= FLUSH_BYTES:
+            yield "".join(lines).encode("utf-8")
+            lines, size = [], 0
+    yield "".join(lines).encode("utf-8")
+
+
+def gzip_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """바이트 청크 스트림을 gzip 형식으로 압축하며 내보냅니다."""
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def stream_export(rows: Iterable[Sequence], fields: Sequence[str], export_format: str, compress: bool = False):
+    chunks = iter_csv(rows, fields) if export_format == "csv" else iter_ndjson(rows, fields)
+    return gzip_stream(chunks) if compress else chunks
@@ -3,11 +3,11 @@ from django import forms
 
 from .choices import TransactionType  # 변경: 클래스 이름으로 가져오기
 from .models import TransactionHistory
+from .search import SearchFilter
 
 
 class TransactionFilter(django_filters.FilterSet):
-    transaction_detail = django_filters.CharFilter(
-        lookup_expr="icontains",
+    transaction_detail = SearchFilter(
         label="거래 내용",
         widget=forms.TextInput(attrs={"class": "form-control", "placeholder": "내용, 메모 등"}),
     )
@@ -0,0 +1,128 @@
+"""
+거래 내역 일괄 가져오기(은행 거래명세서 등).
+
+모든 행을 기존 시리얼라이저로 검증한 뒤, 계좌별 거래 후 잔액을 메모리에서 순서대로 계산하고
+하나의 DB 트랜잭션 안에서 한 번의 bulk_create와 계좌당 한 번의 잔액 UPDATE로 저장합니다.
+한 행이라도 실패하면 아무것도 저장하지 않고 행 번호별 오류를 반환합니다.
+"""
+
+import csv
+import io
+import json
+from decimal import Decimal
+from typing import Any, Dict, List
+
+from django.conf import settings
+from django.db import transaction
+from rest_framework import serializers
+
+from apps.accounts.models import Account
+
+from . import rollups
+from .models import TransactionHistory
+from .serializers import TransactionHistorySerializer
+from .signals import transactions_bulk_changed
+
+IMPORT_FORMATS = ("csv", "json")
+
+
+class TransactionImportError(Exception):
+    """가져오기 실패. errors는 [{"row": 행 번호(1부터), "errors": {...}}, ...] 형식입니다."""
+
+    def __init__(self, errors: List[Dict[str, Any]]):
+        super().__init__(f"{len(errors)} row(s) failed validation.")
+        self.errors = errors
+
+
+class PreloadedAccountField(serializers.PrimaryKeyRelatedField):
+    """행마다 계좌를 조회하지 않도록, 미리 읽어 둔 사용자 계좌 목록(context["accounts"])에서 찾는 필드입니다."""
+
+    def to_internal_value(self, data):
+        try:
+            return self.context["accounts"][int(data)]
+        except (KeyError, TypeError, ValueError):
+            self.fail("does_not_exist", pk_value=data)
+
+
+class TransactionImportSerializer(TransactionHistorySerializer):
+    account = PreloadedAccountField(queryset=Account.objects.all())
+
+
+def parse_rows(content, import_format: str) -> List[Dict[str, Any]]:
+    """CSV(헤더 포함) 또는 JSON 배열(문자열 또는 이미 파싱된 값)을 행 목록으로 변환합니다."""
+    if import_format == "csv":
+        rows = [
+            {key: value for key, value in row.items() if key and value not in ("", None)}
+            for row in csv.DictReader(io.StringIO(content.lstrip("\ufeff")))
+        ]
+    elif import_format == "json":
+        rows = json.loads(content) if isinstance(content, str) else content
+        if isinstance(rows, dict):
+            rows = rows.get("transactions")
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError("JSON imports must be a list of transaction objects.")
+    else:
+        raise ValueError(f"Unsupported import format: {import_format!r}.")
+    if len(rows) > settings.TRANSACTION_IMPORT_MAX_ROWS:
+        raise ValueError(f"Imports are limited to {settings.TRANSACTION_IMPORT_MAX_ROWS} rows per batch.")
+    return rows
+
+
+def import_transactions(user, rows: List[Dict[str, Any]]) -> List[TransactionHistory]:
+    """
+    사용자의 계좌에 거래 행들을 일괄 저장하고 저장된 거래 목록을 반환합니다.
+    검증 또는 잔액 부족 오류가 있으면 TransactionImportError를 발생시키며 아무것도 저장하지 않습니다.
+    """
+    accounts = {account.pk: account for account in Account.objects.filter(user=user)}
+    # many=True로 검증하면 필드 정의를 한 번만 만들고 모든 행에 재사용합니다.
+    serializer = TransactionImportSerializer(data=rows, many=True, context={"accounts": accounts})
+    if not serializer.is_valid():
+        raise TransactionImportError(
+            [{"row": row_number, "errors": errors} for row_number, errors in enumerate(serializer.errors, 1) if errors]
+        )
+    validated = list(enumerate(serializer.validated_data, start=1))
+    if not validated:
+        return []
+    errors = []
+
+    with transaction.atomic():
+        # 가져오는 동안 다른 요청이 잔액을 바꾸지 못하도록 관련 계좌를 잠그고 최신 잔액을 읽습니다.
+        account_ids = {data["account"].pk for _row, data in validated}
+        balances = dict(
+            Account.objects.select_for_update().filter(pk__in=account_ids).order_by("pk").values_list("pk", "balance")
+        )
+        transactions = []
+        for row_number, data in validated:
+            account = data["account"]
+            amount = data["amount"]
+            balance = balances[account.pk]
+            if data["transaction_type"] == "DEPOSIT":
+                balance += amount
+            elif data["transaction_type"] == "WITHDRAW":
+                if balance < amount:
+                    errors.append({"row": row_number, "errors": {"non_field_errors": ["Insufficient funds."]}})
+                    continue
+                balance -= amount
+            balances[account.pk] = balance
+            transactions.append(TransactionHistory(**data, balance_after=balance))
+        if errors:
+            raise TransactionImportError(errors)
+
+        created = TransactionHistory.objects.bulk_create(transactions, batch_size=1000)
+        for account_id in account_ids:
+            Account.objects.filter(pk=account_id).update(balance=balances[account_id])
+            accounts[account_id].balance = balances[account_id]
+        rollups.record_created_many(created)
+    transactions_bulk_changed.send(sender=TransactionHistory, user_ids={user.pk})
+    return created
+
+
+def summarize(created: List[TransactionHistory]) -> Dict[str, Any]:
+    """가져오기 결과 요약 (생성 건수, 계좌별 최종 잔액)."""
+    balances: Dict[int, Decimal] = {}
+    for transaction_history in created:
+        balances[transaction_history.account_id] = transaction_history.balance_after
+    return {
+        "created": len(created),
+        "balances": {str(account_id): f"{balance:.2f}" for account_id, balance in balances.items()},
+    }
@@ -0,0 +1,62 @@
+"""
+계좌 잔액을 바꾸는 모든 거래 쓰기를 처리하는 원장 서비스.
+
+잔액은 파이썬에서 읽고-계산하고-저장하지 않고, 하나의 조건부 UPDATE(`balance = balance ± amount`)로 DB에서 바꿉니다.
+UPDATE가 계좌 행을 잠그므로 동시에 들어온 거래는 순서대로 적용되고, 잠금은 같은 DB 트랜잭션에서
+거래 내역과 집계를 저장하고 커밋할 때까지만 유지됩니다. 출금은 `balance >= amount` 조건으로 잔액 부족을 막습니다.
+"""
+
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F
+
+from apps.accounts.models import Account
+
+from . import rollups
+from .choices import TransactionType
+from .models import TransactionHistory
+
+
+class InsufficientFundsError(Exception):
+    """출금액이 계좌 잔액보다 큰 경우 발생합니다."""
+
+
+def _apply_balance_change(account_id: int, delta: Decimal, require_funds: bool = False) -> Decimal:
+    """계좌 잔액에 delta를 더하고 변경된 잔액을 반환합니다. 호출하는 쪽의 트랜잭션 안에서 실행해야 합니다."""
+    accounts = Account.objects.filter(pk=account_id)
+    if require_funds:
+        accounts = accounts.filter(balance__gte=-delta)
+    if not accounts.update(balance=F("balance") + delta):
+        if require_funds and Account.objects.filter(pk=account_id).exists():
+            raise InsufficientFundsError("Insufficient funds.")
+        raise Account.DoesNotExist(f"Account {account_id} does not exist.")
+    # 방금 UPDATE한 행은 이 트랜잭션이 잠그고 있으므로 다른 거래가 끼어들지 않은 잔액을 읽습니다.
+    return Account.objects.filter(pk=account_id).values_list("balance", flat=True).get()
+
+
+def record_transaction(transaction_history: TransactionHistory) -> TransactionHistory:
+    """
+    저장되지 않은 거래를 계좌 잔액에 반영하고 거래 후 잔액과 함께 저장합니다.
+    잔액이 부족한 출금이면 InsufficientFundsError를 발생시키며 아무것도 바꾸지 않습니다.
+    """
+    amount = transaction_history.amount
+    is_withdrawal = transaction_history.transaction_type == TransactionType.WITHDRAW
+    with transaction.atomic():
+        account = transaction_history.account
+        account.balance = _apply_balance_change(account.pk, -amount if is_withdrawal else amount, is_withdrawal)
+        transaction_history.balance_after = account.balance
+        transaction_history.save()
+        rollups.record_created(transaction_history)
+    return transaction_history
+
+
+def delete_transaction(transaction_history: TransactionHistory) -> None:
+    """거래를 삭제하고 계좌 잔액과 집계에서 되돌립니다."""
+    amount = transaction_history.amount
+    is_withdrawal = transaction_history.transaction_type == TransactionType.WITHDRAW
+    with transaction.atomic():
+        account = transaction_history.account
+        account.balance = _apply_balance_change(account.pk, amount if is_withdrawal else -amount)
+        rollups.record_deleted(transaction_history)
+        transaction_history.delete()
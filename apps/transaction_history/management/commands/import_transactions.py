@@ -0,0 +1,42 @@
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.transaction_history.imports import IMPORT_FORMATS, TransactionImportError, import_transactions, parse_rows
+from apps.users.models import CustomUser
+
+
+class Command(BaseCommand):
+    help = "Imports a CSV or JSON batch of transactions (e.g. a bank statement) into a user's accounts."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=str, help="Path to the CSV or JSON file to import.")
+        parser.add_argument("--user", required=True, help="Email of the user who owns the accounts.")
+        parser.add_argument("--format", choices=IMPORT_FORMATS, help="File format (defaults to the file extension).")
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        import_format = options["format"] or path.suffix.lstrip(".").lower()
+        if import_format not in IMPORT_FORMATS:
+            raise CommandError(f"Cannot infer the import format of {path}. Use --format.")
+        try:
+            user = CustomUser.objects.get(email=options["user"])
+        except CustomUser.DoesNotExist:
+            raise CommandError(f"User with email {options['user']} does not exist.")
+
+        try:
+            rows = parse_rows(path.read_text(encoding="utf-8"), import_format)
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+
+        started = time.perf_counter()
+        try:
+            created = import_transactions(user, rows)
+        except TransactionImportError as e:
+            for error in e.errors:
+                self.stdout.write(self.style.ERROR(f"Row {error['row']}: {error['errors']}"))
+            raise CommandError(f"Import aborted: {len(e.errors)} row(s) failed. Nothing was imported.")
+        self.stdout.write(
+            self.style.SUCCESS(f"Imported {len(created):,} transactions in {time.perf_counter() - started:.2f}s.")
+        )
@@ -0,0 +1,21 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.transaction_history.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the daily transaction rollup table from raw transaction history."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user", dest="user_ids", type=int, action="append", help="Only rebuild rollups for this user ID."
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        created = rebuild_rollups(options["user_ids"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {created:,} rollup rows in {time.perf_counter() - started:.2f}s.")
+        )
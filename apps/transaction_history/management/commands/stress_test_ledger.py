@@ -0,0 +1,106 @@
+import threading
+import time
+import uuid
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.accounts.models import Account
+from apps.transaction_history import ledger
+from apps.transaction_history.models import TransactionHistory
+from apps.users.models import CustomUser
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs concurrent deposits and withdrawals against one account through the ledger service, "
+        "verifies the final balance and reports write throughput. The test user is deleted afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=8, help="Number of concurrent writer threads.")
+        parser.add_argument("--operations", type=int, default=200, help="Transactions per thread.")
+
+    def handle(self, *args, **options):
+        threads, operations = options["threads"], options["operations"]
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            raise CommandError("Concurrent writes need PostgreSQL or a file-based SQLite database.")
+        suffix = uuid.uuid4().hex[:8]
+        user = CustomUser.objects.create_user(
+            email=f"ledger-{suffix}@example.com", password=None, name="Ledger", nickname=f"ledger-{suffix}"
+        )
+        account = Account.objects.create(
+            user=user, account_number=f"ledger-{suffix}", bank_code="088", account_type="checking"
+        )
+        try:
+            elapsed, errors = run_concurrent_writes(account, threads, operations)
+            self._report(account, threads, operations, elapsed, errors)
+        finally:
+            user.delete()
+
+    def _report(self, account, threads, operations, elapsed, errors):
+        total = threads * operations
+        account.refresh_from_db()
+        expected = Decimal(sum(amount_for(i) for i in range(operations)) * threads)
+        self.stdout.write(f"{total:,} transactions from {threads} threads in {elapsed:.2f}s")
+        self.stdout.write(f"Throughput: {total / elapsed:,.1f} transactions/sec")
+        if errors:
+            raise CommandError(f"{len(errors)} writes failed, e.g. {errors[0]!r}")
+        if account.balance != expected or not balance_chain_is_consistent(account):
+            raise CommandError(f"Lost updates: balance {account.balance}, expected {expected}.")
+        self.stdout.write(self.style.SUCCESS(f"Final balance {account.balance} is correct; no lost updates."))
+
+
+def amount_for(i: int) -> int:
+    # 입금 두 번에 출금 한 번 비율로 섞어 출금 시 잔액 조건도 함께 검증합니다.
+    return -500 if i % 3 == 2 else 1000
+
+
+def balance_chain_is_consistent(account) -> bool:
+    """
+    거래를 id 순서(= 계좌 행 잠금을 얻은 순서)로 보았을 때, 각 거래 후 잔액이 직전 잔액 ± 금액인지 확인합니다.
+    읽고-계산하고-쓰는 경합이 있었다면 이 연쇄가 끊어집니다.
+    """
+    balance = Decimal("0")
+    for transaction_type, amount, balance_after in (
+        TransactionHistory.objects.filter(account=account)
+        .order_by("id")
+        .values_list("transaction_type", "amount", "balance_after")
+    ):
+        balance += -amount if transaction_type == "WITHDRAW" else amount
+        if balance != balance_after:
+            return False
+    return True
+
+
+def run_concurrent_writes(account, threads: int, operations: int):
+    """threads개의 스레드가 각각 operations건의 거래를 같은 계좌에 기록하고, (소요 시간, 오류 목록)을 반환합니다."""
+    errors = []
+    barrier = threading.Barrier(threads)
+
+    def writer():
+        try:
+            barrier.wait()
+            for i in range(operations):
+                amount = amount_for(i)
+                ledger.record_transaction(
+                    TransactionHistory(
+                        account=account,
+                        transaction_type="WITHDRAW" if amount < 0 else "DEPOSIT",
+                        amount=Decimal(abs(amount)),
+                        transaction_method="TRANSFER",
+                    )
+                )
+        except Exception as e:
+            errors.append(e)
+        finally:
+            connection.close()
+
+    workers = [threading.Thread(target=writer) for _ in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - started, errors
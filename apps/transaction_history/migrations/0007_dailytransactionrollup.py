@@ -0,0 +1,108 @@
+# Generated by Django 5.2.5 on 2026-10-18 17:55
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+
+def populate_rollups(apps, schema_editor):
+    # 기존 거래 내역으로 일별 집계를 채웁니다. (rollups.rebuild_rollups와 같은 집계)
+    TransactionHistory = apps.get_model("transaction_history", "TransactionHistory")
+    DailyTransactionRollup = apps.get_model("transaction_history", "DailyTransactionRollup")
+    rows = (
+        TransactionHistory.objects.annotate(day=TruncDate("created_at", tzinfo=timezone.get_current_timezone()))
+        .values("account__user_id", "day", "category", "transaction_type")
+        .annotate(total_amount=Sum("amount"), transaction_count=Count("pk"))
+        .order_by()
+    )
+    DailyTransactionRollup.objects.bulk_create(
+        (
+            DailyTransactionRollup(
+                user_id=row["account__user_id"],
+                day=row["day"],
+                category=row["category"],
+                transaction_type=row["transaction_type"],
+                total_amount=row["total_amount"],
+                transaction_count=row["transaction_count"],
+            )
+            for row in rows.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transaction_history", "0006_alter_transactionhistory_category"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyTransactionRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                (
+                    "category",
+                    models.CharField(
+                        choices=[
+                            ("FOOD", "식비"),
+                            ("TRANSPORTATION", "교통"),
+                            ("SHOPPING", "쇼핑"),
+                            ("HOUSING", "주거"),
+                            ("UTILITIES", "공과금"),
+                            ("ENTERTAINMENT", "문화/여가"),
+                            ("HEALTH", "건강/의료"),
+                            ("EDUCATION", "교육"),
+                            ("FINANCE", "금융"),
+                            ("OTHER", "기타"),
+                            ("INCOME", "수입"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "transaction_type",
+                    models.CharField(
+                        choices=[("DEPOSIT", "입금"), ("WITHDRAW", "출금")],
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "total_amount",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=17),
+                ),
+                ("transaction_count", models.PositiveIntegerField(default=0)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="transaction_rollups",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "day", "category", "transaction_type"),
+                        name="unique_daily_transaction_rollup",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.5 on 2026-10-18 17:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+ROLLUP_COVERING_INDEX = "rollup_user_day_covering_idx"
+
+
+def create_postgres_covering_indexes(apps, schema_editor):
+    # 리포트/대시보드가 읽는 일별 집계는 인덱스만으로 응답할 수 있도록 PostgreSQL에서만 INCLUDE 인덱스를 만듭니다.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {ROLLUP_COVERING_INDEX} "
+        "ON transaction_history_dailytransactionrollup (user_id, day) "
+        "INCLUDE (category, transaction_type, total_amount, transaction_count)"
+    )
+
+
+def drop_postgres_covering_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {ROLLUP_COVERING_INDEX}")
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY는 트랜잭션 안에서 실행할 수 없습니다.
+    atomic = False
+
+    dependencies = [
+        ("accounts", "0002_initial"),
+        ("transaction_history", "0007_dailytransactionrollup"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transactionhistory",
+            index=models.Index(fields=["account", "created_at"], name="txn_account_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="transactionhistory",
+            index=models.Index(
+                fields=["account", "transaction_type", "created_at"], name="txn_account_type_created_idx"
+            ),
+        ),
+        # 복합 인덱스가 만들어진 뒤에 FK 단일 인덱스를 제거합니다.
+        migrations.AlterField(
+            model_name="transactionhistory",
+            name="account",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="accounts.account",
+            ),
+        ),
+        migrations.RunPython(create_postgres_covering_indexes, drop_postgres_covering_indexes),
+    ]
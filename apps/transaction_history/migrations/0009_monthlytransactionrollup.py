@@ -0,0 +1,87 @@
+# Generated by Django 5.2.5 on 2026-10-18 17:59
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Sum
+from django.db.models.functions import TruncMonth
+
+
+def populate_monthly_rollups(apps, schema_editor):
+    # 기존 일별 집계로 월별 집계를 채웁니다.
+    DailyTransactionRollup = apps.get_model("transaction_history", "DailyTransactionRollup")
+    MonthlyTransactionRollup = apps.get_model("transaction_history", "MonthlyTransactionRollup")
+    rows = (
+        DailyTransactionRollup.objects.annotate(month=TruncMonth("day"))
+        .values("user_id", "month", "transaction_type")
+        .annotate(month_total=Sum("total_amount"), month_count=Sum("transaction_count"))
+        .order_by()
+    )
+    MonthlyTransactionRollup.objects.bulk_create(
+        (
+            MonthlyTransactionRollup(
+                user_id=row["user_id"],
+                month=row["month"],
+                transaction_type=row["transaction_type"],
+                total_amount=row["month_total"],
+                transaction_count=row["month_count"],
+            )
+            for row in rows.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transaction_history", "0008_transactionhistory_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MonthlyTransactionRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("month", models.DateField()),
+                (
+                    "transaction_type",
+                    models.CharField(
+                        choices=[("DEPOSIT", "입금"), ("WITHDRAW", "출금")],
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "total_amount",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=17),
+                ),
+                ("transaction_count", models.PositiveIntegerField(default=0)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="monthly_transaction_rollups",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "month", "transaction_type"),
+                        name="unique_monthly_transaction_rollup",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_monthly_rollups, migrations.RunPython.noop),
+    ]
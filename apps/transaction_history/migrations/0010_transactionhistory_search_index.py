@@ -0,0 +1,24 @@
+from django.db import migrations
+
+from apps.transaction_history.search import create_search_index, drop_search_index
+
+
+def create_transaction_detail_index(apps, schema_editor):
+    create_search_index(schema_editor, "transaction_history_transactionhistory", "transaction_detail")
+
+
+def drop_transaction_detail_index(apps, schema_editor):
+    drop_search_index(schema_editor, "transaction_history_transactionhistory", "transaction_detail")
+
+
+class Migration(migrations.Migration):
+    # PostgreSQL의 CREATE INDEX CONCURRENTLY는 트랜잭션 안에서 실행할 수 없습니다.
+    atomic = False
+
+    dependencies = [
+        ("transaction_history", "0009_monthlytransactionrollup"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_transaction_detail_index, drop_transaction_detail_index),
+    ]
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.db import models
 
 from apps.accounts.models import Account
@@ -6,7 +7,8 @@ from apps.transaction_history.choices import TransactionCategory, TransactionMet
 
 # Create your models here.
 class TransactionHistory(models.Model):
-    account = models.ForeignKey(Account, on_delete=models.CASCADE)
+    # (account, created_at) 복합 인덱스가 account 단독 조회도 처리하므로 FK 단일 인덱스는 만들지 않습니다.
+    account = models.ForeignKey(Account, on_delete=models.CASCADE, db_index=False)
     transaction_type = models.CharField(max_length=10, choices=TransactionType.choices)
     category = models.CharField(max_length=20, choices=TransactionCategory.choices, default=TransactionCategory.OTHER)
     amount = models.DecimalField(max_digits=15, decimal_places=2)
@@ -14,3 +16,64 @@ class TransactionHistory(models.Model):
     transaction_detail = models.CharField(max_length=255, blank=True, null=True)
     transaction_method = models.CharField(max_length=20, choices=TransactionMethod.choices)
     created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # 계좌별 최신순 목록, 기간 조회 (거래 목록, API 목록, 최근 거래)
+            models.Index(fields=["account", "created_at"], name="txn_account_created_idx"),
+            # 계좌별 거래 유형 + 기간 조회 (입금/출금 필터, 유형별 합계)
+            models.Index(fields=["account", "transaction_type", "created_at"], name="txn_account_type_created_idx"),
+        ]
+
+
+class DailyTransactionRollup(models.Model):
+    """
+    사용자/일자/카테고리/거래 유형별 거래 금액 합계와 건수를 미리 집계해 둔 테이블입니다.
+
+    거래가 생성/수정/삭제될 때 `rollups` 모듈을 통해 증분으로 갱신되며,
+    리포트와 대시보드 차트는 원본 거래 대신 이 테이블을 읽습니다.
+    일자(day)는 설정된 TIME_ZONE 기준의 현지 날짜입니다.
+    """
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="transaction_rollups")
+    day = models.DateField()
+    category = models.CharField(max_length=20, choices=TransactionCategory.choices)
+    transaction_type = models.CharField(max_length=10, choices=TransactionType.choices)
+    total_amount = models.DecimalField(max_digits=17, decimal_places=2, default=0)
+    transaction_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "day", "category", "transaction_type"], name="unique_daily_transaction_rollup"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.day} {self.category}/{self.transaction_type}: {self.total_amount}"
+
+
+class MonthlyTransactionRollup(models.Model):
+    """
+    사용자/월/거래 유형별 거래 금액 합계와 건수입니다. (대시보드 월별 수입/지출 차트용)
+
+    month는 해당 월의 1일이며, 일별 집계와 함께 `rollups` 모듈에서 갱신됩니다.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="monthly_transaction_rollups"
+    )
+    month = models.DateField()
+    transaction_type = models.CharField(max_length=10, choices=TransactionType.choices)
+    total_amount = models.DecimalField(max_digits=17, decimal_places=2, default=0)
+    transaction_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "month", "transaction_type"], name="unique_monthly_transaction_rollup"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.month:%Y-%m} {self.transaction_type}: {self.total_amount}"
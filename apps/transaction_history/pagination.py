@@ -0,0 +1,92 @@
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+
+
+class TransactionCursorPagination(CursorPagination):
+    """
+    거래 내역 목록용 커서(keyset) 페이지네이션.
+
+    (created_at, id) 역순으로 정렬하고, 커서에는 페이지 경계 행의 (created_at, id)를 담습니다.
+    다음 페이지는 `created_at < c OR (created_at = c AND id < i)` 조건으로 읽으므로, 같은 created_at을 가진 행이
+    많아도 OFFSET 없이 거래 내역 수와 관계없는 비용으로 조회합니다.
+    (DRF CursorPagination은 첫 번째 정렬 필드만 커서에 담고 같은 값의 행은 OFFSET으로 건너뜁니다.)
+    커서 인코딩, 페이지 크기, 응답 형식은 DRF CursorPagination의 공개 메서드를 그대로 사용합니다.
+    """
+
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    ordering = ("-created_at", "-id")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self._page_queryset(queryset, request)
+        if queryset is None:
+            return None
+        return self._set_page(list(queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset의 비동기 버전. 같은 쿼리를 비동기 ORM(`async for`)으로 실행합니다."""
+        queryset = self._page_queryset(queryset, request)
+        if queryset is None:
+            return None
+        return self._set_page([obj async for obj in queryset])
+
+    def _page_queryset(self, queryset, request):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        self.position = self._decode_position(self.cursor.position) if self.cursor else None
+
+        if self.cursor is not None and self.cursor.reverse:
+            # 이전 페이지: 기준 행보다 최신인 행을 오래된 순서로 읽은 뒤 뒤집습니다.
+            queryset = queryset.order_by("created_at", "id")
+            if self.position is not None:
+                created_at, pk = self.position
+                queryset = queryset.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+            if self.position is not None:
+                created_at, pk = self.position
+                queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+        # 다음(또는 이전) 페이지가 있는지 알기 위해 한 건을 더 읽습니다.
+        return queryset[: self.page_size + 1]
+
+    def _set_page(self, results):
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        if self.cursor is not None and self.cursor.reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.position is not None
+        self.display_page_controls = self.has_next or self.has_previous
+        return self.page
+
+    def _decode_position(self, position):
+        created_at, _, pk = (position or "").rpartition("|")
+        try:
+            created_at, pk = parse_datetime(created_at), int(pk)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if created_at is None:
+            raise NotFound(self.invalid_cursor_message)
+        return created_at, pk
+
+    def _link(self, instance, reverse):
+        position = f"{instance.created_at.isoformat()}|{instance.pk}"
+        return self.encode_cursor(Cursor(offset=0, reverse=reverse, position=position))
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self._link(self.page[0], reverse=True)
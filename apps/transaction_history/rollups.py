@@ -0,0 +1,225 @@
+"""
+거래 일별/월별 집계(DailyTransactionRollup, MonthlyTransactionRollup) 갱신 함수.
+
+거래를 생성/수정/삭제하는 코드는 같은 DB 트랜잭션 안에서 아래 함수를 호출하여 집계를 함께 갱신합니다.
+집계가 원본과 어긋난 경우 `manage.py rebuild_transaction_rollups`로 처음부터 다시 만들 수 있으며,
+Celery beat가 매일 밤 전체 집계를 다시 만듭니다.
+
+집계가 바뀌어 커밋되면 사용자별 워터마크(캐시에 저장한 임의 토큰)를 새 값으로 바꿉니다.
+소비 리포트는 집계만 읽으므로, 리포트를 만들 때의 워터마크와 지금의 워터마크가 같으면 다시 만들 필요가 없습니다.
+"""
+
+import logging
+import uuid
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate, TruncMonth
+from django.utils import timezone
+
+from .models import DailyTransactionRollup, MonthlyTransactionRollup, TransactionHistory
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_KEY = "transactions:rollup-watermark:{user_id}"
+# 전체 집계를 다시 만들면 모든 사용자의 워터마크가 바뀐 것으로 봅니다.
+GLOBAL_WATERMARK_KEY = "transactions:rollup-watermark"
+
+
+def _touch_watermarks(user_ids: Optional[List[int]]) -> None:
+    keys = [GLOBAL_WATERMARK_KEY] if user_ids is None else [WATERMARK_KEY.format(user_id=u) for u in set(user_ids)]
+    try:
+        cache.set_many({key: uuid.uuid4().hex for key in keys}, timeout=None)
+    except Exception as e:
+        logger.error("Rollup watermark update failed (users: %s): %s", user_ids, e)
+
+
+def mark_rollups_changed(user_ids: Optional[Iterable[int]] = None) -> None:
+    """현재 DB 트랜잭션이 커밋된 뒤 사용자들(None이면 전체)의 워터마크를 바꿉니다."""
+    user_ids = None if user_ids is None else list(user_ids)
+    transaction.on_commit(lambda: _touch_watermarks(user_ids))
+
+
+def _watermark(global_value, user_value) -> str:
+    return f"{global_value}:{user_value}"
+
+
+def rollup_watermark(user_id: int) -> str:
+    """
+    사용자 집계의 현재 워터마크. 캐시에 값이 없으면(처음이거나 캐시에서 지워진 경우) 새 토큰을 만들어,
+    이전에 기록해 둔 워터마크와 우연히 같아지는 일이 없게 합니다.
+    """
+    keys = [GLOBAL_WATERMARK_KEY, WATERMARK_KEY.format(user_id=user_id)]
+    values = cache.get_many(keys)
+    for key in keys:
+        if key not in values:
+            cache.add(key, uuid.uuid4().hex, timeout=None)
+            values[key] = cache.get(key)
+    return _watermark(*(values[key] for key in keys))
+
+
+def existing_rollup_watermarks(user_ids: Iterable[int]) -> Dict[int, str]:
+    """캐시에 워터마크가 있는 사용자들의 {user_id: 워터마크}. 여러 사용자를 한 번의 캐시 조회로 읽습니다."""
+    keys = {WATERMARK_KEY.format(user_id=user_id): user_id for user_id in user_ids}
+    values = cache.get_many([GLOBAL_WATERMARK_KEY, *keys])
+    if GLOBAL_WATERMARK_KEY not in values:
+        return {}
+    return {
+        user_id: _watermark(values[GLOBAL_WATERMARK_KEY], values[key]) for key, user_id in keys.items() if key in values
+    }
+
+
+class RollupEntry(NamedTuple):
+    """거래 한 건이 집계 테이블에 기여하는 (집계 키, 금액)입니다. 수정 전 상태를 기억할 때 사용합니다."""
+
+    user_id: int
+    day: object
+    category: str
+    transaction_type: str
+    amount: Decimal
+
+
+def rollup_entry(transaction_history: TransactionHistory) -> RollupEntry:
+    return RollupEntry(
+        user_id=transaction_history.account.user_id,
+        day=timezone.localdate(transaction_history.created_at),
+        category=transaction_history.category,
+        transaction_type=transaction_history.transaction_type,
+        amount=transaction_history.amount,
+    )
+
+
+def _upsert(model, key: Dict[str, Any], amount: Decimal, count: int) -> None:
+    rollups = model.objects.filter(**key)
+    changes = {"total_amount": F("total_amount") + amount, "transaction_count": F("transaction_count") + count}
+    if rollups.update(**changes):
+        if count < 0:
+            rollups.filter(transaction_count=0).delete()
+        return
+    if count <= 0:
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(**key, total_amount=amount, transaction_count=count)
+    except IntegrityError:
+        # 다른 요청이 같은 집계 행을 먼저 만든 경우 그 행에 더합니다.
+        rollups.update(**changes)
+
+
+def _apply(entry: RollupEntry, amount: Decimal, count: int) -> None:
+    mark_rollups_changed([entry.user_id])
+    _upsert(
+        DailyTransactionRollup,
+        {
+            "user_id": entry.user_id,
+            "day": entry.day,
+            "category": entry.category,
+            "transaction_type": entry.transaction_type,
+        },
+        amount,
+        count,
+    )
+    _upsert(
+        MonthlyTransactionRollup,
+        {"user_id": entry.user_id, "month": entry.day.replace(day=1), "transaction_type": entry.transaction_type},
+        amount,
+        count,
+    )
+
+
+def record_created(transaction_history: TransactionHistory) -> None:
+    """새로 저장된 거래를 집계에 더합니다."""
+    entry = rollup_entry(transaction_history)
+    _apply(entry, entry.amount, 1)
+
+
+def record_created_many(transactions: Iterable[TransactionHistory]) -> None:
+    """bulk_create로 저장한 거래들을 집계 키별로 합산하여 키마다 한 번씩 더합니다."""
+    totals: Dict[tuple, list] = {}
+    for transaction_history in transactions:
+        entry = rollup_entry(transaction_history)
+        total = totals.setdefault(entry[:4], [Decimal("0"), 0])
+        total[0] += entry.amount
+        total[1] += 1
+    for key, (amount, count) in totals.items():
+        _apply(RollupEntry(*key, amount), amount, count)
+
+
+def record_deleted(transaction_history: TransactionHistory) -> None:
+    """삭제되는 거래를 집계에서 뺍니다. 거래를 삭제하기 전에 호출합니다."""
+    entry = rollup_entry(transaction_history)
+    _apply(entry, -entry.amount, -1)
+
+
+def record_updated(before: RollupEntry, transaction_history: TransactionHistory) -> None:
+    """수정 전 상태(`rollup_entry`로 기억해 둔 값)와 수정 후 거래를 비교하여 집계를 옮깁니다."""
+    after = rollup_entry(transaction_history)
+    if before[:4] == after[:4]:
+        if before.amount != after.amount:
+            _apply(after, after.amount - before.amount, 0)
+        return
+    _apply(before, -before.amount, -1)
+    _apply(after, after.amount, 1)
+
+
+def rebuild_rollups(user_ids: Optional[Iterable[int]] = None, batch_size: int = 1000) -> int:
+    """
+    원본 거래 내역으로부터 일별 집계를 다시 만들고, 일별 집계로부터 월별 집계를 다시 만듭니다.
+    user_ids가 주어지면 해당 사용자만 다시 만듭니다. 생성한 일별 집계 행 수를 반환합니다.
+    """
+    daily_rollups = DailyTransactionRollup.objects.all()
+    monthly_rollups = MonthlyTransactionRollup.objects.all()
+    transactions = TransactionHistory.objects.all()
+    if user_ids is not None:
+        user_ids = list(user_ids)
+        daily_rollups = daily_rollups.filter(user_id__in=user_ids)
+        monthly_rollups = monthly_rollups.filter(user_id__in=user_ids)
+        transactions = transactions.filter(account__user_id__in=user_ids)
+
+    daily_rows = (
+        transactions.annotate(day=TruncDate("created_at", tzinfo=timezone.get_current_timezone()))
+        .values("account__user_id", "day", "category", "transaction_type")
+        .annotate(total_amount=Sum("amount"), transaction_count=Count("pk"))
+        .order_by()
+    )
+    with transaction.atomic():
+        mark_rollups_changed(user_ids)
+        daily_rollups.delete()
+        monthly_rollups.delete()
+        created = DailyTransactionRollup.objects.bulk_create(
+            (
+                DailyTransactionRollup(
+                    user_id=row["account__user_id"],
+                    day=row["day"],
+                    category=row["category"],
+                    transaction_type=row["transaction_type"],
+                    total_amount=row["total_amount"],
+                    transaction_count=row["transaction_count"],
+                )
+                for row in daily_rows.iterator()
+            ),
+            batch_size=batch_size,
+        )
+        monthly_rows = (
+            daily_rollups.annotate(month=TruncMonth("day"))
+            .values("user_id", "month", "transaction_type")
+            .annotate(month_total=Sum("total_amount"), month_count=Sum("transaction_count"))
+            .order_by()
+        )
+        MonthlyTransactionRollup.objects.bulk_create(
+            (
+                MonthlyTransactionRollup(
+                    user_id=row["user_id"],
+                    month=row["month"],
+                    transaction_type=row["transaction_type"],
+                    total_amount=row["month_total"],
+                    transaction_count=row["month_count"],
+                )
+                for row in monthly_rows.iterator()
+            ),
+            batch_size=batch_size,
+        )
+    return len(created)
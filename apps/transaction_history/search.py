@@ -0,0 +1,93 @@
+"""
+거래 내용/감정 분석 메모 같은 한글 텍스트의 부분 문자열 검색.
+
+`icontains`(LIKE '%검색어%')는 일반 B-tree 인덱스를 쓰지 못해 사용자의 모든 행을 읽습니다.
+글자 단위 3-gram(trigram) 인덱스를 만들어 띄어쓰기/형태소와 관계없이 한글 부분 문자열을 인덱스로 찾습니다.
+
+- PostgreSQL: pg_trgm 확장의 GIN 인덱스를 Django의 icontains 식(`UPPER(col::text)`)에 만들어
+  기존 icontains 쿼리가 그대로 인덱스를 사용합니다. 인덱스는 DB가 쓰기마다 갱신합니다.
+  (한글이 단어 문자로 인식되도록 DB의 LC_CTYPE이 UTF-8 로케일이어야 합니다.)
+- SQLite: trigram 토크나이저를 쓰는 FTS5 외부 콘텐츠 테이블과, 원본 테이블의 INSERT/UPDATE/DELETE
+  트리거로 색인을 동기화합니다. bulk_create/QuerySet.update()도 트리거로 반영됩니다.
+  SQLite에서 원본 테이블을 다시 만드는 마이그레이션(AlterField 등)은 트리거를 지우므로,
+  그 마이그레이션 뒤에 `create_search_index`를 다시 실행해야 합니다.
+
+3글자보다 짧은 검색어는 trigram으로 찾을 수 없으므로 icontains로 검색합니다.
+"""
+
+import django_filters
+from django.db import connections
+from django.db.models.expressions import RawSQL
+from django_filters.constants import EMPTY_VALUES
+
+MIN_INDEXED_QUERY_LENGTH = 3
+
+
+def _index_name(table: str, column: str) -> str:
+    return f"{table}_{column}_trgm"
+
+
+def create_search_index(schema_editor, table: str, column: str) -> None:
+    """마이그레이션에서 호출하여 table.column의 검색 색인을 만듭니다. 이미 있으면 아무것도 하지 않습니다."""
+    name = _index_name(table, column)
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        schema_editor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+        )
+    elif vendor == "sqlite":
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {name} "
+            f"USING fts5({column}, content='{table}', content_rowid='id', tokenize='trigram')"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {name}_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {name}(rowid, {column}) VALUES (new.id, new.{column}); END"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {name}_ad AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {name}({name}, rowid, {column}) VALUES ('delete', old.id, old.{column}); END"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {name}_au AFTER UPDATE OF {column} ON {table} BEGIN "
+            f"INSERT INTO {name}({name}, rowid, {column}) VALUES ('delete', old.id, old.{column}); "
+            f"INSERT INTO {name}(rowid, {column}) VALUES (new.id, new.{column}); END"
+        )
+        # 이미 있던 행을 색인합니다.
+        schema_editor.execute(f"INSERT INTO {name}({name}) VALUES ('rebuild')")
+
+
+def drop_search_index(schema_editor, table: str, column: str) -> None:
+    name = _index_name(table, column)
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    elif vendor == "sqlite":
+        for suffix in ("ai", "ad", "au"):
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {name}_{suffix}")
+        schema_editor.execute(f"DROP TABLE IF EXISTS {name}")
+
+
+def search(queryset, field_name: str, value: str):
+    """queryset에서 field_name에 value를 포함하는 행을 찾습니다(대소문자 무시)."""
+    value = (value or "").strip()
+    if not value:
+        return queryset
+    field = queryset.model._meta.get_field(field_name)
+    if connections[queryset.db].vendor == "sqlite" and len(value) >= MIN_INDEXED_QUERY_LENGTH:
+        name = _index_name(queryset.model._meta.db_table, field.column)
+        # 큰따옴표로 감싼 구(phrase)로 검색해야 FTS5 연산자 없이 부분 문자열로 해석됩니다.
+        phrase = '"{}"'.format(value.replace('"', '""'))
+        return queryset.filter(pk__in=RawSQL(f"SELECT rowid FROM {name} WHERE {name} MATCH %s", (phrase,)))
+    return queryset.filter(**{f"{field_name}__icontains": value})
+
+
+class SearchFilter(django_filters.CharFilter):
+    """`search()`로 부분 문자열을 검색하는 CharFilter. icontains 필터 대신 사용합니다."""
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+        qs = search(qs, self.field_name, value)
+        return qs.distinct() if self.distinct else qs
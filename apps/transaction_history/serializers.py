@@ -4,7 +4,15 @@ from .models import TransactionHistory
 
 
 class TransactionHistorySerializer(serializers.ModelSerializer):
+    """`fields` 인자로 응답에 포함할 필드를 제한할 수 있는 거래 내역 시리얼라이저입니다."""
+
     class Meta:
         model = TransactionHistory
         fields = "__all__"
         read_only_fields = ("balance_after",)
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
@@ -0,0 +1,19 @@
+from django.db.models.signals import post_delete
+from django.dispatch import Signal, receiver
+
+from apps.accounts.models import Account
+
+from . import rollups
+
+# bulk_create/update처럼 모델 시그널을 보내지 않는 경로로 거래가 저장된 뒤 보내는 시그널입니다.
+# 인자: user_ids (거래가 바뀐 사용자 ID 집합)
+transactions_bulk_changed = Signal()
+
+
+@receiver(post_delete, sender=Account)
+def rebuild_rollups_on_account_delete(sender, instance, **kwargs):
+    """
+    계좌를 삭제하면 CASCADE로 지워지는 거래는 집계 갱신 경로를 거치지 않으므로, 소유자의 집계를 남은 거래로 다시 만듭니다.
+    같은 DB 트랜잭션에서 거래가 이미 지워진 뒤 실행되며, 사용자 삭제로 함께 지워지는 경우에는 남은 거래가 없어 집계도 비게 됩니다.
+    """
+    rollups.rebuild_rollups([instance.user_id])
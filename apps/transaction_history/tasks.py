@@ -0,0 +1,26 @@
+import logging
+
+from celery import shared_task
+from django.conf import settings
+
+from apps.users.models import CustomUser
+
+from .rollups import rebuild_rollups
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def rebuild_all_transaction_rollups() -> int:
+    """
+    모든 사용자의 일별/월별 거래 집계를 원본 거래 내역으로부터 다시 만듭니다. (야간 정합성 보정)
+
+    한 번에 잠그는 범위를 줄이기 위해 사용자 ID 순으로 ROLLUP_REBUILD_BATCH_SIZE명씩 나누어 처리합니다.
+    """
+    batch_size = settings.ROLLUP_REBUILD_BATCH_SIZE
+    user_ids = list(CustomUser.objects.order_by("id").values_list("id", flat=True))
+    created = 0
+    for i in range(0, len(user_ids), batch_size):
+        created += rebuild_rollups(user_ids[i : i + batch_size])
+    logger.info("Rebuilt %s daily rollup rows for %s users.", created, len(user_ids))
+    return created
@@ -1,11 +1,33 @@
+import csv
+import gzip
+import io
+import json
+from datetime import timedelta
 from decimal import Decimal
+from unittest import SkipTest
 
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from apps.accounts.models import Account
-from apps.transaction_history.models import TransactionHistory
+from apps.transaction_history import ledger
+from apps.transaction_history.management.commands.stress_test_ledger import (
+    amount_for,
+    balance_chain_is_consistent,
+    run_concurrent_writes,
+)
+from apps.transaction_history.models import (
+    DailyTransactionRollup,
+    MonthlyTransactionRollup,
+    TransactionHistory,
+)
+from apps.transaction_history.rollups import rebuild_rollups, rollup_watermark
 from apps.users.models import CustomUser
 
 
@@ -49,8 +71,100 @@ class TransactionHistoryViewSetTestCase(APITestCase):
         """거래 내역 목록 조회 테스트"""
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["id"], self.transaction.id)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["id"], self.transaction.id)
+
+    def test_list_transactions_cursor_pagination(self):
+        """커서 페이지네이션이 (created_at, id) 역순으로 중복/누락 없이 모든 거래를 반환하는지 테스트"""
+        for i in range(4):
+            TransactionHistory.objects.create(
+                account=self.account,
+                transaction_type="WITHDRAW",
+                amount=Decimal("1000.00"),
+                balance_after=Decimal("0.00"),
+                transaction_method="CARD",
+            )
+        # 같은 created_at을 가진 거래가 있어도 순서가 고정되어야 합니다.
+        TransactionHistory.objects.update(created_at=self.transaction.created_at)
+        expected = list(TransactionHistory.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+
+        ids = []
+        url = f"{self.url}?page_size=2"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), 2)
+            ids.extend(item["id"] for item in response.data["results"])
+            url = response.data["next"]
+        self.assertEqual(ids, expected)
+
+    def test_cursor_pages_through_shared_created_at_without_offset(self):
+        """같은 created_at을 가진 거래가 많아도 (created_at, id) 커서로 OFFSET 없이 앞뒤로 이동하는지 테스트"""
+        TransactionHistory.objects.bulk_create(
+            TransactionHistory(
+                account=self.account,
+                transaction_type="WITHDRAW",
+                amount=Decimal("1000.00"),
+                balance_after=Decimal("0.00"),
+                transaction_method="CARD",
+            )
+            for _ in range(30)
+        )
+        TransactionHistory.objects.update(created_at=self.transaction.created_at)
+        expected = list(TransactionHistory.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+
+        pages, url = [], f"{self.url}?page_size=4"
+        while url:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertFalse([q["sql"] for q in queries if "OFFSET" in q["sql"]])
+            pages.append([item["id"] for item in response.data["results"]])
+            url, previous = response.data["next"], response.data["previous"]
+        self.assertEqual(sum(pages, []), expected)
+
+        # 마지막 페이지에서 이전 링크를 따라가면 같은 페이지들을 역순으로 지납니다.
+        backwards = []
+        while previous:
+            response = self.client.get(previous)
+            backwards.append([item["id"] for item in response.data["results"]])
+            previous = response.data["previous"]
+        self.assertEqual(backwards, pages[-2::-1])
+
+    def test_list_transactions_field_projection(self):
+        """fields 파라미터로 요청한 필드만 응답하고, 해당 컬럼만 조회하는지 테스트"""
+        response = self.client.get(self.url, {"fields": "id,amount"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], [{"id": self.transaction.id, "amount": "50000.00"}])
+
+        response = self.client.get(self.url, {"fields": "id,password"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_search_transaction_details(self):
+        """search 파라미터가 검색 색인으로 한글 부분 문자열을 찾고, 색인이 수정/삭제를 따라가는지 테스트"""
+        coffee = TransactionHistory.objects.create(
+            account=self.account,
+            transaction_type="WITHDRAW",
+            amount=Decimal("4500.00"),
+            balance_after=Decimal("145500.00"),
+            transaction_detail="스타벅스 강남점 아메리카노",
+            transaction_method="CARD",
+        )
+
+        def search(query):
+            response = self.client.get(self.url, {"search": query})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return [item["id"] for item in response.data["results"]]
+
+        self.assertEqual(search("강남점"), [coffee.id])
+        self.assertEqual(search("test dep"), [self.transaction.id])
+        self.assertEqual(search("스타"), [coffee.id])
+
+        TransactionHistory.objects.filter(pk=coffee.pk).update(transaction_detail="이디야 역삼점")
+        self.assertEqual(search("강남점"), [])
+        self.assertEqual(search("역삼점"), [coffee.id])
+
+        coffee.delete()
+        self.assertEqual(search("역삼점"), [])
 
     def test_retrieve_transaction(self):
         """특정 거래 내역 상세 조회 테스트"""
@@ -122,6 +236,350 @@ class TransactionHistoryViewSetTestCase(APITestCase):
         """거래 내역 삭제 테스트"""
         # 일반적으로 거래 내역은 삭제하지 않지만, ViewSet이 허용하므로 테스트합니다.
         url = reverse("transaction-detail", kwargs={"pk": self.transaction.pk})
+        initial_balance = self.account.balance
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(TransactionHistory.objects.filter(pk=self.transaction.pk).exists())
+        # API 수정/삭제는 집계만 갱신하고 계좌 잔액은 바꾸지 않습니다.
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, initial_balance)
+
+    def test_update_transaction_keeps_balance(self):
+        """거래 내역 수정 시 계좌 잔액과 거래 후 잔액이 바뀌지 않는지 테스트"""
+        url = reverse("transaction-detail", kwargs={"pk": self.transaction.pk})
+        initial_balance = self.account.balance
+        balance_after = self.transaction.balance_after
+        response = self.client.patch(url, {"amount": "99999.00"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, initial_balance)
+        self.transaction.refresh_from_db()
+        self.assertEqual(self.transaction.amount, Decimal("99999.00"))
+        self.assertEqual(self.transaction.balance_after, balance_after)
+
+
+class TransactionExportTestCase(APITestCase):
+    def setUp(self):
+        """테스트 케이스를 위한 초기 설정"""
+        self.user = CustomUser.objects.create_user(
+            email="export@example.com", password="password123", name="Export User", nickname="export"
+        )
+        self.client.force_authenticate(user=self.user)
+        account = Account.objects.create(
+            user=self.user, account_number="110-220-330443", bank_code="088", account_type="checking"
+        )
+        for transaction_type, detail, amount in [
+            ("DEPOSIT", "월급", "3000000.00"),
+            ("WITHDRAW", '=HYPERLINK("http://example.com")', "4500.00"),
+            ("WITHDRAW", "점심", "9000.00"),
+        ]:
+            TransactionHistory.objects.create(
+                account=account,
+                transaction_type=transaction_type,
+                amount=Decimal(amount),
+                balance_after=Decimal("0.00"),
+                transaction_detail=detail,
+                transaction_method="CARD",
+            )
+        self.url = reverse("transaction-export")
+
+    def test_export_csv_honours_filters(self):
+        """CSV 내보내기가 목록 필터를 적용하고, 수식으로 해석될 수 있는 값을 이스케이프하는지 테스트"""
+        response = self.client.get(self.url, {"transaction_type": "withdraw"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        rows = list(csv.reader(io.StringIO(b"".join(response.streaming_content).decode("utf-8-sig"))))
+        self.assertEqual(rows[0][:3], ["id", "account", "transaction_type"])
+        self.assertEqual([row[6] for row in rows[1:]], ['\'=HYPERLINK("http://example.com")', "점심"])
+
+        response = self.client.get(self.url, {"transaction_detail": "점심"})
+        self.assertEqual(len(b"".join(response.streaming_content).decode("utf-8-sig").splitlines()), 2)
+
+    def test_export_gzipped_ndjson(self):
+        """gzip으로 압축된 NDJSON을 요청한 필드만 포함하여 내보내는지 테스트"""
+        response = self.client.get(self.url, {"export_format": "ndjson", "gzip": "1", "fields": "amount,created_at"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        lines = gzip.decompress(b"".join(response.streaming_content)).decode("utf-8").splitlines()
+        records = [json.loads(line) for line in lines]
+        self.assertEqual([record["amount"] for record in records], ["3000000.00", "4500.00", "9000.00"])
+        self.assertEqual(set(records[0]), {"amount", "created_at"})
+
+        response = self.client.get(self.url, {"export_format": "xlsx"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TransactionImportTestCase(APITestCase):
+    def setUp(self):
+        """테스트 케이스를 위한 초기 설정"""
+        self.user = CustomUser.objects.create_user(
+            email="import@example.com", password="password123", name="Import User", nickname="import"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="110-220-330444",
+            bank_code="088",
+            account_type="checking",
+            balance=Decimal("10000.00"),
+        )
+        self.url = reverse("transaction-bulk-import")
+
+    def _row(self, transaction_type, amount, **extra):
+        return {
+            "account": self.account.pk,
+            "transaction_type": transaction_type,
+            "amount": amount,
+            "transaction_method": "TRANSFER",
+            **extra,
+        }
+
+    def test_import_applies_running_balances(self):
+        """가져온 거래의 거래 후 잔액이 순서대로 계산되고, 계좌 잔액과 집계가 한 번에 갱신되는지 테스트"""
+        rows = [
+            self._row("DEPOSIT", "50000.00", transaction_detail="월급"),
+            self._row("WITHDRAW", "4500.00", category="FOOD"),
+            self._row("WITHDRAW", "5500.00", category="FOOD"),
+        ]
+        response = self.client.post(self.url, rows, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 3)
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("50000.00"))
+        self.assertEqual(
+            list(TransactionHistory.objects.order_by("id").values_list("balance_after", flat=True)),
+            [Decimal("60000.00"), Decimal("55500.00"), Decimal("50000.00")],
+        )
+        food = DailyTransactionRollup.objects.get(user=self.user, category="FOOD")
+        self.assertEqual((food.total_amount, food.transaction_count), (Decimal("10000.00"), 2))
+
+    def test_import_reports_row_errors_and_imports_nothing(self):
+        """잘못된 행이나 잔액 부족 행이 있으면 행 번호별 오류를 반환하고 아무것도 저장하지 않는지 테스트"""
+        other_account = Account.objects.create(
+            user=CustomUser.objects.create_user(
+                email="other@example.com", password="password123", name="Other", nickname="other"
+            ),
+            account_number="110-220-330445",
+            bank_code="088",
+            account_type="checking",
+        )
+        rows = [
+            self._row("DEPOSIT", "1000.00"),
+            self._row("WITHDRAW", "not-a-number"),
+            {**self._row("DEPOSIT", "1000.00"), "account": other_account.pk},
+        ]
+        response = self.client.post(self.url, rows, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([error["row"] for error in response.data["errors"]], [2, 3])
+
+        response = self.client.post(self.url, [self._row("WITHDRAW", "20000.00")], format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["errors"][0]["row"], 1)
+        self.assertFalse(TransactionHistory.objects.exists())
+
+    def test_import_csv_upload(self):
+        """CSV 파일 업로드로 거래를 가져오는지 테스트"""
+        content = "account,transaction_type,amount,transaction_method,transaction_detail\n"
+        content += f"{self.account.pk},WITHDRAW,3000.00,CARD,커피\n{self.account.pk},DEPOSIT,1000.00,CASH,\n"
+        upload = SimpleUploadedFile("statement.csv", content.encode("utf-8"), content_type="text/csv")
+        response = self.client.post(self.url, {"file": upload}, format="multipart")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["balances"], {str(self.account.pk): "8000.00"})
+
+
+class DailyTransactionRollupTestCase(APITestCase):
+    def setUp(self):
+        """테스트 케이스를 위한 초기 설정"""
+        self.user = CustomUser.objects.create_user(
+            email="rollup@example.com", password="password123", name="Rollup User", nickname="rollup"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="110-220-330441",
+            bank_code="088",
+            account_type="checking",
+            balance=Decimal("100000.00"),
+        )
+        self.url = reverse("transaction-list")
+
+    def _rollups(self):
+        return set(
+            DailyTransactionRollup.objects.filter(user=self.user).values_list(
+                "day", "category", "transaction_type", "total_amount", "transaction_count"
+            )
+        )
+
+    def _create(self, amount, category="FOOD"):
+        data = {
+            "account": self.account.pk,
+            "transaction_type": "WITHDRAW",
+            "category": category,
+            "amount": amount,
+            "transaction_method": "CARD",
+        }
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data["id"]
+
+    def test_rollups_follow_create_update_and_delete(self):
+        """API로 거래를 생성/수정/삭제하면 일별 집계가 함께 갱신되고, 다시 만든 집계와 일치하는지 테스트"""
+        first = self._create("4500.00")
+        self._create("1500.00")
+        today = timezone.localdate()
+        self.assertEqual(self._rollups(), {(today, "FOOD", "WITHDRAW", Decimal("6000.00"), 2)})
+
+        url = reverse("transaction-detail", kwargs={"pk": first})
+        response = self.client.patch(url, {"category": "SHOPPING"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self._rollups(),
+            {
+                (today, "FOOD", "WITHDRAW", Decimal("1500.00"), 1),
+                (today, "SHOPPING", "WITHDRAW", Decimal("4500.00"), 1),
+            },
+        )
+
+        self.assertEqual(self.client.delete(url).status_code, status.HTTP_204_NO_CONTENT)
+        incremental = self._rollups()
+        self.assertEqual(incremental, {(today, "FOOD", "WITHDRAW", Decimal("1500.00"), 1)})
+
+        monthly = set(
+            MonthlyTransactionRollup.objects.filter(user=self.user).values_list(
+                "month", "transaction_type", "total_amount", "transaction_count"
+            )
+        )
+        self.assertEqual(monthly, {(today.replace(day=1), "WITHDRAW", Decimal("1500.00"), 1)})
+
+        rebuild_rollups([self.user.pk])
+        self.assertEqual(self._rollups(), incremental)
+        self.assertEqual(
+            set(
+                MonthlyTransactionRollup.objects.filter(user=self.user).values_list(
+                    "month", "transaction_type", "total_amount", "transaction_count"
+                )
+            ),
+            monthly,
+        )
+
+    def test_account_delete_removes_its_transactions_from_rollups(self):
+        """계좌를 삭제하면 CASCADE로 지워진 거래가 집계와 워터마크에 바로 반영되는지 테스트"""
+        self._create("4500.00")
+        other = Account.objects.create(
+            user=self.user, account_number="110-220-330442", bank_code="088", balance=Decimal("100000.00")
+        )
+        ledger.record_transaction(
+            TransactionHistory(account=other, transaction_type="WITHDRAW", category="FOOD", amount=Decimal("1500.00"))
+        )
+        watermark = rollup_watermark(self.user.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(reverse("account-detail", kwargs={"pk": self.account.pk}))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        today = timezone.localdate()
+        self.assertEqual(self._rollups(), {(today, "FOOD", "WITHDRAW", Decimal("1500.00"), 1)})
+        self.assertEqual(
+            list(MonthlyTransactionRollup.objects.filter(user=self.user).values_list("total_amount", flat=True)),
+            [Decimal("1500.00")],
+        )
+        self.assertNotEqual(rollup_watermark(self.user.pk), watermark)
+
+        # 사용자 삭제로 계좌와 거래가 함께 지워져도 집계가 남지 않습니다.
+        self.user.delete()
+        self.assertFalse(DailyTransactionRollup.objects.exists())
+        self.assertFalse(MonthlyTransactionRollup.objects.exists())
+
+
+class TransactionHistoryIndexTestCase(TestCase):
+    """자주 실행되는 조회가 전체 테이블을 읽지 않고 인덱스를 사용하는지 EXPLAIN으로 확인합니다."""
+
+    @classmethod
+    def setUpTestData(cls):
+        users = [
+            CustomUser.objects.create_user(
+                email=f"index{i}@example.com", password="password123", name=f"Index {i}", nickname=f"index{i}"
+            )
+            for i in range(20)
+        ]
+        accounts = Account.objects.bulk_create(
+            [
+                Account(user=user, account_number=f"110-000-{i:06d}", bank_code="088", account_type="checking")
+                for i, user in enumerate(users)
+            ]
+        )
+        TransactionHistory.objects.bulk_create(
+            [
+                TransactionHistory(
+                    account=account,
+                    transaction_type="DEPOSIT" if i % 5 == 0 else "WITHDRAW",
+                    amount=Decimal("1000.00"),
+                    balance_after=Decimal("0.00"),
+                    transaction_method="CARD",
+                )
+                for account in accounts
+                for i in range(100)
+            ]
+        )
+        rebuild_rollups()
+        cls.user = users[0]
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def assertUsesIndex(self, queryset, index_name=None):
+        plan = queryset.explain()
+        table = queryset.model._meta.db_table
+        # SQLite는 'SCAN <table>', PostgreSQL은 'Seq Scan on <table>'으로 전체 테이블 스캔을 표시합니다.
+        self.assertNotRegex(plan, rf"(SCAN|Seq Scan on) {table}\b", plan)
+        if index_name:
+            self.assertIn(index_name, plan)
+
+    def test_hot_queries_use_index_scans(self):
+        now = timezone.now()
+        transactions = TransactionHistory.objects.filter(account__user=self.user)
+        # 거래 목록 / API 목록 (최신순)
+        self.assertUsesIndex(transactions.order_by("-created_at"), "txn_account_")
+        # 거래 유형 + 기간 필터
+        self.assertUsesIndex(
+            transactions.filter(transaction_type="DEPOSIT", created_at__gte=now - timedelta(days=30)),
+            "txn_account_type_created_idx",
+        )
+        # 리포트 / 대시보드 (일별 집계)
+        self.assertUsesIndex(
+            DailyTransactionRollup.objects.filter(
+                user=self.user, day__range=(now.date() - timedelta(days=30), now.date())
+            ).values("category", "transaction_type")
+        )
+
+
+class LedgerConcurrencyTestCase(TransactionTestCase):
+    @classmethod
+    def setUpClass(cls):
+        # 테스트 DB 설정이 적용된 뒤의 연결을 확인합니다. SQLite는 동시 쓰기에서 "database table is locked"로 실패합니다.
+        if connection.vendor != "postgresql":
+            raise SkipTest("Concurrent writes need PostgreSQL.")
+        super().setUpClass()
+
+    def test_concurrent_writes_do_not_lose_updates(self):
+        """여러 스레드가 같은 계좌에 동시에 입출금해도 잔액과 거래 후 잔액이 정확한지 테스트"""
+        user = CustomUser.objects.create_user(
+            email="ledger@example.com", password="password123", name="Ledger", nickname="ledger"
+        )
+        account = Account.objects.create(
+            user=user, account_number="110-220-330446", bank_code="088", account_type="checking"
+        )
+        threads, operations = 8, 30
+
+        _elapsed, errors = run_concurrent_writes(account, threads, operations)
+
+        self.assertEqual(errors, [])
+        account.refresh_from_db()
+        expected = Decimal(sum(amount_for(i) for i in range(operations)) * threads)
+        self.assertEqual(account.balance, expected)
+        self.assertEqual(TransactionHistory.objects.filter(account=account).count(), threads * operations)
+        self.assertTrue(balance_chain_is_consistent(account))
+        rollup_total = sum(
+            rollup.total_amount * (-1 if rollup.transaction_type == "WITHDRAW" else 1)
+            for rollup in DailyTransactionRollup.objects.filter(user=user)
+        )
+        self.assertEqual(rollup_total, expected)
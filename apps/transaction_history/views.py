@@ -1,9 +1,33 @@
+from django.conf import settings
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from django_filters import rest_framework as filters
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiExample, OpenApiParameter, extend_schema
 from rest_framework import status  # Import status for examples
 from rest_framework import permissions, serializers, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
+from rest_framework.parsers import JSONParser, MultiPartParser
+from rest_framework.request import Request
+from rest_framework.response import Response
 
+from core.views import async_read_view, json_response
+
+from . import ledger, rollups
+from .exports import EXPORT_CONTENT_TYPES, EXPORT_FIELDS, EXPORT_FORMATS, stream_export
+from .filters import TransactionFilter
+from .imports import (
+    IMPORT_FORMATS,
+    TransactionImportError,
+    import_transactions,
+    parse_rows,
+    summarize,
+)
 from .models import TransactionHistory
+from .pagination import TransactionCursorPagination
+from .search import SearchFilter
 from .serializers import TransactionHistorySerializer
 
 
@@ -16,10 +40,17 @@ class TransactionHistoryFilter(filters.FilterSet):
     amount = filters.NumberFilter(field_name="amount", lookup_expr="exact")
     amount__gt = filters.NumberFilter(field_name="amount", lookup_expr="gt")
     amount__lt = filters.NumberFilter(field_name="amount", lookup_expr="lt")
+    search = SearchFilter(field_name="transaction_detail")
 
     class Meta:
         model = TransactionHistory
-        fields = ["transaction_type", "amount", "amount__gt", "amount__lt"]
+        fields = ["transaction_type", "amount", "amount__gt", "amount__lt", "search"]
+
+
+class TransactionExportFilter(TransactionHistoryFilter, TransactionFilter):
+    """
+    Filter for exports: the API filters plus the detail/date filters of the transaction list page.
+    """
 
 
 @extend_schema(
@@ -53,6 +84,20 @@ class TransactionHistoryFilter(filters.FilterSet):
             description="Filter transactions by amount less than.",
             required=False,
         ),
+        OpenApiParameter(
+            name="search",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            description="Search transaction details for a substring (case-insensitive).",
+            required=False,
+        ),
+        OpenApiParameter(
+            name="fields",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            description="Comma-separated list of fields to include in the response (e.g., id,amount,created_at).",
+            required=False,
+        ),
     ],
     responses={
         status.HTTP_200_OK: TransactionHistorySerializer,
@@ -98,34 +143,70 @@ class TransactionHistoryViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [filters.DjangoFilterBackend]
     filterset_class = TransactionHistoryFilter
+    pagination_class = TransactionCursorPagination
+
+    def get_requested_fields(self):
+        """
+        Return the field names requested with the `fields` query parameter on GET requests, or None.
+        """
+        if self.request is None or self.request.method != "GET":
+            return None
+        raw_fields = self.request.query_params.get("fields")
+        if not raw_fields:
+            return None
+        fields = list(dict.fromkeys(name.strip() for name in raw_fields.split(",") if name.strip()))
+        unknown = set(fields) - set(self.serializer_class().fields)
+        if unknown:
+            raise serializers.ValidationError({"fields": f"Unknown fields: {', '.join(sorted(unknown))}."})
+        return fields
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_requested_fields()
+        if fields:
+            kwargs.setdefault("fields", fields)
+        return super().get_serializer(*args, **kwargs)
 
     def get_queryset(self):
         """
         This view should return a list of all the transaction histories
         for the accounts owned by the currently authenticated user.
         """
-        return TransactionHistory.objects.filter(account__user=self.request.user)
+        queryset = TransactionHistory.objects.filter(account__user=self.request.user)
+        fields = self.get_requested_fields()
+        if fields:
+            # Load only the requested columns; created_at is always loaded because the cursor is built from it.
+            queryset = queryset.only(*fields, "created_at")
+        return queryset
 
     def perform_create(self, serializer):
         """
-        Create a new transaction history and update the account balance.
+        Create a new transaction history and apply it to the account balance.
+        """
+        instance = TransactionHistory(**serializer.validated_data)
+        try:
+            ledger.record_transaction(instance)
+        except ledger.InsufficientFundsError:
+            raise serializers.ValidationError("Insufficient funds.")
+        serializer.instance = instance
+
+    def perform_update(self, serializer):
+        """
+        Update a transaction history and move its amount between daily rollups.
+        Like deletion, this does not touch the account balance or balance_after.
+        """
+        before = rollups.rollup_entry(serializer.instance)
+        with transaction.atomic():
+            instance = serializer.save()
+            rollups.record_updated(before, instance)
+
+    def perform_destroy(self, instance):
+        """
+        Delete a transaction history and subtract it from the daily rollups.
+        The account balance is left unchanged, as it always has been for this endpoint.
         """
-        # Note: This is a simplified example. In a real-world scenario,
-        # you would want to handle this within a database transaction
-        # to ensure data integrity.
-        account = serializer.validated_data["account"]
-        amount = serializer.validated_data["amount"]
-        transaction_type = serializer.validated_data["transaction_type"]
-
-        if transaction_type == "DEPOSIT":
-            account.balance += amount
-        elif transaction_type == "WITHDRAW":
-            if account.balance < amount:
-                raise serializers.ValidationError("Insufficient funds.")
-            account.balance -= amount
-
-        account.save()
-        serializer.save(balance_after=account.balance)
+        with transaction.atomic():
+            rollups.record_deleted(instance)
+            instance.delete()
 
     @extend_schema(
         summary="Create a new transaction",
@@ -234,3 +315,131 @@ class TransactionHistoryViewSet(viewsets.ModelViewSet):
     )
     def destroy(self, request, *args, **kwargs):
         return super().destroy(request, *args, **kwargs)
+
+    @extend_schema(
+        summary="Export transactions",
+        description="Streams the authenticated user's transactions, oldest first, as CSV or NDJSON. "
+        "Accepts the list filters plus transaction_detail, start_date and end_date.",
+        parameters=[
+            OpenApiParameter(
+                name="export_format",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description="Output format.",
+                enum=EXPORT_FORMATS,
+                default="csv",
+                required=False,
+            ),
+            OpenApiParameter(
+                name="gzip",
+                type=bool,
+                location=OpenApiParameter.QUERY,
+                description="Compress the export with gzip.",
+                required=False,
+            ),
+        ],
+        filters=False,
+        responses={
+            (status.HTTP_200_OK, "text/csv"): OpenApiTypes.BINARY,
+            (status.HTTP_200_OK, "application/x-ndjson"): OpenApiTypes.BINARY,
+            status.HTTP_400_BAD_REQUEST: {"description": "Invalid export format or filter values."},
+        },
+    )
+    @action(detail=False, methods=["get"], url_path="export", pagination_class=None)
+    def export(self, request):
+        export_format = request.query_params.get("export_format", "csv")
+        if export_format not in EXPORT_FORMATS:
+            raise serializers.ValidationError({"export_format": f"Choose one of {', '.join(EXPORT_FORMATS)}."})
+        compress = request.query_params.get("gzip", "").lower() in ("1", "true")
+
+        filterset = TransactionExportFilter(request.query_params, queryset=self.get_queryset(), request=request)
+        if not filterset.is_valid():
+            raise serializers.ValidationError(filterset.errors)
+        fields = self.get_requested_fields() or list(EXPORT_FIELDS)
+        # Read rows with a server-side cursor so memory stays flat regardless of the export size.
+        rows = (
+            filterset.qs.order_by("created_at", "id")
+            .values_list(*fields)
+            .iterator(chunk_size=settings.TRANSACTION_EXPORT_CHUNK_SIZE)
+        )
+
+        filename = f"transactions-{timezone.localdate():%Y%m%d}.{export_format}"
+        if compress:
+            filename += ".gz"
+        response = StreamingHttpResponse(
+            stream_export(rows, fields, export_format, compress=compress),
+            content_type="application/gzip" if compress else EXPORT_CONTENT_TYPES[export_format],
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    @extend_schema(
+        summary="Import transactions in bulk",
+        description="Imports a batch of transactions (e.g. a bank statement) into the authenticated user's accounts. "
+        "Send a JSON array of transactions, or a multipart upload with a CSV or JSON `file`. Rows are validated "
+        "with the transaction serializer and applied in order; if any row fails, nothing is imported and the "
+        "per-row errors are returned.",
+        request={
+            "application/json": TransactionHistorySerializer(many=True),
+            "multipart/form-data": {
+                "type": "object",
+                "properties": {"file": {"type": "string", "format": "binary"}},
+            },
+        },
+        filters=False,
+        responses={
+            status.HTTP_201_CREATED: {"description": "Number of created transactions and final account balances."},
+            status.HTTP_400_BAD_REQUEST: {"description": "Malformed batch, or per-row validation errors."},
+        },
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[JSONParser, MultiPartParser],
+        pagination_class=None,
+    )
+    def bulk_import(self, request):
+        upload = request.FILES.get("file")
+        try:
+            if upload is not None:
+                import_format = upload.name.rsplit(".", 1)[-1].lower()
+                if import_format not in IMPORT_FORMATS:
+                    raise ValueError(f"Upload a file ending in one of: {', '.join(IMPORT_FORMATS)}.")
+                rows = parse_rows(upload.read().decode("utf-8"), import_format)
+            else:
+                rows = parse_rows(request.data, "json")
+        except (ValueError, UnicodeDecodeError) as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            created = import_transactions(request.user, rows)
+        except TransactionImportError as e:
+            return Response({"errors": e.errors}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(summarize(created), status=status.HTTP_201_CREATED)
+
+
+@async_read_view(TransactionHistoryViewSet.as_view({"get": "list", "post": "create"}))
+async def transaction_list_async_view(request, user):
+    """
+    Async version of the transaction list (served by config.asgi_urls under the ASGI server).
+    Accepts the same filters, `fields` and cursor as the viewset; POST is handled by the viewset.
+    """
+    drf_request = Request(request)
+    drf_request.user = user
+    view = TransactionHistoryViewSet(request=drf_request, format_kwarg=None, action="list", args=(), kwargs={})
+    try:
+        queryset = view.get_queryset()
+    except serializers.ValidationError as e:
+        return json_response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+
+    filterset = TransactionHistoryFilter(drf_request.query_params, queryset=queryset, request=drf_request)
+    if not filterset.is_valid():
+        return json_response(filterset.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    paginator = TransactionCursorPagination()
+    try:
+        page = await paginator.apaginate_queryset(filterset.qs, drf_request, view=view)
+    except NotFound as e:
+        return json_response({"detail": e.detail}, status=status.HTTP_404_NOT_FOUND)
+    return json_response(paginator.get_paginated_response(view.get_serializer(page, many=True).data).data)
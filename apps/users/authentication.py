@@ -1,4 +1,10 @@
+from asgiref.sync import sync_to_async
+from django.utils.translation import gettext_lazy as _
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+from .cache import authenticated_user_cache
 
 
 class JWTCookieAuthentication(JWTAuthentication):
@@ -11,3 +17,37 @@ class JWTCookieAuthentication(JWTAuthentication):
 
         validated_token = self.get_validated_token(raw_token)
         return self.get_user(validated_token), validated_token
+
+    def get_user(self, validated_token):
+        # 요청마다 사용자를 DB에서 조회하지 않도록 토큰의 사용자 ID와 토큰 ID(jti)로 캐시된 사용자를 먼저 찾습니다.
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        token_id = validated_token.get(api_settings.JTI_CLAIM) if api_settings.JTI_CLAIM else None
+        if not authenticated_user_cache.enabled or user_id is None or token_id is None:
+            return super().get_user(validated_token)
+
+        user, version = authenticated_user_cache.get(user_id, token_id)
+        if user is None:
+            user = super().get_user(validated_token)
+            authenticated_user_cache.set(user, token_id, version)
+            return user
+
+        # 같은 토큰으로 DB에서 조회했을 때 simplejwt의 검사(비밀번호 변경 포함)를 통과했고, 그 뒤 사용자가 바뀌면
+        # 버전이 바뀌어 캐시를 쓰지 않으므로 여기서는 is_active만 다시 확인합니다.
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
+
+
+async def aauthenticate(request):
+    """
+    DRF를 거치지 않는 비동기 뷰에서 DRF 기본 인증과 같은 순서(세션, JWT 쿠키/헤더)로 사용자를 찾습니다.
+    인증되지 않았거나 토큰이 유효하지 않으면 None을 반환합니다.
+    """
+    user = await request.auser()
+    if user.is_authenticated:
+        return user
+    try:
+        result = await sync_to_async(JWTCookieAuthentication().authenticate)(request)
+    except AuthenticationFailed:
+        return None
+    return result[0] if result else None
@@ -0,0 +1,122 @@
+import threading
+import uuid
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+
+class AuthenticatedUserCache:
+    """
+    JWT 인증에서 토큰의 사용자 ID 클레임으로 찾은 사용자 정보를 짧은 TTL 동안 저장하는 캐시입니다.
+
+    API 요청마다 하던 사용자 기본 키 조회를 캐시 조회로 바꿉니다. 공유 캐시(운영에서는 Redis)에 비밀번호 해시가
+    남지 않도록 모델 객체 대신 CACHED_FIELDS 값만 저장하며, 꺼낼 때는 나머지 필드를 지연 로딩하는 객체로 만듭니다.
+
+    키에는 사용자 ID와 토큰 ID(jti)가 들어가므로 토큰마다 따로 저장됩니다. 사용자별 버전 값을 함께 저장하고,
+    사용자가 저장/삭제되거나 그룹/권한이 바뀌면 `apps.users.signals`가 버전을 바꿔 그 사용자의 모든 항목을 무효화합니다.
+    버전은 항목과 같은 get_many로 읽으므로 조회는 한 번의 캐시 왕복입니다.
+    시그널을 보내지 않는 QuerySet.update() 같은 변경은 TTL이 지나면 반영됩니다.
+    적중/실패 횟수는 프로세스별로 세고, 일정 횟수마다 공유 캐시에 더하여 모든 워커의 적중률을 볼 수 있게 합니다.
+    """
+
+    KEY = "auth:user:{user_id}:{token_id}"
+    VERSION_KEY = "auth:user-version:{user_id}"
+    # 인증과 사용자 serializer에 필요한 필드만 저장합니다. (password, email_verification_token 제외)
+    CACHED_FIELDS = ("id", "email", "name", "nickname", "phone_number", "is_staff", "is_superuser", "is_active")
+    STATS_KEYS = {"hits": "auth:user-cache:hits", "misses": "auth:user-cache:misses"}
+
+    def __init__(self, options: Dict[str, Any]):
+        self.enabled = options.get("ENABLED", True)
+        self.alias = options.get("ALIAS", "default")
+        self.ttl = options.get("TTL", 60)
+        self.stats_flush_interval = options.get("STATS_FLUSH_INTERVAL", 100)
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def get(self, user_id, token_id) -> Tuple[Optional[Any], str]:
+        """
+        (캐시된 사용자 또는 None, 사용자의 현재 버전)을 반환합니다.
+        캐시에 없으면 DB에서 사용자를 읽은 뒤 이 버전으로 set()을 호출합니다. 버전을 DB 조회 전에 읽어 두어야
+        그 사이 커밋된 변경이 이전 값을 새 버전으로 저장하는 일이 없습니다.
+        """
+        key = self.KEY.format(user_id=user_id, token_id=token_id)
+        version_key = self.VERSION_KEY.format(user_id=user_id)
+        values = self.cache.get_many([key, version_key])
+        version = values.get(version_key)
+        if version is None:
+            self.cache.add(version_key, uuid.uuid4().hex, timeout=None)
+            version = self.cache.get(version_key)
+        entry = values.get(key)
+        user = self._build_user(entry["fields"]) if entry is not None and entry["version"] == version else None
+        self._record("hits" if user is not None else "misses")
+        return user, version
+
+    def set(self, user, token_id, version: str) -> None:
+        fields = {name: getattr(user, name) for name in self.CACHED_FIELDS}
+        self.cache.set(
+            self.KEY.format(user_id=user.pk, token_id=token_id), {"version": version, "fields": fields}, self.ttl
+        )
+
+    @staticmethod
+    def _build_user(fields: Dict[str, Any]):
+        # DB에서 일부 필드만 읽은 것과 같은 객체를 만듭니다. 저장하지 않은 필드(password 등)는 접근할 때 DB에서 읽고,
+        # save()는 읽은 필드만 UPDATE합니다.
+        model = get_user_model()
+        names = [field.attname for field in model._meta.concrete_fields if field.attname in fields]
+        return model.from_db(DEFAULT_DB_ALIAS, names, [fields[name] for name in names])
+
+    def invalidate(self, user_id) -> None:
+        """
+        현재 DB 트랜잭션이 커밋된 뒤 사용자의 버전을 바꿔 모든 토큰의 캐시 항목을 무효화합니다.
+        (커밋 전에 바꾸면 다른 요청이 이전 값을 새 버전으로 다시 캐시할 수 있습니다.)
+        """
+        version_key = self.VERSION_KEY.format(user_id=user_id)
+        transaction.on_commit(lambda: self.cache.set(version_key, uuid.uuid4().hex, timeout=None))
+
+    def _record(self, outcome: str) -> None:
+        with self._stats_lock:
+            self.stats[outcome] += 1
+            self._pending[outcome] += 1
+            if sum(self._pending.values()) < self.stats_flush_interval:
+                return
+            pending, self._pending = self._pending, {"hits": 0, "misses": 0}
+        self._flush(pending)
+
+    def _flush(self, pending: Dict[str, int]) -> None:
+        for outcome, count in pending.items():
+            if not count:
+                continue
+            key = self.STATS_KEYS[outcome]
+            # 키가 없으면 add로 만들고, 이미 있으면 원자적으로 더합니다.
+            if not self.cache.add(key, count, timeout=None):
+                try:
+                    self.cache.incr(key, count)
+                except ValueError:
+                    self.cache.set(key, count, timeout=None)
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self.stats = {"hits": 0, "misses": 0}
+            self._pending = {"hits": 0, "misses": 0}
+
+    def hit_rate(self) -> float:
+        total = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / total if total else 0.0
+
+    def shared_stats(self) -> Dict[str, Any]:
+        """모든 프로세스가 공유 캐시에 기록한 적중/실패 횟수와 적중률."""
+        values = self.cache.get_many(list(self.STATS_KEYS.values()))
+        stats = {outcome: values.get(key, 0) for outcome, key in self.STATS_KEYS.items()}
+        total = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / total if total else 0.0
+        return stats
+
+
+authenticated_user_cache = AuthenticatedUserCache(settings.AUTH_USER_CACHE)
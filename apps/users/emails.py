@@ -0,0 +1,100 @@
+"""
+회원가입 인증 메일 발송.
+
+요청 처리 중에 SMTP 서버와 통신하지 않도록 메일은 Celery 작업(`apps.users.tasks.send_verification_emails`)이 보냅니다.
+워커 프로세스(스레드)마다 SMTP 연결을 열어 두고 재사용하므로 메일마다 연결/로그인/종료를 반복하지 않으며,
+여러 사용자의 메일은 EMAIL_BATCH_SIZE개씩 같은 연결로 보냅니다.
+"""
+
+import logging
+import threading
+import time
+from typing import Iterable, List
+
+from django.conf import settings
+from django.contrib.auth.tokens import default_token_generator
+from django.core.mail import EmailMessage, get_connection
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+
+logger = logging.getLogger(__name__)
+
+
+def build_verification_email(user) -> EmailMessage:
+    uid = urlsafe_base64_encode(force_bytes(user.pk))
+    token = default_token_generator.make_token(user)
+    verification_link = f"http://localhost:8000/activate/{uid}/{token}"
+    return EmailMessage(
+        subject="이메일 인증",
+        body=f"링크를 클릭하여 이메일을 인증하세요: {verification_link}",
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[user.email],
+    )
+
+
+class PooledEmailConnection:
+    """스레드마다 하나의 메일 백엔드 연결을 열어 두고 EMAIL_CONNECTION_MAX_AGE초 동안 재사용합니다."""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def get(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and time.monotonic() - self._local.opened_at > settings.EMAIL_CONNECTION_MAX_AGE:
+            self.close()
+            connection = None
+        if connection is None:
+            connection = get_connection(fail_silently=False)
+            connection.open()
+            self._local.connection = connection
+            self._local.opened_at = time.monotonic()
+        return connection
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+
+pooled_connection = PooledEmailConnection()
+
+
+def send_batch(messages: Iterable[EmailMessage]) -> List[int]:
+    """
+    메일들을 열어 둔 연결로 EMAIL_BATCH_SIZE개씩 보내고, 보내지 못한 메일의 순번 목록을 반환합니다.
+    연결이 끊어지면 연결을 닫고 다음 묶음은 새 연결로 보냅니다.
+    """
+    messages = list(messages)
+    failed: List[int] = []
+    batch_size = settings.EMAIL_BATCH_SIZE
+    for start in range(0, len(messages), batch_size):
+        batch = messages[start : start + batch_size]
+        try:
+            connection = pooled_connection.get()
+            sent = connection.send_messages(batch)
+        except Exception as e:
+            # send_messages는 실패한 메일에서 멈추므로 몇 통이 나갔는지 알 수 없습니다. 묶음을 한 통씩 다시 보냅니다.
+            # (이미 나간 인증 메일이 한 번 더 갈 수 있지만, 같은 링크이므로 빠뜨리는 것보다 낫습니다.)
+            logger.warning("Email batch failed, retrying one by one: %s", e)
+            pooled_connection.close()
+            failed.extend(_send_individually(batch, start))
+            continue
+        if sent != len(batch):
+            failed.extend(range(start + sent, start + len(batch)))
+    return failed
+
+
+def _send_individually(batch: List[EmailMessage], offset: int) -> List[int]:
+    failed = []
+    for index, message in enumerate(batch, start=offset):
+        try:
+            pooled_connection.get().send_messages([message])
+        except Exception as e:
+            logger.error("Email to %s failed: %s", ", ".join(message.to), e)
+            pooled_connection.close()
+            failed.append(index)
+    return failed
@@ -0,0 +1,28 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import authenticated_user_cache
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    # is_active, 비밀번호 등 사용자 필드가 바뀌거나 탈퇴하면 인증 캐시를 지웁니다.
+    authenticated_user_cache.invalidate(instance.pk)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+def invalidate_cached_user_permissions(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        authenticated_user_cache.invalidate(instance.pk)
+    else:
+        # group.user_set.add(...)처럼 반대쪽에서 바꾼 경우 pk_set이 사용자 ID입니다. (clear는 pk_set이 None)
+        user_ids = pk_set if pk_set is not None else []
+        for user_id in user_ids:
+            authenticated_user_cache.invalidate(user_id)
@@ -0,0 +1,51 @@
+import logging
+
+from celery import shared_task
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import OperationalError
+
+from .emails import build_verification_email, send_batch
+from .tokens import WARM_LOCK_KEY, _cache, persist_blacklisted, warm_blacklist_cache
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, max_retries=5)
+def send_verification_emails(self, user_ids: list[int]) -> int:
+    """
+    사용자들에게 인증 메일을 묶음으로 보냅니다. 보내지 못한 사용자만 대상으로
+    EMAIL_RETRY_BACKOFF초부터 두 배씩(최대 EMAIL_RETRY_BACKOFF_MAX초) 늘어나는 간격으로 재시도합니다.
+    """
+    users = list(get_user_model().objects.filter(pk__in=user_ids).order_by("pk"))
+    failed = send_batch(build_verification_email(user) for user in users)
+    failed_user_ids = [users[index].pk for index in failed]
+    if failed_user_ids:
+        if self.request.retries < self.max_retries:
+            countdown = min(settings.EMAIL_RETRY_BACKOFF * 2**self.request.retries, settings.EMAIL_RETRY_BACKOFF_MAX)
+            raise self.retry(args=(failed_user_ids,), countdown=countdown)
+        logger.error("Giving up on verification emails for users %s.", failed_user_ids)
+    return len(users) - len(failed_user_ids)
+
+
+@shared_task(ignore_result=True, autoretry_for=(OperationalError,), retry_backoff=True, max_retries=5)
+def persist_blacklisted_token(jti: str, exp: int, user_id=None) -> None:
+    """캐시에 먼저 기록한 폐기 토큰을 simplejwt의 OutstandingToken/BlacklistedToken 테이블에도 기록합니다."""
+    # 브로커에 토큰 문자열을 남기지 않도록 JTI, 만료 시각, 사용자 ID만 받습니다.
+    persist_blacklisted(jti, exp, user_id)
+
+
+@shared_task(ignore_result=True)
+def warm_token_blacklist_cache() -> None:
+    try:
+        count = warm_blacklist_cache()
+    finally:
+        _cache().delete(WARM_LOCK_KEY)
+    logger.info("Loaded %s blacklisted tokens into the cache.", count)
+
+
+@shared_task(ignore_result=True)
+def flush_expired_tokens() -> None:
+    """만료된 OutstandingToken(과 연결된 BlacklistedToken) 행을 지웁니다. 캐시 항목은 만료 시각에 자동으로 사라집니다."""
+    call_command("flushexpiredtokens")
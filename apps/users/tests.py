@@ -1 +1,170 @@
-# Create your tests here.
+from unittest import mock
+
+from django.core import mail
+from django.core.cache import cache
+from django.urls import reverse
+from kombu.exceptions import OperationalError
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from apps.users.cache import authenticated_user_cache
+from apps.users.models import CustomUser
+from apps.users.tasks import persist_blacklisted_token, send_verification_emails
+from apps.users.tokens import WARM_KEY
+from config.celery import app as celery_app
+
+
+class AuthenticatedUserCacheTestCase(APITestCase):
+    def setUp(self):
+        """테스트 케이스를 위한 초기 설정"""
+        cache.clear()
+        authenticated_user_cache.reset_stats()
+        self.user = CustomUser.objects.create_user(
+            email="cached@example.com", password="password123", name="Cached", nickname="cached"
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+        self.url = reverse("user-detail")
+
+    def test_user_is_cached_between_requests(self):
+        """두 번째 요청부터는 사용자 조회 쿼리 없이 캐시에서 인증하는지 테스트"""
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["email"], self.user.email)
+        self.assertEqual(authenticated_user_cache.stats, {"hits": 1, "misses": 1})
+        self.assertEqual(authenticated_user_cache.hit_rate(), 0.5)
+
+    def test_cache_stores_fields_only_and_keys_by_token(self):
+        """캐시에는 비밀번호 해시 없이 필요한 필드만 저장되고, 다른 토큰이나 사용자 변경 뒤에는 캐시를 쓰지 않는지 테스트"""
+        self.client.get(self.url)
+        token = AccessToken(self.client._credentials["HTTP_AUTHORIZATION"].split()[1])
+        entry = cache.get(f"auth:user:{self.user.pk}:{token['jti']}")
+        self.assertNotIn("password", entry["fields"])
+        self.assertEqual(entry["fields"]["email"], self.user.email)
+
+        # 새로 발급한 토큰은 이전 토큰의 항목을 쓰지 않습니다.
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+
+        # 캐시에서 만든 사용자로 수정해도 저장하지 않은 필드(비밀번호)는 그대로이고, 수정 뒤에는 다시 DB에서 읽습니다.
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(self.url, {"nickname": "renamed"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password("password123"))
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(self.url).data["nickname"], "renamed")
+
+    def test_cache_is_invalidated_when_user_is_deactivated(self):
+        """is_active가 바뀌면 캐시가 지워져 다음 요청이 거부되는지 테스트"""
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+        response = self.client.get(self.url)
+        self.assertIn(response.status_code, (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN))
+
+    def test_cache_is_invalidated_when_user_is_deleted(self):
+        """UserDetailView로 탈퇴하면 같은 토큰으로 더 이상 인증되지 않는지 테스트"""
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(self.url)
+        self.assertIn(response.status_code, (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN))
+
+
+class TokenBlacklistCacheTestCase(APITestCase):
+    def setUp(self):
+        """테스트 케이스를 위한 초기 설정"""
+        cache.clear()
+        celery_app.conf.task_always_eager = True
+        self.addCleanup(setattr, celery_app.conf, "task_always_eager", False)
+        self.user = CustomUser.objects.create_user(
+            email="logout@example.com", password="password123", name="Logout", nickname="logout"
+        )
+        self.refresh = str(RefreshToken.for_user(self.user))
+        self.client.cookies["refresh_token"] = self.refresh
+
+    def test_logout_blacklists_token_through_cache(self):
+        """캐시가 채워지면 블랙리스트 테이블 조회 없이 토큰을 검사하고, 로그아웃한 토큰은 거부되는지 테스트"""
+        # 캐시가 비어 있으면 DB를 조회하고 캐시를 채우는 작업을 예약합니다.
+        response = self.client.post(reverse("token_refresh"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(cache.get(WARM_KEY))
+
+        # 이후에는 사용자 조회 한 번만 실행됩니다.
+        with self.assertNumQueries(1):
+            response = self.client.post(reverse("token_refresh"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.post(reverse("api_logout"))
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(BlacklistedToken.objects.filter(token__token=self.refresh).exists())
+
+        self.client.cookies["refresh_token"] = self.refresh
+        with self.assertNumQueries(0):
+            response = self.client.post(reverse("token_refresh"))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_logout_queues_only_token_claims(self):
+        """브로커에는 토큰 대신 JTI/만료 시각/사용자 ID만 보내고, 브로커 장애 시에도 로그아웃하며 DB에 기록하는지 테스트"""
+        token = RefreshToken(self.refresh)
+        with mock.patch.object(persist_blacklisted_token, "delay") as delay:
+            self.client.post(reverse("api_logout"))
+        delay.assert_called_once_with(token["jti"], token["exp"], str(self.user.pk))
+
+        other = RefreshToken.for_user(self.user)
+        # 로그아웃 응답이 비워 둔 access_token 쿠키는 브라우저처럼 지웁니다.
+        self.client.cookies.pop("access_token", None)
+        self.client.cookies["refresh_token"] = str(other)
+        with mock.patch.object(persist_blacklisted_token, "delay", side_effect=OperationalError("broker down")):
+            response = self.client.post(reverse("api_logout"))
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(BlacklistedToken.objects.filter(token__jti=other["jti"]).exists())
+
+
+class VerificationEmailTestCase(APITestCase):
+    def setUp(self):
+        """테스트 케이스를 위한 초기 설정"""
+        celery_app.conf.task_always_eager = True
+        self.addCleanup(setattr, celery_app.conf, "task_always_eager", False)
+
+    def test_signup_sends_email_after_commit_in_background(self):
+        """회원가입 응답은 메일 발송을 기다리지 않고, 커밋 후 Celery 작업이 인증 메일을 보내는지 테스트"""
+        data = {
+            "email": "new@example.com",
+            "password": "password123",
+            "name": "New",
+            "nickname": "newbie",
+            "phone_number": "01012345679",
+        }
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(reverse("api_signup"), data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(mail.outbox, [])
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["new@example.com"])
+        self.assertIn("/activate/", mail.outbox[0].body)
+
+    def test_only_failed_recipients_are_retried(self):
+        """묶음 발송에서 실패한 사용자에게만 다시 보내는지 테스트"""
+        users = [
+            CustomUser.objects.create_user(email=f"batch{i}@example.com", password="pw", name="B", nickname=f"b{i}")
+            for i in range(3)
+        ]
+        with mock.patch("apps.users.tasks.send_batch", side_effect=[[1], []]) as send_batch:
+            sent = send_verification_emails.delay([user.pk for user in users]).get()
+        self.assertEqual(sent, 1)
+        self.assertEqual(send_batch.call_count, 2)
+        retried = [message.to for message in send_batch.call_args_list[1].args[0]]
+        self.assertEqual(retried, [["batch1@example.com"]])
@@ -0,0 +1,146 @@
+"""
+리프레시 토큰 블랙리스트의 빠른 경로.
+
+simplejwt의 token_blacklist 앱은 토큰을 검증할 때마다 BlacklistedToken 테이블을 조회하고,
+로그아웃할 때마다 OutstandingToken/BlacklistedToken 행을 요청 안에서 씁니다.
+여기서는 폐기된 JTI를 토큰 만료 시각까지만 Django 캐시(운영 환경에서는 Redis, 테스트에서는 프로세스 내부 캐시)에
+보관하여 조회/기록을 캐시에서 처리하고, DB 테이블 기록은 Celery 작업으로 넘깁니다.
+
+- 캐시가 DB의 블랙리스트를 모두 담고 있다는 표시(WARM_KEY)가 있을 때만 캐시에 없는 토큰을 유효하다고 봅니다.
+  표시가 없거나 캐시에 접근할 수 없으면 DB 테이블을 조회하고, 캐시를 채우는 작업을 한 번 예약합니다.
+  캐시가 메모리 부족으로 블랙리스트 항목을 지울 수 있으므로, 표시는 TOKEN_BLACKLIST_WARM_TIMEOUT(리프레시 토큰 수명 이하)마다
+  사라지고 캐시를 다시 채웁니다.
+- Celery 브로커에는 토큰 문자열 대신 JTI, 만료 시각, 사용자 ID만 보냅니다. 작업을 보낼 수 없으면 요청 안에서 DB에 기록합니다.
+- 캐시 항목은 토큰 만료 시각에 자동으로 사라지고, 만료된 DB 행은 Celery beat가 매일 지웁니다.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+logger = logging.getLogger(__name__)
+
+BLACKLIST_KEY = "auth:blacklist:{jti}"
+WARM_KEY = "auth:blacklist:warm"
+WARM_LOCK_KEY = "auth:blacklist:warm-lock"
+WARM_LOCK_TIMEOUT = 5 * 60
+
+
+def _cache():
+    return caches[settings.TOKEN_BLACKLIST_CACHE_ALIAS]
+
+
+def _warm_timeout() -> int:
+    # 표시가 리프레시 토큰보다 오래 남으면, 그 사이 지워진 항목의 토큰이 만료될 때까지 유효하다고 판단될 수 있습니다.
+    return min(settings.TOKEN_BLACKLIST_WARM_TIMEOUT, int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds()))
+
+
+def _seconds_until(exp: int) -> int:
+    return max(int(exp - datetime.now(tz=timezone.utc).timestamp()), 1)
+
+
+def remember_blacklisted(jti: str, exp: int) -> None:
+    """폐기된 JTI를 토큰 만료 시각까지 캐시에 기록합니다."""
+    _cache().set(BLACKLIST_KEY.format(jti=jti), True, timeout=_seconds_until(exp))
+
+
+def is_blacklisted_cached(jti: str) -> Optional[bool]:
+    """캐시로 판단할 수 있으면 폐기 여부를, 판단할 수 없으면(캐시가 비었거나 장애) None을 반환합니다."""
+    key = BLACKLIST_KEY.format(jti=jti)
+    try:
+        values = _cache().get_many([key, WARM_KEY])
+    except Exception as e:
+        logger.warning(f"Token blacklist cache unavailable, falling back to the database: {e}")
+        return None
+    if key in values:
+        return True
+    if WARM_KEY in values:
+        return False
+    return None
+
+
+def warm_blacklist_cache() -> int:
+    """아직 만료되지 않은 DB 블랙리스트를 캐시에 채우고, 캐시를 신뢰해도 된다는 표시를 남깁니다."""
+    cache = _cache()
+    count = 0
+    rows = BlacklistedToken.objects.filter(token__expires_at__gt=datetime.now(tz=timezone.utc)).values_list(
+        "token__jti", "token__expires_at"
+    )
+    for jti, expires_at in rows.iterator():
+        remember_blacklisted(jti, int(expires_at.timestamp()))
+        count += 1
+    cache.set(WARM_KEY, True, timeout=_warm_timeout())
+    return count
+
+
+def persist_blacklisted(jti: str, exp: int, user_id) -> None:
+    """
+    simplejwt RefreshToken.blacklist()와 같이 OutstandingToken/BlacklistedToken 행을 만듭니다.
+    토큰 문자열 없이 JTI, 만료 시각, 사용자 ID만으로 기록합니다. (발급 시 만든 OutstandingToken이 있으면 그 행을 씁니다.)
+    """
+    user = None
+    if user_id is not None:
+        user = get_user_model().objects.filter(**{api_settings.USER_ID_FIELD: user_id}).first()
+    token, _created = OutstandingToken.objects.get_or_create(
+        jti=jti, defaults={"user": user, "token": "", "expires_at": datetime_from_epoch(exp)}
+    )
+    BlacklistedToken.objects.get_or_create(token=token)
+
+
+def _schedule_warm_up() -> None:
+    from .tasks import warm_token_blacklist_cache
+
+    # 캐시가 비어 있는 동안 요청마다 작업을 예약하지 않도록 잠금 키로 한 번만 예약합니다.
+    try:
+        if _cache().add(WARM_LOCK_KEY, True, timeout=WARM_LOCK_TIMEOUT):
+            warm_token_blacklist_cache.delay()
+    except Exception as e:
+        logger.warning(f"Could not schedule token blacklist cache warm-up: {e}")
+
+
+class CachedBlacklistRefreshToken(RefreshToken):
+    """블랙리스트 조회/기록을 캐시에서 처리하는 RefreshToken."""
+
+    def check_blacklist(self) -> None:
+        jti = self.payload[api_settings.JTI_CLAIM]
+        blacklisted = is_blacklisted_cached(jti)
+        if blacklisted is None:
+            _schedule_warm_up()
+            blacklisted = BlacklistedToken.objects.filter(token__jti=jti).exists()
+        if blacklisted:
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self) -> None:
+        """토큰을 즉시 캐시에 폐기로 기록하고, DB 블랙리스트 테이블 기록은 Celery 작업으로 처리합니다."""
+        from .tasks import persist_blacklisted_token
+
+        jti, exp = self.payload[api_settings.JTI_CLAIM], self.payload["exp"]
+        user_id = self.payload.get(api_settings.USER_ID_CLAIM)
+        try:
+            remember_blacklisted(jti, exp)
+        except Exception as e:
+            # 캐시에 기록하지 못하면 기존처럼 요청 안에서 DB 테이블에 기록합니다.
+            logger.warning(f"Token blacklist cache unavailable, writing to the database: {e}")
+            super().blacklist()
+            return
+        try:
+            persist_blacklisted_token.delay(jti, exp, user_id)
+        except Exception as e:
+            # 브로커 장애로 작업을 보내지 못해도 로그아웃은 성공해야 하므로 요청 안에서 DB에 기록합니다.
+            logger.warning(f"Could not queue blacklisted token persistence, writing to the database: {e}")
+            persist_blacklisted(jti, exp, user_id)
+
+
+class CachedBlacklistTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = CachedBlacklistRefreshToken
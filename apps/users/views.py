@@ -1,21 +1,22 @@
-from django.conf import settings
+import logging
+
 from django.contrib import auth  # Corrected import
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
+from django.db import transaction
 from django.shortcuts import redirect
-from django.utils.encoding import force_bytes
-from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+from django.utils.http import urlsafe_base64_decode
 from rest_framework import status
 from rest_framework.generics import GenericAPIView, RetrieveUpdateDestroyAPIView
 from rest_framework.mixins import CreateModelMixin
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
-from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenRefreshView as SimpleJWTRefreshView  # Added
 
+from apps.users.cache import authenticated_user_cache
 from apps.users.serializers import (
     EmailVerificationSerializer,
     LoginSerializer,
@@ -23,6 +24,9 @@ from apps.users.serializers import (
     UserSerializer,
     UserSignupSerializer,
 )
+from apps.users.tasks import send_verification_emails
+from apps.users.tokens import CachedBlacklistRefreshToken, CachedBlacklistTokenRefreshSerializer
+from core.views import async_read_view, json_response
 
 User = get_user_model()
 
@@ -40,16 +44,14 @@ class RegisterView(CreateModelMixin, GenericAPIView):
         return Response({"detail": "회원가입 완료. 이메일을 확인하세요."}, status=status.HTTP_201_CREATED)
 
     def send_verification_email(self, user):
-        uid = urlsafe_base64_encode(force_bytes(user.pk))
-        token = default_token_generator.make_token(user)
-        verification_link = f"http://localhost:8000/activate/{uid}/{token}"
-        send_mail(
-            subject="이메일 인증",
-            message=f"링크를 클릭하여 이메일을 인증하세요: {verification_link}",
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-            fail_silently=False,
-        )
+        # SMTP 통신은 Celery 작업이 처리하므로 회원가입 응답은 메일 서버를 기다리지 않습니다.
+        def dispatch():
+            try:
+                send_verification_emails.delay([user.pk])
+            except Exception as e:
+                logging.getLogger(__name__).error(f"Verification email dispatch failed for user {user.pk}: {e}")
+
+        transaction.on_commit(dispatch)
 
 
 class EmailVerificationView(GenericAPIView):
@@ -119,8 +121,8 @@ class LogoutView(GenericAPIView):
     def post(self, request, *args, **kwargs):
         try:
             refresh_token = request.COOKIES.get("refresh_token")
-            token = RefreshToken(refresh_token)
-            token.blacklist()  # 블랙리스트에 추가
+            token = CachedBlacklistRefreshToken(refresh_token)
+            token.blacklist()  # 블랙리스트에 추가 (캐시에 즉시 기록, DB 테이블은 Celery 작업으로 기록)
         except Exception:
             return Response({"message": "유효하지 않은 토큰입니다."}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -137,7 +139,7 @@ class TokenRefreshView(SimpleJWTRefreshView):
         if not refresh_token:
             return Response({"detail": "Refresh token not found in cookies."}, status=status.HTTP_400_BAD_REQUEST)
 
-        serializer = TokenRefreshSerializer(data={"refresh": refresh_token})
+        serializer = CachedBlacklistTokenRefreshSerializer(data={"refresh": refresh_token})
 
         try:
             serializer.is_valid(raise_exception=True)
@@ -185,3 +187,25 @@ class UserDetailView(RetrieveUpdateDestroyAPIView):
 
     def patch(self, request, *args, **kwargs):
         return self.partial_update(request, *args, **kwargs)
+
+
+@async_read_view(UserDetailView.as_view())
+async def user_detail_async_view(request, user):
+    """UserDetailView GET의 비동기 버전. 수정/삭제 요청은 UserDetailView가 처리합니다."""
+    return json_response(UserSerializer(user).data)
+
+
+class AuthUserCacheStatsView(APIView):
+    """JWT 인증 사용자 캐시의 적중률 (이 프로세스 / 모든 워커 합계). 관리자만 조회할 수 있습니다."""
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(
+            {
+                "enabled": authenticated_user_cache.enabled,
+                "process": {**authenticated_user_cache.stats, "hit_rate": authenticated_user_cache.hit_rate()},
+                "shared": authenticated_user_cache.shared_stats(),
+            },
+            status=status.HTTP_200_OK,
+        )
@@ -9,8 +9,24 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
+from django.core.handlers.asgi import ASGIHandler
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
-application = get_asgi_application()
+
+class AsyncReadASGIHandler(ASGIHandler):
+    """ASGI 서버로 들어온 요청은 읽기 API 일부를 비동기 뷰로 처리하는 URLconf(config.asgi_urls)를 사용합니다."""
+
+    urlconf = "config.asgi_urls"
+
+    def create_request(self, scope, body_file):
+        request, error_response = super().create_request(scope, body_file)
+        if request is not None:
+            request.urlconf = self.urlconf
+        return request, error_response
+
+
+# get_asgi_application()과 같은 초기화
+django.setup(set_prefix=False)
+application = AsyncReadASGIHandler()
@@ -0,0 +1,25 @@
+"""
+URL configuration for the ASGI server (config.asgi).
+
+Same URLs as config.urls, except that the read-heavy API endpoints below are served by async views
+so that a slow query does not hold a worker thread. Other methods on these URLs are handled by the original DRF views.
+
+The Server-Sent Events stream is only routed here: under WSGI an endless streaming response never completes
+and would hold a worker thread for as long as the browser tab stays open.
+"""
+
+from django.urls import path
+
+from apps.analysis.views import report_list_async_view
+from apps.transaction_history.views import transaction_list_async_view
+from apps.users.views import user_detail_async_view
+from core.views import event_stream_view
+
+from .urls import urlpatterns as wsgi_urlpatterns
+
+urlpatterns = [
+    path("api/v1/analysis/reports/", report_list_async_view, name="report_list_api"),
+    path("api/v1/transactions/", transaction_list_async_view, name="transaction-list"),
+    path("api/v1/users/me/", user_detail_async_view, name="user-detail"),
+    path("api/v1/events/", event_stream_view, name="event_stream"),
+] + wsgi_urlpatterns
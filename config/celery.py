@@ -1,6 +1,7 @@
 import os
 
 from celery import Celery
+from celery.signals import worker_init
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
@@ -20,3 +21,15 @@ app.autodiscover_tasks()
 @app.task(bind=True, ignore_result=True)
 def debug_task(self):
     print(f"Request: {self.request!r}")
+
+
+@worker_init.connect
+def preload_sentiment_model(**kwargs):
+    # inference 큐 전용 워커(SENTIMENT_MODEL_WARMUP=True)는 풀을 만들기 전에 모델을 로드하여
+    # prefork 자식 프로세스나 스레드 풀 워커들이 가중치를 공유하도록 합니다.
+    from django.conf import settings
+
+    if settings.SENTIMENT_MODEL_WARMUP:
+        from apps.analysis.registry import sentiment_model
+
+        sentiment_model.get_classifier()
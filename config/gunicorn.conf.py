@@ -0,0 +1,21 @@
+# config/gunicorn.conf.py
+# gunicorn 설정 파일 (scripts/run.sh에서 -c 옵션으로 사용)
+import gc
+
+# 워커를 fork하기 전에 마스터 프로세스에서 Django 애플리케이션을 먼저 로드합니다.
+# 마스터에서 로드한 모듈과 감정 분석 모델 가중치는 워커들이 copy-on-write로 공유합니다.
+preload_app = True
+
+
+def when_ready(server):
+    from django.conf import settings
+
+    if settings.SENTIMENT_MODEL_WARMUP:
+        from apps.analysis.registry import sentiment_model
+
+        # fork 전에 forward pass를 실행하면 torch 스레드 풀이 생성되어 fork 이후 문제가 될 수 있으므로 가중치만 로드합니다.
+        sentiment_model.get_classifier()
+        server.log.info("Sentiment model preloaded before fork: %s", sentiment_model.stats())
+
+    # 이후 생성되는 객체만 GC 대상으로 두어, 워커에서 GC가 공유 페이지를 건드려 복사되는 것을 줄입니다.
+    gc.freeze()
@@ -26,6 +26,11 @@ ALLOWED_HOSTS = os.environ.get("ALLOWED_HOSTS", "127.0.0.1,localhost").split(","
 
 
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+# 인증 메일은 Celery 작업이 워커별로 열어 둔 연결을 재사용하여 묶음으로 보냅니다.
+EMAIL_BATCH_SIZE = int(os.environ.get("EMAIL_BATCH_SIZE", "50"))
+EMAIL_CONNECTION_MAX_AGE = int(os.environ.get("EMAIL_CONNECTION_MAX_AGE", "60"))  # 초
+EMAIL_RETRY_BACKOFF = 30  # 첫 재시도 간격(초), 재시도마다 두 배
+EMAIL_RETRY_BACKOFF_MAX = 30 * 60
 
 ROOT_URLCONF = "config.urls"
 
@@ -149,6 +154,12 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # 여러 스레드/프로세스가 동시에 쓰더라도 잠금 오류 대신 순서대로 기다리도록 WAL 모드와 IMMEDIATE 트랜잭션을 사용합니다.
+        "OPTIONS": {
+            "init_command": "PRAGMA journal_mode=WAL;",
+            "transaction_mode": "IMMEDIATE",
+            "timeout": 20,
+        },
     }
 }
 
@@ -204,6 +215,14 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 AUTH_USER_MODEL = "users.CustomUser"
 
+# Cache
+# 기본값은 프로세스 내부 메모리 캐시이며, 운영 환경(prod.py)에서는 Redis를 사용합니다.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
 # DRF Spectacular settings
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
@@ -216,6 +235,52 @@ REST_FRAMEWORK = {
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=30),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
+    "TOKEN_REFRESH_SERIALIZER": "apps.users.tokens.CachedBlacklistTokenRefreshSerializer",
+}
+
+# JWT 인증 시 토큰의 사용자 ID로 조회한 사용자 객체 캐시 (사용자 저장/삭제, 권한 변경 시 무효화)
+AUTH_USER_CACHE = {
+    "ENABLED": os.environ.get("AUTH_USER_CACHE_ENABLED", "True") == "True",
+    "ALIAS": "default",
+    "TTL": int(os.environ.get("AUTH_USER_CACHE_TTL", "60")),  # 초
+    # 프로세스별 적중/실패 횟수를 이 횟수마다 공유 캐시에 더합니다.
+    "STATS_FLUSH_INTERVAL": 100,
+}
+# 알림을 여러 사용자에게 보낼 때 한 번의 bulk_create/카운터 UPDATE로 처리하는 사용자 수 (청크 태스크 단위)
+NOTIFICATION_FANOUT_CHUNK_SIZE = int(os.environ.get("NOTIFICATION_FANOUT_CHUNK_SIZE", "1000"))
+# 폐기된 리프레시 토큰 JTI를 만료 시각까지 보관하는 캐시 (DB 블랙리스트 테이블 앞단)
+TOKEN_BLACKLIST_CACHE_ALIAS = "default"
+# 캐시가 블랙리스트를 모두 담고 있다는 표시의 유지 시간(초). 지나면 DB에서 캐시를 다시 채워, 캐시에서 지워진 항목을 복구합니다.
+# (리프레시 토큰 수명보다 길게 설정해도 리프레시 토큰 수명까지만 유지합니다.)
+TOKEN_BLACKLIST_WARM_TIMEOUT = int(os.environ.get("TOKEN_BLACKLIST_WARM_TIMEOUT", str(60 * 60)))
+
+# Sentiment analysis inference settings
+SENTIMENT_MODEL_NAME = os.environ.get("SENTIMENT_MODEL_NAME", "kykim/bert-kor-base")
+# 모델 리비전이 바뀌면 감정 분석 결과 캐시 키도 바뀌어 이전 결과가 무효화됩니다.
+SENTIMENT_MODEL_REVISION = os.environ.get("SENTIMENT_MODEL_REVISION", "main")
+# CPU 추론 백엔드: "torch"(fp32), "torch-int8"(동적 int8 양자화), "onnx"(onnxruntime, export_sentiment_model로 생성)
+SENTIMENT_INFERENCE_BACKEND = os.environ.get("SENTIMENT_INFERENCE_BACKEND", "torch")
+SENTIMENT_ONNX_MODEL_DIR = os.environ.get("SENTIMENT_ONNX_MODEL_DIR", str(BASE_DIR / "models" / "sentiment-onnx"))
+# 워커 프로세스당 추론 스레드 수 (비워두면 라이브러리 기본값 사용)
+SENTIMENT_INFERENCE_NUM_THREADS = int(os.environ.get("SENTIMENT_INFERENCE_NUM_THREADS", "0")) or None
+# True이면 gunicorn 마스터 프로세스가 fork 전에 모델을 미리 로드하여 워커들이 가중치를 공유합니다.
+SENTIMENT_MODEL_WARMUP = os.environ.get("SENTIMENT_MODEL_WARMUP", "False") == "True"
+# 동시에 들어온 감정 분석 요청을 최대 BATCH_SIZE개 또는 MAX_WAIT_MS 동안 모아 한 번에 추론합니다.
+SENTIMENT_INFERENCE_BATCH_SIZE = int(os.environ.get("SENTIMENT_INFERENCE_BATCH_SIZE", "32"))
+SENTIMENT_INFERENCE_MAX_WAIT_MS = float(os.environ.get("SENTIMENT_INFERENCE_MAX_WAIT_MS", "10"))
+SENTIMENT_INFERENCE_TIMEOUT = float(os.environ.get("SENTIMENT_INFERENCE_TIMEOUT", "30"))  # 초 단위
+# True이면 감정 분석 API가 모델을 직접 실행하지 않고 inference 큐에 작업을 등록한 뒤 202를 반환합니다.
+# (요청 본문에 "async": true를 보내면 요청 단위로도 선택할 수 있습니다.)
+SENTIMENT_ASYNC_INFERENCE = os.environ.get("SENTIMENT_ASYNC_INFERENCE", "False") == "True"
+# 일괄 감정 분석 시 한 번에 DB에 저장(bulk_create)하는 거래 수
+SENTIMENT_BULK_CHUNK_SIZE = int(os.environ.get("SENTIMENT_BULK_CHUNK_SIZE", "512"))
+# 동일한 메모 텍스트의 감정 분석 결과 캐시 (프로세스 내부 LRU -> Django 캐시)
+SENTIMENT_CACHE = {
+    "ENABLED": os.environ.get("SENTIMENT_CACHE_ENABLED", "True") == "True",
+    "LOCAL_MAX_SIZE": 10000,
+    "LOCAL_TTL": 10 * 60,  # 10분
+    "SHARED_ALIAS": "default",
+    "SHARED_TTL": 7 * 24 * 60 * 60,  # 7일
 }
 
 # Celery Settings
@@ -231,6 +296,44 @@ CELERY_TASK_TRACK_STARTED = True  # Task가 시작되었을 때 상태를 STARTE
 CELERY_TASK_TIME_LIMIT = 30 * 60  # 30분 이상 걸리는 Task는 강제 종료
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True  # Celery worker 시작 시 브로커 연결 재시도
 
+# 실시간 이벤트(SSE) 발행/구독 (core.events)
+# "memory"는 같은 프로세스 안에서만 전달하므로 Celery 워커가 따로 실행되는 환경에서는 "redis"를 사용합니다.
+EVENTS = {
+    "BACKEND": os.environ.get("EVENTS_BACKEND", "memory"),
+    "URL": f"redis://{REDIS_HOST}:{REDIS_PORT}/2",
+    "CHANNEL_PREFIX": "events:user:",
+    "QUEUE_SIZE": 100,  # 연결별로 보관하는 최대 이벤트 수 (넘으면 오래된 이벤트부터 버림)
+    "HEARTBEAT_SECONDS": 15,
+    "RETRY_MILLISECONDS": 3000,
+    # /api/v1/events/는 ASGI 서버(config.asgi_urls)에만 있습니다. 리버스 프록시가 이 경로를 ASGI 서버로 보낼 때만 켭니다.
+    # 꺼져 있으면 화면은 SSE 대신 작업 상태 API를 폴링합니다.
+    "STREAM_ENABLED": os.environ.get("EVENTS_STREAM_ENABLED", "False") == "True",
+}
+
+# 전체 사용자 리포트 생성 시 한 태스크가 처리하는 사용자 수와, 동시에 실행할 청크 태스크 수
+REPORT_SCHEDULE_CHUNK_SIZE = int(os.environ.get("REPORT_SCHEDULE_CHUNK_SIZE", "1000"))
+REPORT_SCHEDULE_CONCURRENCY = int(os.environ.get("REPORT_SCHEDULE_CONCURRENCY", "8"))
+# 사용자 리포트 생성 요청 잠금의 최대 유지 시간(초). 작업이 끝나면 바로 풀리며, 워커가 죽은 경우에만 이 시간이 지나 풀립니다.
+REPORT_REQUEST_LOCK_TIMEOUT = 10 * 60
+
+# 야간 거래 집계 재생성 시 한 번에 처리하는 사용자 수
+ROLLUP_REBUILD_BATCH_SIZE = int(os.environ.get("ROLLUP_REBUILD_BATCH_SIZE", "500"))
+
+# 거래 내역 내보내기 시 DB 커서에서 한 번에 가져오는 행 수
+TRANSACTION_EXPORT_CHUNK_SIZE = int(os.environ.get("TRANSACTION_EXPORT_CHUNK_SIZE", "2000"))
+
+# 거래 내역 일괄 가져오기 한 번에 허용하는 최대 행 수
+TRANSACTION_IMPORT_MAX_ROWS = int(os.environ.get("TRANSACTION_IMPORT_MAX_ROWS", "50000"))
+
+# 대시보드 화면 데이터(잔액, 최근 거래, 월별 차트)의 사용자별 캐시 시간(초). 0이면 캐시하지 않습니다.
+DASHBOARD_CACHE_TIMEOUT = int(os.environ.get("DASHBOARD_CACHE_TIMEOUT", "300"))
+
+# 감정 분석 태스크는 모델을 로드한 전용 워커(-Q inference)에서만 실행합니다.
+CELERY_TASK_ROUTES = {
+    "apps.analysis.tasks.analyze_sentiment": {"queue": "inference"},
+    "apps.analysis.tasks.analyze_transactions_sentiment": {"queue": "inference"},
+}
+
 CELERY_BEAT_SCHEDULE = {
     "generate-weekly-spending-report": {
         "task": "apps.analysis.tasks.schedule_all_user_reports",
@@ -244,4 +347,14 @@ CELERY_BEAT_SCHEDULE = {
         "args": ("monthly",),
         "options": {"expires": 300},
     },
+    "rebuild-transaction-rollups": {
+        "task": "apps.transaction_history.tasks.rebuild_all_transaction_rollups",
+        "schedule": crontab(hour=3, minute=30),  # 매일 03:30에 실행
+        "options": {"expires": 3600},
+    },
+    "flush-expired-tokens": {
+        "task": "apps.users.tasks.flush_expired_tokens",
+        "schedule": crontab(hour=4, minute=0),  # 매일 04:00에 실행
+        "options": {"expires": 3600},
+    },
 }
@@ -20,3 +20,14 @@ SECURE_HSTS_PRELOAD = True
 
 STATIC_ROOT = BASE_DIR / "staticfiles"  # noqa: F405
 STATICFILES_DIRS = []
+
+# 여러 gunicorn/Celery 워커가 공유하는 Redis 캐시 (Celery 브로커와 다른 DB 번호 사용)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": f"redis://{REDIS_HOST}:{REDIS_PORT}/1",  # noqa: F405
+    }
+}
+
+# Celery 워커가 발행한 이벤트를 ASGI 서버의 SSE 연결로 전달합니다. (scripts/run.sh가 uvicorn을 함께 실행)
+EVENTS = {**EVENTS, "BACKEND": "redis", "STREAM_ENABLED": True}  # noqa: F405
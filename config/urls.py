@@ -22,9 +22,18 @@ from django.contrib.auth.views import LogoutView as DjangoLogoutView
 from django.urls import include, path
 from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
 
-from apps.users.views import EmailVerificationView, LoginView, TokenRefreshView, UserDetailView
+from apps.users.views import (
+    AuthUserCacheStatsView,
+    EmailVerificationView,
+    LoginView,
+    LogoutView,
+    RegisterView,
+    TokenRefreshView,
+    UserDetailView,
+)
 
 urlpatterns = [
+    path("api/v1/users/signup/", RegisterView.as_view(), name="api_signup"),
     path("api/v1/users/login/", LoginView.as_view(), name="api_login"),
     path("", include("apps.frontend.urls")),
     path("admin/", admin.site.urls),
@@ -34,11 +43,14 @@ urlpatterns = [
     path("accounts/", include("allauth.urls")),
     path("activate/<uidb64>/<token>/", EmailVerificationView.as_view(), name="activate-user"),
     path("users/logout/", DjangoLogoutView.as_view(next_page="logged_out"), name="logout"),
+    path("api/v1/users/logout/", LogoutView.as_view(), name="api_logout"),
     path("api/v1/users/me/", UserDetailView.as_view(), name="user-detail"),
+    path("api/v1/users/auth-cache/stats/", AuthUserCacheStatsView.as_view(), name="auth-user-cache-stats"),
     path("users/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),  # Added
     path("api/v1/", include("apps.accounts.urls")),
     path("api/v1/", include("apps.transaction_history.urls")),
     path("api/v1/analysis/", include("apps.analysis.urls")),
+    path("api/v1/", include("apps.notifications.urls")),
 ]
 
 if settings.DEBUG:
@@ -0,0 +1,182 @@
+"""
+사용자별 실시간 이벤트(Server-Sent Events) 발행/구독.
+
+Celery 작업이나 웹 요청은 `publish()`로 사용자에게 이벤트를 보내고, ASGI로 실행되는 SSE 뷰는
+`subscribe()`로 받은 이벤트를 브라우저에 스트리밍합니다.
+
+- RedisEventBackend: 여러 프로세스(웹/Celery 워커) 사이에서 Redis Pub/Sub으로 이벤트를 전달합니다.
+  프로세스마다 Redis 구독 연결은 하나만 열고(패턴 구독), 받은 이벤트를 그 프로세스의 SSE 연결들에 나누어 주므로
+  연결이 수천 개여도 Redis 연결 수는 늘지 않습니다.
+- InMemoryEventBackend: 같은 프로세스 안에서만 전달합니다. (테스트, Redis 없는 개발 환경)
+
+EVENTS["BACKEND"]로 선택합니다.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+Event = Tuple[str, Dict[str, Any]]
+
+
+class _Subscription:
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_size: int):
+        self.loop = loop
+        self.queue: "asyncio.Queue[Event]" = asyncio.Queue(maxsize=max_size)
+
+    def offer(self, event: Event) -> None:
+        # 이벤트 루프 스레드에서 실행됩니다. 느린 클라이언트의 큐가 가득 차면 오래된 이벤트를 버립니다.
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+
+class InMemoryEventBackend:
+    """같은 프로세스의 구독자에게 이벤트를 전달합니다. 다른 백엔드는 전송 방식만 바꿉니다."""
+
+    def __init__(self, options: Dict[str, Any]):
+        self.queue_size = options.get("QUEUE_SIZE", 100)
+        self._subscriptions: Dict[int, set] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def publish_many(self, events: Iterable[Tuple[int, str, Dict[str, Any]]]) -> None:
+        for user_id, event_type, data in events:
+            self._dispatch(user_id, (event_type, data))
+
+    def _dispatch(self, user_id: int, event: Event) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(user_id, ()))
+        for subscription in subscriptions:
+            # 발행은 Celery/요청 스레드에서도 일어나므로 구독자의 이벤트 루프에 넘겨서 큐에 넣습니다.
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:
+                # 이벤트 루프가 이미 닫힌 구독은 무시합니다. (연결 종료 정리 중)
+                pass
+
+    async def ensure_listening(self) -> None:
+        return None
+
+    async def subscribe(self, user_id: int) -> AsyncIterator[Optional[Event]]:
+        """
+        사용자의 이벤트를 기다려 돌려줍니다. EVENTS["HEARTBEAT_SECONDS"] 동안 이벤트가 없으면 None을 돌려주어
+        호출하는 쪽이 연결 유지용 메시지를 보낼 수 있게 합니다.
+        """
+        await self.ensure_listening()
+        subscription = _Subscription(asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            self._subscriptions[user_id].add(subscription)
+        try:
+            while True:
+                try:
+                    yield await asyncio.wait_for(subscription.queue.get(), timeout=settings.EVENTS["HEARTBEAT_SECONDS"])
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            with self._lock:
+                self._subscriptions[user_id].discard(subscription)
+                if not self._subscriptions[user_id]:
+                    del self._subscriptions[user_id]
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+
+class RedisEventBackend(InMemoryEventBackend):
+    """Redis Pub/Sub으로 프로세스 사이에 이벤트를 전달합니다. 채널 이름은 `{CHANNEL_PREFIX}{user_id}`입니다."""
+
+    def __init__(self, options: Dict[str, Any]):
+        super().__init__(options)
+        self.url = options["URL"]
+        self.channel_prefix = options.get("CHANNEL_PREFIX", "events:user:")
+        self._client = None
+        self._listeners: Dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+
+    @property
+    def client(self):
+        if self._client is None:
+            import redis
+
+            self._client = redis.Redis.from_url(self.url)
+        return self._client
+
+    def publish_many(self, events: Iterable[Tuple[int, str, Dict[str, Any]]]) -> None:
+        pipeline = self.client.pipeline(transaction=False)
+        for user_id, event_type, data in events:
+            pipeline.publish(f"{self.channel_prefix}{user_id}", json.dumps([event_type, data], default=str))
+        pipeline.execute()
+
+    async def ensure_listening(self) -> None:
+        loop = asyncio.get_running_loop()
+        listener = self._listeners.get(loop)
+        if listener is None or listener.done():
+            self._listeners[loop] = loop.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        import redis.asyncio as aioredis
+
+        delay = 1
+        while True:
+            try:
+                async with aioredis.Redis.from_url(self.url) as client, client.pubsub() as pubsub:
+                    await pubsub.psubscribe(f"{self.channel_prefix}*")
+                    delay = 1
+                    async for message in pubsub.listen():
+                        if message["type"] != "pmessage":
+                            continue
+                        channel = message["channel"].decode()
+                        user_id = int(channel[len(self.channel_prefix) :])
+                        event_type, data = json.loads(message["data"])
+                        self._dispatch(user_id, (event_type, data))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Event subscription to Redis lost, reconnecting in %ss: %s", delay, e)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30)
+
+
+BACKENDS = {"memory": InMemoryEventBackend, "redis": RedisEventBackend}
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = BACKENDS[settings.EVENTS["BACKEND"]](settings.EVENTS)
+    return _backend
+
+
+def publish_many(events: Iterable[Tuple[int, str, Dict[str, Any]]]) -> None:
+    """
+    (user_id, 이벤트 종류, 데이터) 목록을 발행합니다. DB 트랜잭션 안에서 호출하면 커밋된 뒤에 발행합니다.
+    이벤트 전달은 알림을 보조하는 기능이므로 발행에 실패해도 예외를 올리지 않습니다.
+    """
+    events = list(events)
+    if not events:
+        return
+
+    def send():
+        try:
+            get_backend().publish_many(events)
+        except Exception as e:
+            logger.error("Event publish failed (%s events): %s", len(events), e)
+
+    transaction.on_commit(send)
+
+
+def publish(user_id: int, event_type: str, data: Dict[str, Any]) -> None:
+    publish_many([(user_id, event_type, data)])
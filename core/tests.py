@@ -0,0 +1,153 @@
+import asyncio
+import base64
+from decimal import Decimal
+from unittest import mock
+from urllib.parse import urlencode
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.http import StreamingHttpResponse
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.accounts.models import Account
+from apps.analysis.models import SpendingReport
+from apps.analysis.tasks import generate_spending_report
+from apps.transaction_history.models import TransactionHistory
+
+from . import events
+
+User = get_user_model()
+
+
+@override_settings(ROOT_URLCONF="config.asgi_urls")
+class EventStreamViewTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="events@example.com", password="password123")
+
+    async def _wait_for_subscribers(self, count):
+        for _ in range(100):
+            if events.get_backend().subscriber_count() == count:
+                return
+            await asyncio.sleep(0.01)
+        self.fail(f"expected {count} subscribers")
+
+    async def test_requires_authentication(self):
+        response = await self.async_client.get(reverse("event_stream"))
+        self.assertEqual(response.status_code, 401)
+
+    @override_settings(ROOT_URLCONF="config.urls")
+    def test_not_served_by_wsgi(self):
+        """WSGI에서는 끝나지 않는 스트림이 워커 스레드를 계속 차지하므로 라우트가 없고, 화면도 연결하지 않아야 합니다."""
+        self.client.force_login(self.user)
+        response = self.client.get("/api/v1/events/")
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIsInstance(response, StreamingHttpResponse)
+
+        response = self.client.get(reverse("spending_reports"))
+        self.assertContains(response, "const eventSource = false && window.EventSource")
+
+    async def test_streams_published_events_to_the_user(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse("event_stream"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+
+        stream = aiter(response.streaming_content)
+        self.assertTrue((await anext(stream)).startswith(b"retry:"))
+        next_chunk = asyncio.ensure_future(anext(stream))
+        await self._wait_for_subscribers(1)
+
+        # 다른 사용자의 이벤트는 전달되지 않습니다.
+        events.get_backend().publish_many([(self.user.pk + 1, "report.ready", {})])
+        events.get_backend().publish_many([(self.user.pk, "report.ready", {"report_type": "weekly"})])
+        chunk = await asyncio.wait_for(next_chunk, timeout=1)
+        self.assertEqual(chunk, b'event: report.ready\ndata: {"report_type": "weekly"}\n\n')
+
+        # 클라이언트 연결이 끊기면 ASGI 핸들러가 응답 작업을 취소하고, 구독이 정리됩니다.
+        next_chunk = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        next_chunk.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await next_chunk
+        self.assertEqual(events.get_backend().subscriber_count(), 0)
+
+
+class PublishTestCase(TestCase):
+    def test_report_task_publishes_after_commit(self):
+        user = User.objects.create_user(email="publish@example.com", password="password123")
+        with mock.patch.object(events.get_backend(), "publish_many") as publish_many:
+            with self.captureOnCommitCallbacks(execute=True):
+                generate_spending_report(user.pk, "weekly")
+                publish_many.assert_not_called()
+
+        [(user_id, event_type, _data)] = publish_many.call_args.args[0]
+        self.assertEqual((user_id, event_type), (user.pk, "report.ready"))
+
+
+class AsyncReadViewsTestCase(TestCase):
+    """config.asgi_urls의 비동기 뷰는 config.urls의 DRF 뷰와 같은 응답을 반환해야 합니다."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="async@example.com", password="password123", name="Async")
+        account = Account.objects.create(user=self.user, account_number="110-220-330449", bank_code="088")
+        for i in range(3):
+            TransactionHistory.objects.create(
+                account=account,
+                transaction_type="WITHDRAW",
+                amount=Decimal("1000.00") * (i + 1),
+                balance_after=Decimal("0.00"),
+                transaction_detail=f"점심 {i}",
+                transaction_method="CARD",
+            )
+        SpendingReport.objects.create(
+            user=self.user,
+            report_type="weekly",
+            generated_date=timezone.localdate(),
+            json_data={"categories": ["식비"]},
+        )
+        self.client.force_login(self.user)
+
+    async def _get_both(self, url):
+        sync_response = await sync_to_async(self.client.get)(url)
+        await self.async_client.aforce_login(self.user)
+        with override_settings(ROOT_URLCONF="config.asgi_urls"):
+            async_response = await self.async_client.get(url)
+        self.assertEqual(async_response.status_code, sync_response.status_code)
+        self.assertJSONEqual(async_response.content, sync_response.json())
+        return async_response.json()
+
+    async def test_matches_sync_views(self):
+        await self._get_both(reverse("report_list_api") + "?slim=true&page_size=1")
+        etag = (await sync_to_async(self.client.get)(reverse("report_list_api")))["ETag"]
+        with override_settings(ROOT_URLCONF="config.asgi_urls"):
+            response = await self.async_client.get(reverse("report_list_api"), headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+        await self._get_both(reverse("user-detail"))
+        await self._get_both(reverse("transaction-list") + "?fields=id,amount&search=점심")
+        await self._get_both(reverse("transaction-list") + "?amount__gt=abc")
+        await self._get_both(reverse("transaction-list") + "?cursor=garbage")
+        bad_position = base64.b64encode(urlencode({"p": "not-a-position"}).encode()).decode()
+        await self._get_both(reverse("transaction-list") + "?" + urlencode({"cursor": bad_position}))
+
+    async def test_transaction_cursor_pages(self):
+        first = await self._get_both(reverse("transaction-list") + "?page_size=2")
+        self.assertEqual(len(first["results"]), 2)
+        second = await self._get_both(first["next"])
+        self.assertEqual(len(second["results"]), 1)
+        previous = await self._get_both(second["previous"])
+        self.assertEqual(previous["results"], first["results"])
+
+    async def test_requires_authentication_and_delegates_writes(self):
+        with override_settings(ROOT_URLCONF="config.asgi_urls"):
+            response = await self.async_client.get(reverse("report_list_api"))
+            self.assertEqual(response.status_code, 403)
+
+            await self.async_client.aforce_login(self.user)
+            response = await self.async_client.patch(
+                reverse("user-detail"), {"nickname": "async"}, content_type="application/json"
+            )
+        self.assertEqual(response.status_code, 200)
+        await self.user.arefresh_from_db()
+        self.assertEqual(self.user.nickname, "async")
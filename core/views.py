@@ -1 +1,81 @@
-# Create your views here.
+import json
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET
+from rest_framework.exceptions import NotAuthenticated
+from rest_framework.renderers import JSONRenderer
+
+from apps.users.authentication import aauthenticate
+
+from . import events
+
+
+def json_response(data, status=200) -> HttpResponse:
+    """DRF 뷰와 같은 JSON 형식(JSONRenderer)으로 응답합니다."""
+    return HttpResponse(JSONRenderer().render(data), status=status, content_type="application/json")
+
+
+def async_read_view(sync_view):
+    """
+    GET 요청은 데코레이트한 비동기 함수로, 그 밖의 메서드는 기존 DRF 뷰(sync_view)로 처리하는 뷰를 만듭니다.
+
+    ASGI 서버(config.asgi_urls)에서 읽기 요청이 워커 스레드를 차지하지 않게 하려는 용도입니다.
+    비동기 함수는 (request, user, *args, **kwargs)로 호출되며, 인증 방식과 인증 실패 응답은 DRF 뷰와 같습니다.
+    """
+
+    def decorator(func):
+        sync_handler = sync_to_async(sync_view)
+
+        @wraps(func)
+        async def view(request, *args, **kwargs):
+            if request.method != "GET":
+                return await sync_handler(request, *args, **kwargs)
+            user = await aauthenticate(request)
+            if user is None:
+                # DRF와 같이 WWW-Authenticate 헤더가 없는 첫 번째 인증 방식(세션) 기준으로 403을 반환합니다.
+                return json_response({"detail": NotAuthenticated.default_detail}, status=403)
+            request.user = user
+            return await func(request, user, *args, **kwargs)
+
+        # 안전하지 않은 메서드는 DRF 뷰가 세션 인증일 때만 CSRF를 검사합니다.
+        return csrf_exempt(view)
+
+    return decorator
+
+
+def _format_event(event_type: str, data) -> str:
+    return f"event: {event_type}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+async def _event_stream(user_id: int):
+    # 연결이 끊겼을 때 브라우저(EventSource)가 다시 연결하기까지 기다릴 시간(밀리초)
+    yield f"retry: {settings.EVENTS['RETRY_MILLISECONDS']}\n\n"
+    async for event in events.get_backend().subscribe(user_id):
+        if event is None:
+            # 프록시/로드 밸런서가 유휴 연결을 끊지 않도록 주석 줄을 보냅니다.
+            yield ": keep-alive\n\n"
+        else:
+            yield _format_event(*event)
+
+
+@require_GET
+async def event_stream_view(request):
+    """
+    로그인한 사용자의 이벤트(리포트 생성 완료, 감정 분석 완료, 새 알림)를 Server-Sent Events로 보냅니다.
+
+    연결마다 스레드를 쓰지 않도록 ASGI 서버(uvicorn)의 URLconf(config.asgi_urls)에만 등록합니다.
+    WSGI 서버에서는 끝나지 않는 스트림을 응답으로 보내지 못하고 워커 스레드 하나를 계속 차지합니다.
+    """
+    user = await aauthenticate(request)
+    if user is None:
+        return JsonResponse({"detail": "Authentication credentials were not provided."}, status=401)
+
+    response = StreamingHttpResponse(_event_stream(user.pk), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # nginx가 응답을 버퍼링하지 않고 바로 전달하도록 합니다.
+    response["X-Accel-Buffering"] = "no"
+    return response
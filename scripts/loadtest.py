@@ -0,0 +1,132 @@
+"""
+HTTP GET 부하 테스트: 같은 API를 WSGI(gunicorn) 서버와 ASGI(uvicorn) 서버에 보내 초당 요청 수와 지연 시간 분포를 비교합니다.
+
+사용 예 (두 서버에 같은 CPU를 주고, 부하 생성기는 다른 코어에서 실행):
+
+    taskset -c 0,1 gunicorn config.wsgi:application --bind 127.0.0.1:8000 --workers 2 --threads 4
+    taskset -c 0,1 uvicorn config.asgi:application --port 8001 --workers 2
+    TOKEN=$(...로그인 API로 받은 access 토큰...)
+    taskset -c 2,3 python scripts/loadtest.py --token "$TOKEN" --concurrency 64 --duration 30 \\
+        http://127.0.0.1:8000/api/v1/analysis/reports/ http://127.0.0.1:8001/api/v1/analysis/reports/
+
+외부 패키지 없이 asyncio 소켓으로 HTTP/1.1 요청을 보내며, 서버가 연결을 닫으면(gunicorn sync 워커) 다시 연결합니다.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+
+class Stats:
+    def __init__(self):
+        self.latencies = []
+        self.statuses = Counter()
+        self.errors = Counter()
+
+    def summary(self, elapsed: float) -> dict:
+        latencies = sorted(self.latencies)
+
+        def percentile(p):
+            if not latencies:
+                return None
+            return round(latencies[min(int(len(latencies) * p / 100), len(latencies) - 1)] * 1000, 2)
+
+        return {
+            "requests": len(latencies),
+            "rps": round(len(latencies) / elapsed, 1),
+            "p50_ms": percentile(50),
+            "p90_ms": percentile(90),
+            "p99_ms": percentile(99),
+            "max_ms": round(latencies[-1] * 1000, 2) if latencies else None,
+            "statuses": dict(self.statuses),
+            "errors": dict(self.errors),
+        }
+
+
+async def _read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed")
+    status = int(status_line.split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if "content-length" in headers:
+        await reader.readexactly(int(headers["content-length"]))
+    elif headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    else:
+        await reader.read()
+        return status, True
+    return status, headers.get("connection", "").lower() == "close"
+
+
+async def _worker(url, headers: str, deadline: float, stats: Stats):
+    parts = urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    request = (f"GET {path} HTTP/1.1\r\nHost: {parts.netloc}\r\n{headers}\r\n").encode()
+    host, port = parts.hostname, parts.port or 80
+    reader = writer = None
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection(host, port)
+            writer.write(request)
+            status, close = await _read_response(reader)
+        except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+            stats.errors[type(e).__name__] += 1
+            if writer is not None:
+                writer.close()
+            reader = writer = None
+            await asyncio.sleep(0.01)
+            continue
+        stats.latencies.append(time.perf_counter() - started)
+        stats.statuses[status] += 1
+        if close:
+            writer.close()
+            reader = writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def run(url: str, concurrency: int, duration: float, headers: str) -> dict:
+    stats = Stats()
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(_worker(url, headers, deadline, stats) for _ in range(concurrency)))
+    return {"url": url, "concurrency": concurrency, **stats.summary(time.perf_counter() - started)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("urls", nargs="+", help="비교할 URL (서버마다 하나씩, 순서대로 실행)")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 연결 수")
+    parser.add_argument("--duration", type=float, default=20, help="URL마다 측정할 시간(초)")
+    parser.add_argument("--warmup", type=float, default=3, help="측정 전에 같은 부하를 보내는 시간(초)")
+    parser.add_argument("--token", help="JWT access 토큰 (access_token 쿠키로 보냄)")
+    args = parser.parse_args()
+
+    headers = "Accept: application/json\r\n"
+    if args.token:
+        headers += f"Cookie: access_token={args.token}\r\n"
+
+    for url in args.urls:
+        if args.warmup:
+            asyncio.run(run(url, args.concurrency, args.warmup, headers))
+        print(json.dumps(asyncio.run(run(url, args.concurrency, args.duration, headers)), ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,4 +3,7 @@ set -e
 
 python manage.py makemigrations core
 python manage.py migrate
-gunicorn --bind 0.0.0.0:8000 config.wsgi:application --workers 2
\ No newline at end of file
+# 실시간 이벤트(/api/v1/events/, SSE)와 비동기 읽기 API(config.asgi_urls)는 ASGI 서버에서 따로 처리합니다.
+# 리버스 프록시에서 이 경로들을 이 포트로 보내야 합니다.
+uvicorn config.asgi:application --host 0.0.0.0 --port "${ASGI_PORT:-8001}" --workers "${ASGI_WORKERS:-1}" &
+gunicorn -c config/gunicorn.conf.py --bind 0.0.0.0:8000 config.wsgi:application --workers 2 --threads "${GUNICORN_THREADS:-4}"
\ No newline at end of file
@@ -16,6 +16,11 @@ echo "Starting Celery Worker..."
 nohup .venv/bin/python -m celery -A config worker -l info > celery_worker.log 2>&1 &
 echo "Celery Worker started in background. Log: celery_worker.log"
 
+echo "Starting Celery Inference Worker..."
+# Model-holding worker for the 'inference' queue. The thread pool lets concurrent tasks share micro-batches.
+SENTIMENT_MODEL_WARMUP=True nohup .venv/bin/python -m celery -A config worker -Q inference -n inference@%h --pool threads --concurrency 16 -l info > celery_inference_worker.log 2>&1 &
+echo "Celery Inference Worker started in background. Log: celery_inference_worker.log"
+
 echo "Starting Celery Beat..."
 # Start Celery Beat in the background, logging to a file
 nohup .venv/bin/python -m celery -A config beat -l info --scheduler django_celery_beat.schedulers:DatabaseScheduler > celery_beat.log 2>&1 &